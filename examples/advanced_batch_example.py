@@ -11,9 +11,14 @@ This example demonstrates advanced batch processing features including:
 """
 
 import asyncio
+import contextlib
+import functools
+import gc
 import os
+import sys
 import time
-from typing import List, Dict, Any
+from datetime import datetime
+from typing import AsyncIterator, List, Dict, Any, Sequence, Tuple
 
 from github_ioc_scanner.batch_coordinator import BatchCoordinator
 from github_ioc_scanner.batch_models import BatchConfig, BatchStrategy
@@ -21,9 +26,72 @@ from github_ioc_scanner.async_github_client import AsyncGitHubClient
 from github_ioc_scanner.cache_manager import CacheManager
 from github_ioc_scanner.batch_metrics_collector import BatchMetricsCollector
 from github_ioc_scanner.batch_strategy_manager import BatchStrategyManager
-from github_ioc_scanner.resource_manager import ResourceManager
+from github_ioc_scanner.resource_manager import ResourceConfig, ResourceManager
 from github_ioc_scanner.models import Repository
 
+# Bound once so the match loop doesn't rebuild the template per line
+_format_match = "      - {0.package_name} {0.version} in {0.file_path}".format
+
+
+def _ratio(numerator: float, denominator: float) -> float:
+    """Return numerator / denominator, or 0.0 when the denominator is zero."""
+    return numerator / denominator if denominator else 0.0
+
+
+# Adaptive configuration shared by the demos; each demo derives its own via replace()
+BASE_ADVANCED_CONFIG = BatchConfig(
+    max_concurrent_requests=15,
+    max_concurrent_repos=4,
+    default_batch_size=12,
+    max_batch_size=60,
+    rate_limit_buffer=0.85,
+    retry_attempts=4,
+    max_memory_usage_mb=1000,
+    stream_large_files_threshold=2 * 1024 * 1024,  # 2MB
+    default_strategy=BatchStrategy.ADAPTIVE,
+    enable_cross_repo_batching=True,
+    enable_file_prioritization=True,
+    enable_performance_monitoring=True,
+    log_batch_metrics=True
+)
+
+
+# Lockfiles assumed present in every demo repository for cross-repo analysis
+SAMPLE_REPO_FILES = ('package.json', 'requirements.txt', 'go.mod', 'Cargo.toml')
+
+
+# Repositories the resilience demo expects to fail on
+INVALID_REPO_1 = Repository(
+    name="non-existent-repo",
+    full_name="invalid/non-existent-repo",
+    archived=False,
+    default_branch="main",
+    updated_at=datetime.now()
+)
+INVALID_REPO_2 = Repository(
+    name="private-repo",
+    full_name="private/inaccessible-repo",
+    archived=False,
+    default_branch="main",
+    updated_at=datetime.now()
+)
+
+
+@functools.lru_cache(maxsize=None)
+def base_repos() -> Tuple[Repository, ...]:
+    """Test repositories shared by all demos."""
+    now = datetime.now()
+    return tuple(
+        Repository(
+            name=f"repo{i}",
+            full_name=f"owner/repo{i}",
+            archived=False,
+            default_branch="main",
+            updated_at=now
+        )
+        for i in range(1, 6)
+    )
+
 
 class AdvancedBatchProcessor:
     """Advanced batch processor with optimization and monitoring."""
@@ -33,95 +101,147 @@ class AdvancedBatchProcessor:
         self.github_client = AsyncGitHubClient(token=github_token)
         self.cache_manager = CacheManager()
         self.metrics_collector = BatchMetricsCollector()
-        self.resource_manager = ResourceManager(max_memory_mb=1000)
-        
-    async def optimize_and_scan(self, repositories: List[Repository]) -> Dict[str, Any]:
-        """Perform optimized batch scanning with performance analysis."""
-        
-        # Start with adaptive configuration
-        config = BatchConfig(
-            max_concurrent_requests=15,
-            max_concurrent_repos=4,
-            default_batch_size=12,
-            max_batch_size=60,
-            rate_limit_buffer=0.85,
-            retry_attempts=4,
-            max_memory_usage_mb=1000,
-            stream_large_files_threshold=2 * 1024 * 1024,  # 2MB
-            default_strategy=BatchStrategy.ADAPTIVE,
-            enable_cross_repo_batching=True,
-            enable_file_prioritization=True,
-            enable_performance_monitoring=True,
-            log_batch_metrics=True
-        )
+        self.resource_manager = ResourceManager(ResourceConfig(memory_cleanup_threshold=0.8))
+        self._exit_stack = contextlib.AsyncExitStack()
+    
+    async def __aenter__(self) -> "AdvancedBatchProcessor":
+        """Open the GitHub client and cache shared by all demos."""
+        async with contextlib.AsyncExitStack() as stack:
+            await stack.enter_async_context(self.github_client)
+            stack.enter_context(self.cache_manager)
+            await stack.enter_async_context(self.resource_manager)
+            self._exit_stack = stack.pop_all()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Release the shared GitHub client and cache, even if a demo failed."""
+        await self._exit_stack.__aexit__(exc_type, exc_val, exc_tb)
+    
+    def _memory_usage_mb(self) -> float:
+        """Return the current process RSS in MB."""
+        return self.resource_manager.memory_monitor.get_memory_stats().process_mb
+    
+    @contextlib.asynccontextmanager
+    async def _coordinator(self, config: BatchConfig) -> AsyncIterator[BatchCoordinator]:
+        """Yield a coordinator on the shared client and clean it up on exit.
         
+        Uses cleanup() rather than the coordinator's own context manager, whose
+        stop() would close the GitHub client the other demos are still using.
+        """
         coordinator = BatchCoordinator(
             github_client=self.github_client,
             cache_manager=self.cache_manager,
-            config=config,
-            metrics_collector=self.metrics_collector
+            config=config
         )
-        
         try:
-            print("🚀 Starting advanced batch processing...")
-            print(f"📊 Processing {len(repositories)} repositories")
+            yield coordinator
+        finally:
+            await coordinator.cleanup()
+    
+    @staticmethod
+    def _emit(demo: str, lines: List[str]) -> None:
+        """Write lines tagged with their demo in a single stdout write.
+        
+        Tagging keeps concurrent demo output readable, and writing the whole
+        block at once avoids a write/flush per line.
+        """
+        out = []
+        for line in lines:
+            text = line.lstrip("\n")
+            out.append("\n" * (len(line) - len(text)) + f"[{demo}] {text}")
+        sys.stdout.write("\n".join(out) + "\n")
+    
+    @classmethod
+    def _print(cls, demo: str, message: str = "") -> None:
+        """Print a single line tagged with its demo."""
+        cls._emit(demo, [message])
+        
+    async def optimize_and_scan(self, repositories: Sequence[Repository]) -> Dict[str, Any]:
+        """Perform optimized batch scanning with performance analysis."""
+        
+        # Start with adaptive configuration
+        config = BASE_ADVANCED_CONFIG
+        
+        async with self._coordinator(config) as coordinator:
+            try:
+                self._print("optimize", "🚀 Starting advanced batch processing...")
+                self._print("optimize", f"📊 Processing {len(repositories)} repositories")
             
-            # Phase 1: Analyze repositories for optimization opportunities
-            print("\n📈 Phase 1: Repository Analysis")
-            strategy_manager = BatchStrategyManager()
-            cross_repo_opportunities = strategy_manager.identify_cross_repo_opportunities(repositories)
+                # Phase 1: Analyze repositories for optimization opportunities
+                self._print("optimize", "\n📈 Phase 1: Repository Analysis")
+                strategy_manager = BatchStrategyManager()
+                repo_files = {repo.full_name: list(SAMPLE_REPO_FILES) for repo in repositories}
+                # CPU-bound analysis runs in a worker thread so the other demos keep going
+                loop = asyncio.get_running_loop()
+                cross_repo_opportunities = await loop.run_in_executor(
+                    None, strategy_manager.identify_cross_repo_opportunities, repositories, repo_files
+                )
             
-            if cross_repo_opportunities:
-                print(f"✅ Found {len(cross_repo_opportunities)} cross-repository optimization opportunities")
-                for opportunity in cross_repo_opportunities:
-                    print(f"   - {len(opportunity.repositories)} repos, {len(opportunity.common_files)} common files")
-                    print(f"     Estimated savings: {opportunity.estimated_savings:.1f}%")
-            else:
-                print("ℹ️  No cross-repository optimization opportunities found")
+                if cross_repo_opportunities:
+                    out = [f"✅ Found {len(cross_repo_opportunities)} cross-repository optimization opportunities"]
+                    for opportunity in cross_repo_opportunities:
+                        out.append(f"   - {len(opportunity.repositories)} repos, {len(opportunity.common_files)} common files")
+                        out.append(f"     Estimated savings: {opportunity.estimated_savings:.1f}%")
+                    self._emit("optimize", out)
+                else:
+                    self._print("optimize", "ℹ️  No cross-repository optimization opportunities found")
             
-            # Phase 2: Execute optimized batch processing
-            print("\n⚡ Phase 2: Optimized Batch Processing")
-            start_time = time.time()
+                # Phase 2: Execute optimized batch processing
+                self._print("optimize", "\n⚡ Phase 2: Optimized Batch Processing")
+                start_time = time.time()
             
-            results = await coordinator.process_repositories_batch(
-                repositories=repositories,
-                strategy=BatchStrategy.ADAPTIVE
-            )
+                results = await coordinator.process_repositories_batch(
+                    repositories=repositories,
+                    strategy=BatchStrategy.ADAPTIVE
+                )
             
-            processing_time = time.time() - start_time
+                processing_time = time.time() - start_time
             
-            # Phase 3: Performance analysis and optimization recommendations
-            print("\n📊 Phase 3: Performance Analysis")
-            metrics = coordinator.get_batch_metrics()
-            summary = self.metrics_collector.get_performance_summary()
-            optimizations = self.metrics_collector.identify_optimization_opportunities()
+                # Phase 3: Performance analysis and optimization recommendations
+                self._print("optimize", "\n📊 Phase 3: Performance Analysis")
+                metrics = await coordinator.get_batch_metrics()
+                self.metrics_collector.record_batch_metrics(metrics)
+                summary = self.metrics_collector.get_performance_summary()
+                optimizations = self.metrics_collector.identify_optimization_opportunities()
             
-            # Display comprehensive results
-            self._display_results(results, metrics, summary, optimizations, processing_time)
+                # Display comprehensive results
+                self._display_results(results, metrics, summary, optimizations, processing_time)
             
-            return {
-                'results': results,
-                'metrics': metrics,
-                'summary': summary,
-                'optimizations': optimizations,
-                'processing_time': processing_time
-            }
+                return {
+                    'results': results,
+                    'metrics': metrics,
+                    'summary': summary,
+                    'optimizations': optimizations,
+                    'processing_time': processing_time
+                }
             
-        except Exception as e:
-            print(f"❌ Error during advanced batch processing: {e}")
-            raise
-        
-        finally:
-            await coordinator.cleanup()
+            except Exception as e:
+                self._print("optimize", f"❌ Error during advanced batch processing: {e}")
+                raise
+    
+    async def _sample_peak_memory(
+        self, stop: asyncio.Event, initial_mb: float, interval: float = 0.2
+    ) -> float:
+        """Poll memory usage until ``stop`` is set and return the highest sample."""
+        peak = initial_mb
+        while not stop.is_set():
+            peak = max(peak, self._memory_usage_mb())
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+        return max(peak, self._memory_usage_mb())
     
-    async def memory_efficient_large_scan(self, repositories: List[Repository]) -> Dict[str, Any]:
+    async def memory_efficient_large_scan(
+        self, repositories: Sequence[Repository], memory_sample_interval: float = 0.2
+    ) -> Dict[str, Any]:
         """Demonstrate memory-efficient processing for large-scale scans."""
         
-        print("\n🧠 Memory-Efficient Large Scale Scanning")
-        print("=" * 45)
+        self._print("memory", "\n🧠 Memory-Efficient Large Scale Scanning")
+        self._print("memory", "=" * 45)
         
         # Configure for memory efficiency
-        config = BatchConfig(
+        config = BASE_ADVANCED_CONFIG.replace(
             max_concurrent_requests=8,  # Reduced for memory efficiency
             max_concurrent_repos=2,
             default_batch_size=6,       # Smaller batches
@@ -129,42 +249,43 @@ class AdvancedBatchProcessor:
             rate_limit_buffer=0.7,      # Conservative rate limiting
             max_memory_usage_mb=500,    # Limited memory usage
             stream_large_files_threshold=512 * 1024,  # 512KB streaming threshold
-            default_strategy=BatchStrategy.CONSERVATIVE,
-            enable_performance_monitoring=True
+            default_strategy=BatchStrategy.CONSERVATIVE
         )
         
-        coordinator = BatchCoordinator(
-            github_client=self.github_client,
-            cache_manager=self.cache_manager,
-            config=config,
-            metrics_collector=self.metrics_collector
-        )
-        
-        try:
-            print(f"💾 Memory limit: {config.max_memory_usage_mb}MB")
-            print(f"📦 Batch size: {config.default_batch_size} (max: {config.max_batch_size})")
-            print(f"🔄 Concurrency: {config.max_concurrent_requests} requests, {config.max_concurrent_repos} repos")
+        async with self._coordinator(config) as coordinator:
+            self._print("memory", f"💾 Memory limit: {config.max_memory_usage_mb}MB")
+            self._print("memory", f"📦 Batch size: {config.default_batch_size} (max: {config.max_batch_size})")
+            self._print("memory", f"🔄 Concurrency: {config.max_concurrent_requests} requests, {config.max_concurrent_repos} repos")
             
             # Monitor memory usage during processing
-            initial_memory = self.resource_manager.get_memory_usage()
-            print(f"🏁 Initial memory usage: {initial_memory:.1f}MB")
+            initial_memory = self._memory_usage_mb()
+            self._print("memory", f"🏁 Initial memory usage: {initial_memory:.1f}MB")
+            
+            # Sample memory in the background so the peak reflects the whole run
+            stop_sampling = asyncio.Event()
+            sampler = asyncio.create_task(
+                self._sample_peak_memory(stop_sampling, initial_memory, memory_sample_interval)
+            )
             
             start_time = time.time()
-            results = await coordinator.process_repositories_batch(repositories)
+            try:
+                results = await coordinator.process_repositories_batch(repositories)
+            finally:
+                stop_sampling.set()
+                peak_memory = await sampler
             processing_time = time.time() - start_time
             
-            final_memory = self.resource_manager.get_memory_usage()
-            peak_memory = max(initial_memory, final_memory)  # Simplified peak tracking
+            final_memory = self._memory_usage_mb()
             
-            print(f"🏁 Final memory usage: {final_memory:.1f}MB")
-            print(f"📈 Peak memory usage: {peak_memory:.1f}MB")
-            print(f"⏱️  Processing time: {processing_time:.2f}s")
+            self._print("memory", f"🏁 Final memory usage: {final_memory:.1f}MB")
+            self._print("memory", f"📈 Peak memory usage: {peak_memory:.1f}MB")
+            self._print("memory", f"⏱️  Processing time: {processing_time:.2f}s")
             
             # Memory efficiency analysis
-            metrics = coordinator.get_batch_metrics()
+            metrics = await coordinator.get_batch_metrics()
             memory_efficiency = (metrics.total_requests * 1024) / (peak_memory * 1024 * 1024)  # Requests per MB
             
-            print(f"🎯 Memory efficiency: {memory_efficiency:.2f} requests/MB")
+            self._print("memory", f"🎯 Memory efficiency: {memory_efficiency:.2f} requests/MB")
             
             return {
                 'results': results,
@@ -176,71 +297,50 @@ class AdvancedBatchProcessor:
                 },
                 'processing_time': processing_time
             }
-            
-        finally:
-            await coordinator.cleanup()
     
-    async def error_resilience_demo(self, repositories: List[Repository]) -> Dict[str, Any]:
+    async def error_resilience_demo(self, repositories: Sequence[Repository]) -> Dict[str, Any]:
         """Demonstrate error handling and resilience features."""
         
-        print("\n🛡️  Error Resilience and Recovery Demo")
-        print("=" * 40)
+        self._print("resilience", "\n🛡️  Error Resilience and Recovery Demo")
+        self._print("resilience", "=" * 40)
         
         # Configure for maximum resilience
-        config = BatchConfig(
+        config = BASE_ADVANCED_CONFIG.replace(
             max_concurrent_requests=5,   # Conservative concurrency
             default_batch_size=4,        # Small batches for easier recovery
             retry_attempts=6,            # More retry attempts
             retry_delay_base=2.0,        # Longer retry delays
             rate_limit_buffer=0.6,       # Very conservative rate limiting
-            default_strategy=BatchStrategy.CONSERVATIVE,
-            enable_performance_monitoring=True
-        )
-        
-        coordinator = BatchCoordinator(
-            github_client=self.github_client,
-            cache_manager=self.cache_manager,
-            config=config,
-            metrics_collector=self.metrics_collector
+            default_strategy=BatchStrategy.CONSERVATIVE
         )
         
         # Add some invalid repositories to test error handling
-        test_repositories = repositories + [
-            Repository(
-                name="non-existent-repo",
-                full_name="invalid/non-existent-repo",
-                owner="invalid"
-            ),
-            Repository(
-                name="private-repo",
-                full_name="private/inaccessible-repo", 
-                owner="private"
-            )
-        ]
+        test_repositories = (*repositories, INVALID_REPO_1, INVALID_REPO_2)
         
-        try:
-            print(f"🧪 Testing with {len(test_repositories)} repositories (including invalid ones)")
-            print("🔄 Using conservative settings with enhanced error recovery")
+        async with self._coordinator(config) as coordinator:
+            self._print("resilience", f"🧪 Testing with {len(test_repositories)} repositories (including invalid ones)")
+            self._print("resilience", "🔄 Using conservative settings with enhanced error recovery")
             
             start_time = time.time()
             results = await coordinator.process_repositories_batch(test_repositories)
             processing_time = time.time() - start_time
             
             # Analyze error handling effectiveness
-            metrics = coordinator.get_batch_metrics()
-            success_rate = metrics.successful_requests / metrics.total_requests if metrics.total_requests > 0 else 0
+            metrics = await coordinator.get_batch_metrics()
+            success_rate = _ratio(metrics.successful_requests, metrics.total_requests)
             
-            print(f"\n📊 Error Resilience Results:")
-            print(f"   ✅ Success rate: {success_rate:.2%}")
-            print(f"   🔄 Total requests: {metrics.total_requests}")
-            print(f"   ✅ Successful: {metrics.successful_requests}")
-            print(f"   ❌ Failed: {metrics.total_requests - metrics.successful_requests}")
-            print(f"   ⏱️  Processing time: {processing_time:.2f}s")
+            self._print("resilience", f"\n📊 Error Resilience Results:")
+            self._print("resilience", f"   ✅ Success rate: {success_rate:.2%}")
+            self._print("resilience", f"   🔄 Total requests: {metrics.total_requests}")
+            self._print("resilience", f"   ✅ Successful: {metrics.successful_requests}")
+            self._print("resilience", f"   ❌ Failed: {metrics.total_requests - metrics.successful_requests}")
+            self._print("resilience", f"   ⏱️  Processing time: {processing_time:.2f}s")
             
             # Show which repositories were processed successfully
-            print(f"\n📁 Successfully processed repositories:")
-            for repo_name in results.keys():
-                print(f"   ✅ {repo_name}")
+            self._emit("resilience", [
+                "\n📁 Successfully processed repositories:",
+                *(f"   ✅ {repo_name}" for repo_name in results),
+            ])
             
             return {
                 'results': results,
@@ -252,59 +352,62 @@ class AdvancedBatchProcessor:
                     'failed_requests': metrics.total_requests - metrics.successful_requests
                 }
             }
-            
-        finally:
-            await coordinator.cleanup()
     
     def _display_results(self, results: Dict, metrics: Any, summary: Dict, 
                         optimizations: List[str], processing_time: float):
         """Display comprehensive results and analysis."""
         
-        print(f"\n🎉 Batch Processing Complete!")
-        print(f"⏱️  Total processing time: {processing_time:.2f}s")
+        out: List[str] = [
+            "\n🎉 Batch Processing Complete!",
+            f"⏱️  Total processing time: {processing_time:.2f}s",
+        ]
         
-        # Results summary
-        print(f"\n📋 Scan Results Summary:")
-        total_matches = sum(len(matches) for matches in results.values())
-        print(f"   📁 Repositories processed: {len(results)}")
-        print(f"   🔍 Total IOC matches found: {total_matches}")
+        # Results summary; count each repository's matches once and reuse below
+        counts = [(repo_name, len(matches), matches) for repo_name, matches in results.items()]
+        total_matches = sum(count for _, count, _ in counts)
+        out.append("\n📋 Scan Results Summary:")
+        out.append(f"   📁 Repositories processed: {len(results)}")
+        out.append(f"   🔍 Total IOC matches found: {total_matches}")
         
         if total_matches > 0:
-            print(f"\n🚨 IOC Matches by Repository:")
-            for repo_name, matches in results.items():
-                if matches:
-                    print(f"   📁 {repo_name}: {len(matches)} matches")
-                    for match in matches[:3]:  # Show first 3 matches
-                        print(f"      - {match.package_name} {match.version} in {match.file_path}")
-                    if len(matches) > 3:
-                        print(f"      ... and {len(matches) - 3} more")
+            out.append("\n🚨 IOC Matches by Repository:")
+            for repo_name, count, matches in counts:
+                if count:
+                    out.append(f"   📁 {repo_name}: {count} matches")
+                    out.extend(map(_format_match, matches[:3]))  # Show first 3 matches
+                    remaining = count - 3
+                    if remaining > 0:
+                        out.append(f"      ... and {remaining} more")
         
         # Performance metrics
-        print(f"\n📊 Performance Metrics:")
-        print(f"   🔢 Total requests: {metrics.total_requests}")
-        print(f"   ✅ Successful requests: {metrics.successful_requests}")
-        print(f"   💾 Cache hits: {metrics.cache_hits}")
-        print(f"   📈 Cache hit rate: {metrics.cache_hits / metrics.total_requests:.2%}")
-        print(f"   📦 Average batch size: {metrics.average_batch_size:.1f}")
-        print(f"   💾 API calls saved: {metrics.api_calls_saved}")
-        print(f"   ⚡ Parallel efficiency: {metrics.parallel_efficiency:.2%}")
+        out.extend([
+            "\n📊 Performance Metrics:",
+            f"   🔢 Total requests: {metrics.total_requests}",
+            f"   ✅ Successful requests: {metrics.successful_requests}",
+            f"   💾 Cache hits: {metrics.cache_hits}",
+            f"   📈 Cache hit rate: {_ratio(metrics.cache_hits, metrics.total_requests):.2%}",
+            f"   📦 Average batch size: {metrics.average_batch_size:.1f}",
+            f"   💾 API calls saved: {metrics.api_calls_saved}",
+            f"   ⚡ Parallel efficiency: {metrics.parallel_efficiency:.2%}",
+        ])
         
         # Detailed performance summary
         if summary:
-            print(f"\n📈 Detailed Performance Analysis:")
+            out.append("\n📈 Detailed Performance Analysis:")
             for key, value in summary.items():
                 if isinstance(value, float):
-                    print(f"   {key}: {value:.3f}")
+                    out.append(f"   {key}: {value:.3f}")
                 else:
-                    print(f"   {key}: {value}")
+                    out.append(f"   {key}: {value}")
         
         # Optimization recommendations
         if optimizations:
-            print(f"\n💡 Optimization Recommendations:")
-            for i, opt in enumerate(optimizations, 1):
-                print(f"   {i}. {opt}")
+            out.append("\n💡 Optimization Recommendations:")
+            out.extend(f"   {i}. {opt}" for i, opt in enumerate(optimizations, 1))
         else:
-            print(f"\n✅ No optimization recommendations - performance is optimal!")
+            out.append("\n✅ No optimization recommendations - performance is optimal!")
+        
+        self._emit("optimize", out)
 
 
 async def main():
@@ -314,48 +417,66 @@ async def main():
     if not github_token:
         raise ValueError("GITHUB_TOKEN environment variable is required")
     
-    # Initialize advanced batch processor
-    processor = AdvancedBatchProcessor(github_token)
-    
-    # Define test repositories
-    repositories = [
-        Repository(name="repo1", full_name="owner/repo1", owner="owner"),
-        Repository(name="repo2", full_name="owner/repo2", owner="owner"),
-        Repository(name="repo3", full_name="owner/repo3", owner="owner"),
-        Repository(name="repo4", full_name="owner/repo4", owner="owner"),
-        Repository(name="repo5", full_name="owner/repo5", owner="owner"),
-    ]
+    repositories = base_repos()
     
     print("🔬 GitHub IOC Scanner - Advanced Batch Processing Demo")
     print("=" * 55)
     
-    try:
-        # Demo 1: Optimized batch processing with analysis
-        print("\n🚀 Demo 1: Optimized Batch Processing")
-        results1 = await processor.optimize_and_scan(repositories)
-        
-        # Demo 2: Memory-efficient processing
-        print("\n" + "=" * 55)
-        results2 = await processor.memory_efficient_large_scan(repositories)
-        
-        # Demo 3: Error resilience
-        print("\n" + "=" * 55)
-        results3 = await processor.error_resilience_demo(repositories[:3])  # Use fewer repos for error demo
-        
-        # Final summary
-        print("\n" + "=" * 55)
-        print("🎯 Advanced Batch Processing Demo Complete!")
-        print("\nKey Takeaways:")
-        print("✅ Batch processing can significantly improve performance")
-        print("✅ Adaptive strategies automatically optimize based on conditions")
-        print("✅ Memory-efficient processing enables large-scale scans")
-        print("✅ Error resilience ensures reliable operation")
-        print("✅ Performance monitoring provides optimization insights")
+    # The processor opens one GitHub client that all demos share
+    async with AdvancedBatchProcessor(github_token) as processor:
+        try:
+            # The demos are independent and I/O-bound, so run them concurrently
+            print("\n🚀 Running optimized, memory-efficient and error resilience demos concurrently")
+            demo_names = ("optimize", "memory", "resilience")
+            demo_results = await asyncio.gather(
+                processor.optimize_and_scan(repositories),
+                processor.memory_efficient_large_scan(repositories),
+                processor.error_resilience_demo(repositories[:3]),  # Use fewer repos for error demo
+                return_exceptions=True
+            )
+            
+            failures = [
+                (name, result)
+                for name, result in zip(demo_names, demo_results)
+                if isinstance(result, BaseException)
+            ]
+            # Keep only the timings; the result dicts hold every IOC match and file
+            # reference, so drop them before the summary instead of at exit
+            timings = [
+                (name, result['processing_time'])
+                for name, result in zip(demo_names, demo_results)
+                if not isinstance(result, BaseException)
+            ]
+            del demo_results
+            gc.collect()
+            
+            for name, error in failures:
+                print(f"❌ Demo '{name}' failed with error: {error}")
+            if failures:
+                raise failures[0][1]
+            
+            # Final summary
+            print("\n" + "=" * 55)
+            print("🎯 Advanced Batch Processing Demo Complete!")
+            for name, processing_time in timings:
+                print(f"⏱️  {name}: {processing_time:.2f}s")
+            print("\nKey Takeaways:")
+            print("✅ Batch processing can significantly improve performance")
+            print("✅ Adaptive strategies automatically optimize based on conditions")
+            print("✅ Memory-efficient processing enables large-scale scans")
+            print("✅ Error resilience ensures reliable operation")
+            print("✅ Performance monitoring provides optimization insights")
         
-    except Exception as e:
-        print(f"❌ Demo failed with error: {e}")
-        raise
+        except Exception as e:
+            print(f"❌ Demo failed with error: {e}")
+            raise
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # uvloop (from the speedups extra) is a faster drop-in event loop
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    asyncio.run(main())
@@ -25,38 +25,40 @@ setup_logging()
 logger = get_logger(__name__)
 
 
-def create_test_repositories():
-    """Create test repositories with mixed archived status."""
-    return [
-        Repository(
-            name="active-repo-1",
-            full_name="test-org/active-repo-1",
-            archived=False,
-            default_branch="main",
-            updated_at=datetime.now()
-        ),
-        Repository(
-            name="archived-repo-1",
-            full_name="test-org/archived-repo-1", 
-            archived=True,
-            default_branch="main",
-            updated_at=datetime.now()
-        ),
-        Repository(
-            name="active-repo-2",
-            full_name="test-org/active-repo-2",
-            archived=False,
-            default_branch="main",
-            updated_at=datetime.now()
-        ),
-        Repository(
-            name="archived-repo-2",
-            full_name="test-org/archived-repo-2",
-            archived=True,
-            default_branch="main", 
-            updated_at=datetime.now()
-        ),
-    ]
+# Fixed timestamp for the fixture repositories; the filter only looks at `archived`
+_FIXTURE_TS = datetime(2024, 1, 1)
+
+# Built once at import; Repository is immutable so the tuple can be shared
+TEST_REPOS = (
+    Repository(
+        name="active-repo-1",
+        full_name="test-org/active-repo-1",
+        archived=False,
+        default_branch="main",
+        updated_at=_FIXTURE_TS
+    ),
+    Repository(
+        name="archived-repo-1",
+        full_name="test-org/archived-repo-1", 
+        archived=True,
+        default_branch="main",
+        updated_at=_FIXTURE_TS
+    ),
+    Repository(
+        name="active-repo-2",
+        full_name="test-org/active-repo-2",
+        archived=False,
+        default_branch="main",
+        updated_at=_FIXTURE_TS
+    ),
+    Repository(
+        name="archived-repo-2",
+        full_name="test-org/archived-repo-2",
+        archived=True,
+        default_branch="main", 
+        updated_at=_FIXTURE_TS
+    ),
+)
 
 
 def test_archived_filtering():
@@ -64,8 +66,7 @@ def test_archived_filtering():
     print("🧪 Testing Archived Repository Filtering")
     print("=" * 45)
     
-    # Create test repositories
-    test_repos = create_test_repositories()
+    test_repos = TEST_REPOS
     
     print(f"📋 Test Data: {len(test_repos)} repositories")
     for repo in test_repos:
@@ -81,24 +82,26 @@ def test_archived_filtering():
     
     # Simulate filtering logic
     if not config.include_archived:
-        filtered_repos = [repo for repo in test_repos if not repo.archived]
-        archived_count = len(test_repos) - len(filtered_repos)
-        
-        print(f"📊 Results:")
-        print(f"  • Total repositories: {len(test_repos)}")
-        print(f"  • Archived repositories: {archived_count}")
-        print(f"  • Active repositories: {len(filtered_repos)}")
-        print(f"  • Repositories to scan: {len(filtered_repos)}")
+        # Partition in a single pass instead of filtering the list twice
+        filtered_repos, archived_repos = [], []
+        for repo in test_repos:
+            (archived_repos if repo.archived else filtered_repos).append(repo)
+        archived_count = len(archived_repos)
         
-        print(f"\n✅ Repositories that WILL be scanned:")
-        for repo in filtered_repos:
-            print(f"  • {repo.name}")
+        out = [
+            "📊 Results:",
+            f"  • Total repositories: {len(test_repos)}",
+            f"  • Archived repositories: {archived_count}",
+            f"  • Active repositories: {len(filtered_repos)}",
+            f"  • Repositories to scan: {len(filtered_repos)}",
+            "\n✅ Repositories that WILL be scanned:",
+        ]
+        out.extend(f"  • {repo.name}" for repo in filtered_repos)
         
         if archived_count > 0:
-            archived_repos = [repo for repo in test_repos if repo.archived]
-            print(f"\n📦 Repositories that will be SKIPPED (archived):")
-            for repo in archived_repos:
-                print(f"  • {repo.name}")
+            out.append("\n📦 Repositories that will be SKIPPED (archived):")
+            out.extend(f"  • {repo.name}" for repo in archived_repos)
+        sys.stdout.write("\n".join(out) + "\n")
     
     print("\n🔍 Testing Include Archived Configuration")
     print("-" * 45)
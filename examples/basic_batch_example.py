@@ -8,6 +8,7 @@ batch processing capabilities for improved performance.
 
 import asyncio
 import os
+import sys
 from typing import List
 
 from github_ioc_scanner.batch_coordinator import BatchCoordinator
@@ -16,19 +17,18 @@ from github_ioc_scanner.async_github_client import AsyncGitHubClient
 from github_ioc_scanner.cache_manager import CacheManager
 from github_ioc_scanner.models import Repository
 
+# Bound once so the match loop doesn't rebuild the template per line
+_format_match = "  - {0.package_name} {0.version} in {0.file_path}".format
 
-async def basic_batch_scan():
+
+def _ratio(numerator: float, denominator: float) -> float:
+    """Return numerator / denominator, or 0.0 when the denominator is zero."""
+    return numerator / denominator if denominator else 0.0
+
+
+async def basic_batch_scan(github_client: AsyncGitHubClient, cache_manager: CacheManager):
     """Demonstrate basic batch scanning of repositories."""
     
-    # Get GitHub token from environment
-    github_token = os.getenv("GITHUB_TOKEN")
-    if not github_token:
-        raise ValueError("GITHUB_TOKEN environment variable is required")
-    
-    # Initialize components
-    github_client = AsyncGitHubClient(token=github_token)
-    cache_manager = CacheManager()
-    
     # Configure batch processing with basic settings
     config = BatchConfig(
         max_concurrent_requests=10,
@@ -73,15 +73,15 @@ async def basic_batch_scan():
             strategy=BatchStrategy.ADAPTIVE
         )
         
-        # Display results
-        print("\nScan Results:")
+        # Display results, buffered into a single write
+        out = ["\nScan Results:"]
         for repo_name, matches in results.items():
-            print(f"\n{repo_name}:")
+            out.append(f"\n{repo_name}:")
             if matches:
-                for match in matches:
-                    print(f"  - {match.package_name} {match.version} in {match.file_path}")
+                out.extend(map(_format_match, matches))
             else:
-                print("  No IOC matches found")
+                out.append("  No IOC matches found")
+        sys.stdout.write("\n".join(out) + "\n")
         
         # Get and display performance metrics
         metrics = coordinator.get_batch_metrics()
@@ -89,7 +89,7 @@ async def basic_batch_scan():
         print(f"  Total requests: {metrics.total_requests}")
         print(f"  Successful requests: {metrics.successful_requests}")
         print(f"  Cache hits: {metrics.cache_hits}")
-        print(f"  Cache hit rate: {metrics.cache_hits / metrics.total_requests:.2%}")
+        print(f"  Cache hit rate: {_ratio(metrics.cache_hits, metrics.total_requests):.2%}")
         print(f"  Average batch size: {metrics.average_batch_size:.1f}")
         print(f"  Total processing time: {metrics.total_processing_time:.2f}s")
         print(f"  API calls saved: {metrics.api_calls_saved}")
@@ -105,17 +105,9 @@ async def basic_batch_scan():
         print("\nBatch scan completed and resources cleaned up")
 
 
-async def batch_scan_single_repository():
+async def batch_scan_single_repository(github_client: AsyncGitHubClient, cache_manager: CacheManager):
     """Demonstrate batch scanning of files within a single repository."""
     
-    github_token = os.getenv("GITHUB_TOKEN")
-    if not github_token:
-        raise ValueError("GITHUB_TOKEN environment variable is required")
-    
-    # Initialize components
-    github_client = AsyncGitHubClient(token=github_token)
-    cache_manager = CacheManager()
-    
     # Configure for single repository scanning
     config = BatchConfig(
         max_concurrent_requests=15,
@@ -163,17 +155,19 @@ async def batch_scan_single_repository():
         print(f"Scanning {len(file_paths)} files")
         print(f"Priority files: {', '.join(priority_files)}")
         
-        # Process files in batches with prioritization
-        file_contents = await coordinator.process_files_batch(
+        # Stream files in batches with prioritization; each file's content
+        # can be released before the next batch arrives
+        print("\nRetrieved files:")
+        retrieved = 0
+        async for file_path, content in coordinator.iter_files_batch(
             repo=repository,
             file_paths=file_paths,
             priority_files=priority_files
-        )
-        
-        # Display results
-        print(f"\nRetrieved {len(file_contents)} files:")
-        for file_path, content in file_contents.items():
+        ):
             print(f"  - {file_path} ({len(content.content)} bytes)")
+            retrieved += 1
+            del content
+        print(f"Retrieved {retrieved} files")
         
         # Get performance metrics
         metrics = coordinator.get_batch_metrics()
@@ -190,18 +184,33 @@ async def batch_scan_single_repository():
         await coordinator.cleanup()
 
 
-if __name__ == "__main__":
-    print("GitHub IOC Scanner - Basic Batch Processing Example")
-    print("=" * 50)
+async def main():
+    """Run both examples over a single shared GitHub client."""
     
-    # Run basic repository batch scan
-    print("\n1. Basic Repository Batch Scan")
-    print("-" * 30)
-    asyncio.run(basic_batch_scan())
+    # Get GitHub token from environment
+    github_token = os.getenv("GITHUB_TOKEN")
+    if not github_token:
+        raise ValueError("GITHUB_TOKEN environment variable is required")
     
-    print("\n" + "=" * 50)
+    print("GitHub IOC Scanner - Basic Batch Processing Example")
+    print("=" * 50)
     
-    # Run single repository file batch scan
-    print("\n2. Single Repository File Batch Scan")
-    print("-" * 35)
-    asyncio.run(batch_scan_single_repository())
\ No newline at end of file
+    # One client for both examples keeps HTTP keep-alive connections warm, and
+    # one cache lets the second example reuse files fetched by the first
+    cache_manager = CacheManager()
+    async with AsyncGitHubClient(token=github_token) as github_client:
+        # Run basic repository batch scan
+        print("\n1. Basic Repository Batch Scan")
+        print("-" * 30)
+        await basic_batch_scan(github_client, cache_manager)
+        
+        print("\n" + "=" * 50)
+        
+        # Run single repository file batch scan
+        print("\n2. Single Repository File Batch Scan")
+        print("-" * 35)
+        await batch_scan_single_repository(github_client, cache_manager)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
\ No newline at end of file
@@ -7,21 +7,28 @@ and BatchPerformanceAnalyzer together to monitor and optimize batch operations.
 """
 
 import asyncio
+import logging
 import time
 from datetime import datetime
+from pathlib import Path
+from typing import Tuple
 
 import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from src.github_ioc_scanner.batch_metrics_collector import BatchMetricsCollector
-from src.github_ioc_scanner.batch_progress_monitor import BatchProgressMonitor
-from src.github_ioc_scanner.batch_performance_analyzer import BatchPerformanceAnalyzer
-from src.github_ioc_scanner.batch_models import BatchStrategy
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_REPO_ROOT))
+
+logger = logging.getLogger(__name__)
+
+# Scanner modules are imported inside the demos so importing this module stays cheap
 
 
 async def simulate_batch_operations():
     """Simulate batch operations with monitoring and analysis."""
+    from src.github_ioc_scanner.batch_metrics_collector import BatchMetricsCollector
+    from src.github_ioc_scanner.batch_progress_monitor import BatchProgressMonitor
+    from src.github_ioc_scanner.batch_performance_analyzer import BatchPerformanceAnalyzer
+    from src.github_ioc_scanner.batch_models import BatchMetrics, BatchStrategy
     
     print("🚀 Starting Batch Performance Monitoring Example")
     print("=" * 60)
@@ -37,14 +44,11 @@ async def simulate_batch_operations():
     
     print(f"📊 Monitoring {total_operations} batch operations...")
     
-    # Simulate batch operations with varying performance
-    completed = 0
-    success_count = 0
-    failure_count = 0
+    batch_size = 5
     
-    for batch_num in range(10):  # 10 batches of 5 operations each
-        batch_size = 5
-        batch_start_time = time.time()
+    async def _run_batch(batch_num: int) -> Tuple[int, int, int, float]:
+        """Simulate one batch and return (successes, failures, cache hits, duration)."""
+        batch_start_ns = time.perf_counter_ns()
         
         # Simulate different performance characteristics
         if batch_num < 3:
@@ -66,8 +70,19 @@ async def simulate_batch_operations():
             batch_failures = 0
             cache_hits = 4  # High cache hit rate
         
-        batch_duration = time.time() - batch_start_time
-        
+        batch_duration = (time.perf_counter_ns() - batch_start_ns) * 1e-9
+        return batch_success, batch_failures, cache_hits, batch_duration
+    
+    # The batches are independent, so run them concurrently and record the
+    # results afterwards in batch order
+    batch_results = await asyncio.gather(*(_run_batch(batch_num) for batch_num in range(10)))
+    
+    # Record each batch as if it had just completed
+    completed = 0
+    success_count = 0
+    failure_count = 0
+    
+    for batch_num, (batch_success, batch_failures, cache_hits, batch_duration) in enumerate(batch_results):
         # Update counters
         completed += batch_size
         success_count += batch_success
@@ -93,89 +108,99 @@ async def simulate_batch_operations():
             current_batch_size=batch_size
         )
         
-        # Show progress
-        eta = progress_monitor.calculate_eta()
-        eta_str = eta.estimated_time_remaining_str if eta else "calculating..."
-        print(f"  Batch {batch_num + 1}/10: {completed}/{total_operations} ops, "
-              f"success rate: {(success_count/completed)*100:.1f}%, ETA: {eta_str}")
+        # Show progress; skip the ETA work entirely when INFO logging is off
+        if logger.isEnabledFor(logging.INFO):
+            eta = progress_monitor.calculate_eta()
+            eta_str = eta.estimated_time_remaining_str if eta else "calculating..."
+            logger.info(
+                "  Batch %d/10: %d/%d ops, success rate: %.1f%%, ETA: %s",
+                batch_num + 1, completed, total_operations,
+                (success_count / completed) * 100, eta_str
+            )
     
-    # Finish monitoring
+    # Finish monitoring; the report is collected and written in one go
     final_stats = progress_monitor.finish_monitoring()
     
-    print("\n📈 Final Statistics:")
-    print(f"  Total Duration: {final_stats['total_duration_seconds']:.1f}s")
-    print(f"  Success Rate: {final_stats['success_rate']:.1f}%")
-    print(f"  Processing Rate: {final_stats['average_operations_per_second']:.1f} ops/sec")
+    lines = [
+        "\n📈 Final Statistics:",
+        f"  Total Duration: {final_stats['total_duration_seconds']:.1f}s",
+        f"  Success Rate: {final_stats['success_rate']:.1f}%",
+        f"  Processing Rate: {final_stats['average_operations_per_second']:.1f} ops/sec",
+    ]
     
     # Get performance summary
-    print("\n📊 Performance Metrics:")
+    lines.append("\n📊 Performance Metrics:")
     performance_summary = metrics_collector.get_performance_summary()
     efficiency_metrics = metrics_collector.get_efficiency_metrics()
     
-    print(f"  Cache Efficiency: {efficiency_metrics['cache_efficiency']:.1f}%")
-    print(f"  Batch Efficiency: {efficiency_metrics['batch_efficiency']:.1f}%")
-    print(f"  Time Efficiency: {efficiency_metrics['time_efficiency']:.1f} ops/sec")
-    print(f"  Overall Efficiency: {efficiency_metrics['overall_efficiency']:.1f}%")
+    lines += [
+        f"  Cache Efficiency: {efficiency_metrics['cache_efficiency']:.1f}%",
+        f"  Batch Efficiency: {efficiency_metrics['batch_efficiency']:.1f}%",
+        f"  Time Efficiency: {efficiency_metrics['time_efficiency']:.1f} ops/sec",
+        f"  Overall Efficiency: {efficiency_metrics['overall_efficiency']:.1f}%",
+    ]
     
     # Perform comprehensive analysis
-    print("\n🔍 Performance Analysis:")
+    lines.append("\n🔍 Performance Analysis:")
     analysis = performance_analyzer.analyze_performance(metrics_collector, progress_monitor)
     
-    print(f"  Overall Score: {analysis.overall_score:.1f}/100")
+    lines.append(f"  Overall Score: {analysis.overall_score:.1f}/100")
     
     if analysis.bottlenecks:
-        print("  Bottlenecks Identified:")
-        for bottleneck in analysis.bottlenecks:
-            print(f"    • {bottleneck}")
+        lines.append("  Bottlenecks Identified:")
+        lines.extend(f"    • {bottleneck}" for bottleneck in analysis.bottlenecks)
     else:
-        print("  No significant bottlenecks identified")
+        lines.append("  No significant bottlenecks identified")
     
-    print(f"\n💡 Optimization Recommendations ({len(analysis.recommendations)} found):")
+    lines.append(f"\n💡 Optimization Recommendations ({len(analysis.recommendations)} found):")
     for i, rec in enumerate(analysis.recommendations[:3], 1):  # Show top 3
-        print(f"  {i}. [{rec.priority.value.upper()}] {rec.title}")
-        print(f"     {rec.description}")
+        lines.append(f"  {i}. [{rec.priority.value.upper()}] {rec.title}")
+        lines.append(f"     {rec.description}")
         if rec.expected_improvement:
-            print(f"     Expected: {rec.expected_improvement}")
-        print()
+            lines.append(f"     Expected: {rec.expected_improvement}")
+        lines.append("")
     
     # Show trend analysis if available
     if analysis.trend_analysis:
-        print("📈 Performance Trends:")
+        lines.append("📈 Performance Trends:")
         for op_type, trend_info in analysis.trend_analysis.items():
             status = "improving" if trend_info['is_improving'] else "stable/degrading"
-            print(f"  {op_type}: {status} (avg: {trend_info['recent_average']:.2f}s)")
+            lines.append(f"  {op_type}: {status} (avg: {trend_info['recent_average']:.2f}s)")
     
     # Demonstrate alerts using BatchMetrics
-    print("\n🚨 Performance Alerts:")
-    from src.github_ioc_scanner.batch_models import BatchMetrics
+    lines.append("\n🚨 Performance Alerts:")
     
     # Create a BatchMetrics object for alert testing
+    total_cache_hits = sum(m.cache_hits for m in metrics_collector.operation_metrics.values())
     test_metrics = BatchMetrics(
         total_requests=completed,
         successful_requests=success_count,
         failed_requests=failure_count,
-        cache_hits=sum(metrics_collector.operation_metrics[op].cache_hits 
-                      for op in metrics_collector.operation_metrics),
-        cache_misses=completed - sum(metrics_collector.operation_metrics[op].cache_hits 
-                                   for op in metrics_collector.operation_metrics)
+        cache_hits=total_cache_hits,
+        cache_misses=completed - total_cache_hits
     )
     test_metrics.finish()
     
     alerts = progress_monitor.alert_on_performance_issues(test_metrics)
     if alerts:
-        for alert in alerts:
-            print(f"  ⚠️  {alert}")
+        lines.extend(f"  ⚠️  {alert}" for alert in alerts)
     else:
-        print("  ✅ No performance issues detected")
+        lines.append("  ✅ No performance issues detected")
     
-    print("\n" + "=" * 60)
-    print("✨ Batch Performance Monitoring Example Complete!")
+    lines += [
+        "\n" + "=" * 60,
+        "✨ Batch Performance Monitoring Example Complete!",
+    ]
+    print("\n".join(lines))
     
     return analysis
 
 
 def demonstrate_historical_analysis():
     """Demonstrate historical analysis capabilities."""
+    from src.github_ioc_scanner.batch_metrics_collector import BatchMetricsCollector
+    from src.github_ioc_scanner.batch_performance_analyzer import BatchPerformanceAnalyzer
+    
     print("\n📚 Historical Analysis Demo:")
     
     analyzer = BatchPerformanceAnalyzer()
@@ -225,6 +250,12 @@ def demonstrate_historical_analysis():
 
 
 if __name__ == "__main__":
+    # Only this example's progress lines go to stdout, interleaved with the prints
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    
     # Run the example
     asyncio.run(simulate_batch_operations())
     
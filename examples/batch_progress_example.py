@@ -8,17 +8,18 @@ performance.
 """
 
 import asyncio
+import itertools
 import os
 import tempfile
+import time
 from datetime import datetime
-from typing import List
+from functools import lru_cache
+from typing import TYPE_CHECKING, Tuple
 
-from src.github_ioc_scanner.cli import CLIInterface
-from src.github_ioc_scanner.models import ScanConfig, Repository
-from src.github_ioc_scanner.scanner import GitHubIOCScanner
-from src.github_ioc_scanner.github_client import GitHubClient
-from src.github_ioc_scanner.cache import CacheManager
-from src.github_ioc_scanner.batch_models import BatchConfig, BatchStrategy
+# Scanner modules are imported where they are used; importing the package pulls
+# in the whole scanner, which this module doesn't need until a demo runs
+if TYPE_CHECKING:
+    from src.github_ioc_scanner.models import Repository
 
 
 def create_example_ioc_files(issues_dir: str):
@@ -57,56 +58,38 @@ IOC_PACKAGES = {
         f.write(supply_chain_content)
 
 
-def create_test_repositories() -> List[Repository]:
+_TEST_REPO_NAMES = (
+    "frontend-app",
+    "backend-api",
+    "shared-components",
+    "data-pipeline",
+    "mobile-app",
+    "infrastructure",
+)
+
+
+@lru_cache(maxsize=1)
+def create_test_repositories() -> Tuple["Repository", ...]:
     """Create a realistic set of test repositories."""
-    return [
-        Repository(
-            name="frontend-app",
-            full_name="myorg/frontend-app",
-            archived=False,
-            default_branch="main",
-            updated_at=datetime.now()
-        ),
-        Repository(
-            name="backend-api",
-            full_name="myorg/backend-api",
-            archived=False,
-            default_branch="main",
-            updated_at=datetime.now()
-        ),
-        Repository(
-            name="shared-components",
-            full_name="myorg/shared-components",
-            archived=False,
-            default_branch="main",
-            updated_at=datetime.now()
-        ),
-        Repository(
-            name="data-pipeline",
-            full_name="myorg/data-pipeline",
-            archived=False,
-            default_branch="main",
-            updated_at=datetime.now()
-        ),
-        Repository(
-            name="mobile-app",
-            full_name="myorg/mobile-app",
-            archived=False,
-            default_branch="main",
-            updated_at=datetime.now()
-        ),
-        Repository(
-            name="infrastructure",
-            full_name="myorg/infrastructure",
-            archived=False,
-            default_branch="main",
-            updated_at=datetime.now()
-        )
-    ]
+    from src.github_ioc_scanner.models import Repository
+    
+    now = datetime.now()
+    # Positional fields: name, full_name, archived, default_branch, updated_at
+    return tuple(
+        Repository(name, f"myorg/{name}", False, "main", now)
+        for name in _TEST_REPO_NAMES
+    )
 
 
 async def demonstrate_batch_progress():
     """Demonstrate batch processing with progress monitoring."""
+    from src.github_ioc_scanner.cli import CLIInterface
+    from src.github_ioc_scanner.models import ScanConfig
+    from src.github_ioc_scanner.scanner import GitHubIOCScanner
+    from src.github_ioc_scanner.github_client import GitHubClient
+    from src.github_ioc_scanner.cache import CacheManager
+    from src.github_ioc_scanner.batch_models import BatchConfig, BatchStrategy
+    
     print("🚀 GitHub IOC Scanner - Batch Processing with Progress Monitoring")
     print("=" * 70)
     
@@ -208,11 +191,20 @@ async def demonstrate_batch_progress():
         
         # Simulate progress updates
         test_repos = create_test_repositories()
-        start_time = datetime.now().timestamp()
+        # display_progress measures elapsed time against time.time()
+        start_time = time.time()
+        
+        # Repos are processed concurrently (bounded like the real scan), and the
+        # displayed position is assigned on completion so progress stays monotonic
+        repo_slots = asyncio.Semaphore(batch_config.max_concurrent_repos)
+        completed = itertools.count(1)
+        
+        async def _process_one(repo: "Repository") -> None:
+            async with repo_slots:
+                await asyncio.sleep(0.3)  # Simulate processing time
+            progress_callback(next(completed), len(test_repos), repo.full_name, start_time)
         
-        for i, repo in enumerate(test_repos, 1):
-            await asyncio.sleep(0.3)  # Simulate processing time
-            progress_callback(i, len(test_repos), repo.full_name, start_time)
+        await asyncio.gather(*(_process_one(repo) for repo in test_repos))
         
         print(f"\n✨ Key Benefits of Batch Processing with Progress Monitoring:")
         print(f"   ✅ Maintains parallel processing performance")
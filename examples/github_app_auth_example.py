@@ -6,6 +6,7 @@ This example demonstrates how to configure and use GitHub App authentication
 instead of personal access tokens for enterprise environments.
 """
 
+import functools
 import os
 import sys
 import tempfile
@@ -13,9 +14,14 @@ import yaml
 from pathlib import Path
 
 # Add the src directory to the path so we can import the scanner
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_REPO_ROOT / 'src'))
 
-from github_ioc_scanner.github_app_auth import GitHubAppAuth, create_github_app_auth
+# Prefer the libyaml-backed dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
 
 
 def create_example_config():
@@ -43,23 +49,30 @@ MIIEpAIBAAKCAQEA1234567890abcdef...
     return config
 
 
+@functools.lru_cache(maxsize=None)
+def example_config_yaml() -> str:
+    """Return the example configuration as YAML, serialized on first use."""
+    return yaml.dump(create_example_config(), Dumper=_YamlDumper, default_flow_style=False)
+
+
 def example_github_app_setup():
     """Example of setting up GitHub App authentication."""
+    from github_ioc_scanner.github_app_auth import GitHubAppAuth
     
     print("🔧 GitHub App Authentication Setup Example")
     print("=" * 50)
     
-    # Step 1: Create example configuration
-    config = create_example_config()
+    # Step 1: Create example configuration; the same text is written to the file and printed
+    yaml_text = example_config_yaml()
     
     # Write to temporary file for demonstration
     with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        yaml.dump(config, f, default_flow_style=False)
+        f.write(yaml_text)
         config_path = f.name
     
     print(f"📝 Example configuration created at: {config_path}")
     print("\n📋 Configuration structure:")
-    print(yaml.dump(config, default_flow_style=False))
+    print(yaml_text)
     
     try:
         # Step 2: Test GitHub App authentication (will fail with example data)
@@ -113,10 +126,11 @@ def example_github_app_permissions():
         ]
     }
     
+    lines = []
     for category, perms in permissions.items():
-        print(f"\n📋 {category}:")
-        for perm in perms:
-            print(f"  • {perm}")
+        lines.append(f"\n📋 {category}:")
+        lines.extend(f"  • {perm}" for perm in perms)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def example_github_app_creation():
@@ -138,12 +152,12 @@ def example_github_app_creation():
         "7. Note the App ID, Client ID, and Client Secret"
     ]
     
-    for step in steps:
-        print(f"  {step}")
-    
-    print(f"\n📝 Configuration file location:")
-    print(f"  Default: ~/github/apps.yaml")
-    print(f"  Custom: Use --github-app-config flag")
+    sys.stdout.write("\n".join([
+        *(f"  {step}" for step in steps),
+        "\n📝 Configuration file location:",
+        "  Default: ~/github/apps.yaml",
+        "  Custom: Use --github-app-config flag",
+    ]) + "\n")
 
 
 def example_configuration_formats():
@@ -7,6 +7,7 @@ and resource management features for efficient batch operations.
 """
 
 import asyncio
+import contextlib
 import logging
 from datetime import datetime
 from typing import List
@@ -63,63 +64,60 @@ async def demonstrate_memory_monitoring():
 
 async def demonstrate_streaming_processing():
     """Demonstrate streaming batch processing."""
-    print("\n=== Streaming Processing Demo ===")
+    # The demo output is collected and written in one go at the end
+    lines = ["\n=== Streaming Processing Demo ==="]
     
     # Create mock GitHub client
-    github_client = AsyncGitHubClient("fake-token")
-    
-    # Configure streaming
-    streaming_config = StreamingConfig(
-        chunk_size=5,
-        max_memory_per_chunk_mb=50.0,
-        enable_memory_monitoring=True,
-        stream_threshold=10,
-        max_concurrent_chunks=2
-    )
-    
-    # Create streaming processor
-    processor = StreamingBatchProcessor(
-        github_client,
-        streaming_config
-    )
-    
-    # Create sample requests
-    sample_repo = Repository(
-        name="test-repo",
-        full_name="owner/test-repo",
-        default_branch="main",
-        archived=False,
-        updated_at=datetime.now()
-    )
-    
-    requests = [
-        BatchRequest(
-            repo=sample_repo,
-            file_path=f"file_{i}.txt",
-            priority=1,
-            estimated_size=1024 * i
+    async with AsyncGitHubClient("fake-token") as github_client:
+        # Configure streaming
+        streaming_config = StreamingConfig(
+            chunk_size=5,
+            max_memory_per_chunk_mb=50.0,
+            enable_memory_monitoring=True,
+            stream_threshold=10,
+            max_concurrent_chunks=2
         )
-        for i in range(1, 16)  # 15 requests
-    ]
-    
-    # Check if streaming should be used
-    should_stream = await processor.should_use_streaming(requests)
-    print(f"Should use streaming for {len(requests)} requests: {should_stream}")
-    
-    # Create chunks
-    chunks = processor.create_chunks(requests)
-    print(f"Created {len(chunks)} chunks")
-    for i, chunk in enumerate(chunks):
-        print(f"  Chunk {i}: {len(chunk)} requests")
-    
-    # Estimate memory usage
-    estimated_memory = await processor.estimate_memory_usage(requests)
-    print(f"Estimated memory usage: {estimated_memory:.2f} MB")
+        
+        # Create streaming processor
+        processor = StreamingBatchProcessor(
+            github_client,
+            streaming_config
+        )
+        
+        # Create sample requests
+        sample_repo = Repository(
+            name="test-repo",
+            full_name="owner/test-repo",
+            default_branch="main",
+            archived=False,
+            updated_at=datetime.now()
+        )
+        
+        # Requests are generated on demand; positional arguments are
+        # (repo, file_path, priority, estimated_size)
+        def request_stream():
+            for i in range(1, 16):  # 15 requests
+                yield BatchRequest(sample_repo, f"file_{i}.txt", 1, 1024 * i)
+        
+        # Requests are grouped into chunks as they are generated, so the full
+        # request list is never built; only the chunk being filled is held
+        chunk_count = 0
+        request_count = 0
+        estimated_memory = 0.0
+        async for chunk in processor.chunk_request_stream(request_stream()):
+            lines.append(f"  Chunk {chunk_count}: {len(chunk)} requests")
+            chunk_count += 1
+            request_count += len(chunk)
+            estimated_memory += processor.estimate_memory_usage(chunk)
+        lines.append(f"Streamed {request_count} requests in {chunk_count} chunks")
+        lines.append(f"Estimated memory usage: {estimated_memory:.2f} MB")
+        
+        # Get streaming statistics
+        stats = processor.get_streaming_stats()
+        lines.append(f"Streaming config: chunk_size={stats['config']['chunk_size']}, "
+                     f"threshold={stats['config']['stream_threshold']}")
     
-    # Get streaming statistics
-    stats = processor.get_streaming_stats()
-    print(f"Streaming config: chunk_size={stats['config']['chunk_size']}, "
-          f"threshold={stats['config']['stream_threshold']}")
+    print("\n".join(lines))
 
 
 async def demonstrate_resource_management():
@@ -135,18 +133,25 @@ async def demonstrate_resource_management():
         force_gc_on_cleanup=True
     )
     
-    manager = ResourceManager(config)
-    
-    # Demonstrate managed resource context
-    print("Creating managed resources...")
-    
-    async with manager.managed_resource("demo-resource-1") as resource1:
-        print(f"Created resource: {resource1.resource_id}")
+    async with ResourceManager(config) as manager:
+        # Demonstrate managed resource context
+        print("Creating managed resources...")
         
-        async with manager.managed_batch_resource(
-            "demo-batch-resource",
-            batch_data={"demo": "data"}
-        ) as batch_resource:
+        # One exit stack instead of nested blocks; the group of plain resources
+        # is cleaned up concurrently when the stack unwinds
+        async with contextlib.AsyncExitStack() as stack:
+            resources = await stack.enter_async_context(
+                manager.managed_resources([f"demo-resource-{i}" for i in range(1, 4)])
+            )
+            for resource in resources:
+                print(f"Created resource: {resource.resource_id}")
+            
+            batch_resource = await stack.enter_async_context(
+                manager.managed_batch_resource(
+                    "demo-batch-resource",
+                    batch_data={"demo": "data"}
+                )
+            )
             print(f"Created batch resource: {batch_resource.resource_id}")
             batch_resource.results.extend([1, 2, 3])
             
@@ -154,23 +159,17 @@ async def demonstrate_resource_management():
             stats = manager.get_resource_stats()
             print(f"Active resources: {stats['resource_stats']['active_resources']}")
             print(f"Total created: {stats['resource_stats']['total_resources_created']}")
-    
-    # Resources should be cleaned up automatically
-    final_stats = manager.get_resource_stats()
-    print(f"Final active resources: {final_stats['resource_stats']['active_resources']}")
-    print(f"Total cleaned: {final_stats['resource_stats']['total_resources_cleaned']}")
-    
-    # Shutdown resource manager
-    await manager.shutdown()
+        
+        # Resources should be cleaned up automatically
+        final_stats = manager.get_resource_stats()
+        print(f"Final active resources: {final_stats['resource_stats']['active_resources']}")
+        print(f"Total cleaned: {final_stats['resource_stats']['total_resources_cleaned']}")
 
 
 async def demonstrate_integrated_processing():
     """Demonstrate integrated memory-efficient batch processing."""
     print("\n=== Integrated Processing Demo ===")
     
-    # Create mock GitHub client
-    github_client = AsyncGitHubClient("fake-token")
-    
     # Configure batch processing with memory efficiency
     batch_config = BatchConfig(
         max_concurrent_requests=5,
@@ -180,27 +179,25 @@ async def demonstrate_integrated_processing():
         retry_attempts=2
     )
     
-    # Create processor with memory monitoring
-    processor = ParallelBatchProcessor(github_client, batch_config)
-    
-    # Get initial memory stats
-    memory_stats = processor.get_memory_stats()
-    print(f"Initial memory usage: {memory_stats['current_stats']['memory_usage_percent']:.1f}%")
-    
-    # Check memory pressure
-    should_reduce, is_critical = processor.check_memory_pressure()
-    print(f"Memory pressure - should reduce: {should_reduce}, critical: {is_critical}")
-    
-    # Get resource statistics
-    resource_stats = processor.get_resource_stats()
-    print(f"Resource manager active: {resource_stats['resource_stats']['active_resources']}")
-    
-    # Demonstrate cleanup
-    cleanup_stats = await processor.cleanup_resources()
-    print(f"Cleanup performed - freed {cleanup_stats.get('memory_freed_mb', 0):.2f} MB")
-    
-    # Shutdown processor
-    await processor.shutdown_processor()
+    # Create mock GitHub client and processor with memory monitoring; both are
+    # shut down when the block exits
+    async with AsyncGitHubClient("fake-token") as github_client, \
+            ParallelBatchProcessor(github_client, batch_config) as processor:
+        # Get initial memory stats
+        memory_stats = processor.get_memory_stats()
+        print(f"Initial memory usage: {memory_stats['current_stats']['memory_usage_percent']:.1f}%")
+        
+        # Check memory pressure
+        should_reduce, is_critical = processor.check_memory_pressure()
+        print(f"Memory pressure - should reduce: {should_reduce}, critical: {is_critical}")
+        
+        # Get resource statistics
+        resource_stats = processor.get_resource_stats()
+        print(f"Resource manager active: {resource_stats['resource_stats']['active_resources']}")
+        
+        # Demonstrate cleanup
+        cleanup_stats = await processor.cleanup_resources()
+        print(f"Cleanup performed - freed {cleanup_stats.get('memory_freed_mb', 0):.2f} MB")
     print("Processor shutdown complete")
 
 
@@ -225,4 +222,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # uvloop (from the speedups extra) is a faster drop-in event loop
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    asyncio.run(main())
@@ -7,10 +7,13 @@ how to optimize scanning for large organizations.
 """
 
 import asyncio
+import bisect
+import math
 import os
 import sys
 import time
-from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Mapping, Tuple
 
 # Add the src directory to the path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -18,13 +21,162 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 from github_ioc_scanner.github_client import GitHubClient
 from github_ioc_scanner.improved_rate_limiting import get_rate_limiter
 from github_ioc_scanner.batch_models import BatchConfig
-from github_ioc_scanner.logging_config import setup_logging, get_logger
+from github_ioc_scanner.logging_config import setup_logging, get_logger, format_reset_timestamp
 
-# Setup logging
-setup_logging()
+# Setup logging; records are written from a background thread
+setup_logging(non_blocking=True)
 logger = get_logger(__name__)
 
 
+# Batch profiles ordered by the largest organization (repository count) they suit
+BATCH_PROFILE_MAX_REPOS = (100, 1000, math.inf)
+BATCH_PROFILE_SETTINGS = (
+    # Aggressive configuration for small scans
+    ("Aggressive (Small Orgs)", dict(
+        max_concurrent_requests=8,
+        max_concurrent_repos=3,
+        default_batch_size=15,
+        rate_limit_buffer=0.8,  # Use 80% of rate limit
+        retry_delay_base=1.0,
+        enable_proactive_rate_limiting=True,
+        rate_limit_safety_margin=50,
+        adaptive_delay_enabled=True
+    )),
+    # Balanced configuration for normal scanning
+    ("Balanced (Medium Orgs)", dict(
+        max_concurrent_requests=5,
+        max_concurrent_repos=2,
+        default_batch_size=10,
+        rate_limit_buffer=0.6,  # Use 60% of rate limit
+        retry_delay_base=2.0,
+        enable_proactive_rate_limiting=True,
+        rate_limit_safety_margin=100,
+        adaptive_delay_enabled=True
+    )),
+    # Conservative configuration for rate limit sensitive scanning
+    ("Conservative (Large Orgs)", dict(
+        max_concurrent_requests=3,
+        max_concurrent_repos=1,
+        default_batch_size=5,
+        rate_limit_buffer=0.5,  # Use only 50% of rate limit
+        retry_delay_base=3.0,
+        enable_proactive_rate_limiting=True,
+        rate_limit_safety_margin=200,
+        adaptive_delay_enabled=True
+    )),
+)
+
+
+# Static demo content, built once at import
+RATE_LIMIT_STRATEGIES: Tuple[Mapping[str, Any], ...] = (
+    MappingProxyType({
+        "name": "Reactive Only",
+        "description": "Wait only when rate limit is exceeded",
+        "pros": ("Fast when limits available", "Simple implementation"),
+        "cons": ("Frequent rate limit hits", "Unpredictable delays"),
+        "use_case": "Small, infrequent scans"
+    }),
+    MappingProxyType({
+        "name": "Proactive",
+        "description": "Slow down as rate limit approaches",
+        "pros": ("Prevents rate limit hits", "Smoother operation"),
+        "cons": ("Slightly slower overall", "More complex"),
+        "use_case": "Regular, automated scans"
+    }),
+    MappingProxyType({
+        "name": "Adaptive",
+        "description": "Learn from rate limit patterns and adjust",
+        "pros": ("Optimal performance", "Self-tuning"),
+        "cons": ("Complex implementation", "Learning period"),
+        "use_case": "Large-scale, continuous scanning"
+    }),
+)
+
+CLI_OPTIMIZATION_TIPS: Tuple[Mapping[str, str], ...] = (
+    MappingProxyType({
+        "scenario": "Large Organization (1000+ repos)",
+        "command": "github-ioc-scan --org large-org --batch-strategy conservative --max-concurrent 3",
+        "explanation": "Use conservative settings to avoid rate limits"
+    }),
+    MappingProxyType({
+        "scenario": "Medium Organization (100-1000 repos)",
+        "command": "github-ioc-scan --org medium-org --batch-strategy adaptive --max-concurrent 5",
+        "explanation": "Balanced approach with adaptive rate limiting"
+    }),
+    MappingProxyType({
+        "scenario": "Small Organization (<100 repos)",
+        "command": "github-ioc-scan --org small-org --batch-strategy aggressive --max-concurrent 8",
+        "explanation": "Faster scanning with higher concurrency"
+    }),
+    MappingProxyType({
+        "scenario": "Rate Limit Issues",
+        "command": "github-ioc-scan --org any-org --batch-size 5 --max-concurrent 2 --enable-cross-repo-batching",
+        "explanation": "Minimal concurrency with intelligent batching"
+    }),
+    MappingProxyType({
+        "scenario": "Fast Mode for Quick Check",
+        "command": "github-ioc-scan --org any-org --fast --sbom-only",
+        "explanation": "Scan only root-level SBOM files for quick assessment"
+    }),
+)
+
+MONITORING_OVERVIEW = "\n".join((
+    "The improved rate limiter provides several monitoring features:",
+    "",
+    "1. Real-time Rate Limit Status:",
+    "   🚨 Critical (≤3 remaining): Long delays, urgent warnings",
+    "   🐌 Very Low (≤10 remaining): Significant delays",
+    "   ⏳ Low (≤25 remaining): Moderate delays",
+    "   ⚠️  Moderate (≤50 remaining): Small delays",
+    "   ✅ Good (>50 remaining): Minimal delays",
+    "",
+    "2. Adaptive Learning:",
+    "   - Tracks consecutive low-limit periods",
+    "   - Adjusts delays based on patterns",
+    "   - Gradually recovers when limits improve",
+    "",
+    "3. Logging Levels:",
+    "   - ERROR: Rate limit exceeded",
+    "   - WARNING: Critical rate limit status",
+    "   - INFO: Very low rate limits",
+    "   - DEBUG: Low/moderate rate limits",
+)) + "\n"
+
+MAIN_BANNER = "\n".join((
+    "🛡️  GitHub IOC Scanner - Rate Limit Optimization",
+    "=" * 55,
+    "This example demonstrates improved rate limiting features",
+    "and optimization strategies for large-scale scanning.",
+    "",
+))
+
+COMPLETION_SUMMARY = "\n".join((
+    "\n" + "=" * 55,
+    "✅ Rate Limit Optimization Demonstration Complete!",
+    "",
+    "Key Improvements:",
+    "  • Proactive rate limiting prevents API exhaustion",
+    "  • Adaptive delays learn from usage patterns",
+    "  • Conservative batch configurations for large orgs",
+    "  • Enhanced monitoring and logging",
+    "  • Separate handling for Code Search API limits",
+    "",
+    "Recommended Settings for Your Scan:",
+    "  # For large organizations (like yours with 6000+ repos)",
+    "  github-ioc-scan --org your-org \\",
+    "    --batch-strategy conservative \\",
+    "    --max-concurrent 2 \\",
+    "    --batch-size 5 \\",
+    "    --enable-cross-repo-batching",
+))
+
+
+def batch_config_for_org_size(repo_count: int) -> BatchConfig:
+    """Pick the batch profile suited to an organization with repo_count repositories."""
+    index = bisect.bisect_left(BATCH_PROFILE_MAX_REPOS, repo_count)
+    return BatchConfig(**BATCH_PROFILE_SETTINGS[index][1])
+
+
 def demonstrate_rate_limit_monitoring():
     """Demonstrate rate limit monitoring and adaptive delays."""
     print("🔍 Rate Limit Monitoring Demonstration")
@@ -34,24 +186,27 @@ def demonstrate_rate_limit_monitoring():
         # Initialize GitHub client
         github_client = GitHubClient()
         
-        # Get current rate limit status
-        response = github_client._make_request("GET", "/rate_limit")
+        # Use the budget reported in recent response headers, and only ask the
+        # /rate_limit endpoint when none have been seen in the last minute
+        core_limits = github_client.get_cached_rate_limit("core")
+        search_limits = github_client.get_cached_rate_limit("search")
+        if core_limits is None or search_limits is None:
+            response = github_client._make_request("GET", "/rate_limit")
+            resources = (response.data or {}).get('resources', {})
+            core_limits = core_limits or resources.get('core')
+            search_limits = search_limits or resources.get('search')
         
-        if response.data:
-            rate_limit_info = response.data
-            core_limits = rate_limit_info.get('resources', {}).get('core', {})
-            search_limits = rate_limit_info.get('resources', {}).get('search', {})
-            
+        if core_limits and search_limits:
             print("Current Rate Limit Status:")
             print(f"  Core API:")
             print(f"    Limit: {core_limits.get('limit', 'Unknown')}")
             print(f"    Remaining: {core_limits.get('remaining', 'Unknown')}")
-            print(f"    Reset: {datetime.fromtimestamp(core_limits.get('reset', 0))}")
+            print(f"    Reset: {format_reset_timestamp(core_limits.get('reset', 0))}")
             
             print(f"  Search API:")
             print(f"    Limit: {search_limits.get('limit', 'Unknown')}")
             print(f"    Remaining: {search_limits.get('remaining', 'Unknown')}")
-            print(f"    Reset: {datetime.fromtimestamp(search_limits.get('reset', 0))}")
+            print(f"    Reset: {format_reset_timestamp(search_limits.get('reset', 0))}")
             
             # Demonstrate rate limiter recommendations
             rate_limiter = get_rate_limiter()
@@ -73,47 +228,7 @@ def demonstrate_optimized_batch_config():
     print("\n⚙️  Optimized Batch Configuration")
     print("=" * 35)
     
-    # Conservative configuration for rate limit sensitive scanning
-    conservative_config = BatchConfig(
-        max_concurrent_requests=3,
-        max_concurrent_repos=1,
-        default_batch_size=5,
-        rate_limit_buffer=0.5,  # Use only 50% of rate limit
-        retry_delay_base=3.0,
-        enable_proactive_rate_limiting=True,
-        rate_limit_safety_margin=200,
-        adaptive_delay_enabled=True
-    )
-    
-    # Balanced configuration for normal scanning
-    balanced_config = BatchConfig(
-        max_concurrent_requests=5,
-        max_concurrent_repos=2,
-        default_batch_size=10,
-        rate_limit_buffer=0.6,  # Use 60% of rate limit
-        retry_delay_base=2.0,
-        enable_proactive_rate_limiting=True,
-        rate_limit_safety_margin=100,
-        adaptive_delay_enabled=True
-    )
-    
-    # Aggressive configuration for small scans
-    aggressive_config = BatchConfig(
-        max_concurrent_requests=8,
-        max_concurrent_repos=3,
-        default_batch_size=15,
-        rate_limit_buffer=0.8,  # Use 80% of rate limit
-        retry_delay_base=1.0,
-        enable_proactive_rate_limiting=True,
-        rate_limit_safety_margin=50,
-        adaptive_delay_enabled=True
-    )
-    
-    configs = [
-        ("Conservative (Large Orgs)", conservative_config),
-        ("Balanced (Medium Orgs)", balanced_config),
-        ("Aggressive (Small Orgs)", aggressive_config)
-    ]
+    configs = [(name, BatchConfig(**settings)) for name, settings in BATCH_PROFILE_SETTINGS]
     
     for name, config in configs:
         print(f"\n{name}:")
@@ -123,6 +238,11 @@ def demonstrate_optimized_batch_config():
         print(f"  Rate Limit Buffer: {config.rate_limit_buffer * 100:.0f}%")
         print(f"  Safety Margin: {config.rate_limit_safety_margin} requests")
         print(f"  Base Retry Delay: {config.retry_delay_base}s")
+    
+    repo_count = 6000
+    config = batch_config_for_org_size(repo_count)
+    print(f"\nProfile for {repo_count} repositories: "
+          f"{config.max_concurrent_requests} concurrent requests, batch size {config.default_batch_size}")
 
 
 def demonstrate_rate_limit_strategies():
@@ -130,31 +250,7 @@ def demonstrate_rate_limit_strategies():
     print("\n🚦 Rate Limiting Strategies")
     print("=" * 30)
     
-    strategies = [
-        {
-            "name": "Reactive Only",
-            "description": "Wait only when rate limit is exceeded",
-            "pros": ["Fast when limits available", "Simple implementation"],
-            "cons": ["Frequent rate limit hits", "Unpredictable delays"],
-            "use_case": "Small, infrequent scans"
-        },
-        {
-            "name": "Proactive",
-            "description": "Slow down as rate limit approaches",
-            "pros": ["Prevents rate limit hits", "Smoother operation"],
-            "cons": ["Slightly slower overall", "More complex"],
-            "use_case": "Regular, automated scans"
-        },
-        {
-            "name": "Adaptive",
-            "description": "Learn from rate limit patterns and adjust",
-            "pros": ["Optimal performance", "Self-tuning"],
-            "cons": ["Complex implementation", "Learning period"],
-            "use_case": "Large-scale, continuous scanning"
-        }
-    ]
-    
-    for strategy in strategies:
+    for strategy in RATE_LIMIT_STRATEGIES:
         print(f"\n{strategy['name']} Strategy:")
         print(f"  Description: {strategy['description']}")
         print(f"  Pros: {', '.join(strategy['pros'])}")
@@ -167,35 +263,7 @@ def demonstrate_cli_optimizations():
     print("\n💡 CLI Optimization Tips")
     print("=" * 25)
     
-    tips = [
-        {
-            "scenario": "Large Organization (1000+ repos)",
-            "command": "github-ioc-scan --org large-org --batch-strategy conservative --max-concurrent 3",
-            "explanation": "Use conservative settings to avoid rate limits"
-        },
-        {
-            "scenario": "Medium Organization (100-1000 repos)",
-            "command": "github-ioc-scan --org medium-org --batch-strategy adaptive --max-concurrent 5",
-            "explanation": "Balanced approach with adaptive rate limiting"
-        },
-        {
-            "scenario": "Small Organization (<100 repos)",
-            "command": "github-ioc-scan --org small-org --batch-strategy aggressive --max-concurrent 8",
-            "explanation": "Faster scanning with higher concurrency"
-        },
-        {
-            "scenario": "Rate Limit Issues",
-            "command": "github-ioc-scan --org any-org --batch-size 5 --max-concurrent 2 --enable-cross-repo-batching",
-            "explanation": "Minimal concurrency with intelligent batching"
-        },
-        {
-            "scenario": "Fast Mode for Quick Check",
-            "command": "github-ioc-scan --org any-org --fast --sbom-only",
-            "explanation": "Scan only root-level SBOM files for quick assessment"
-        }
-    ]
-    
-    for tip in tips:
+    for tip in CLI_OPTIMIZATION_TIPS:
         print(f"\n{tip['scenario']}:")
         print(f"  Command: {tip['command']}")
         print(f"  Why: {tip['explanation']}")
@@ -206,34 +274,12 @@ def demonstrate_monitoring_and_alerts():
     print("\n📊 Rate Limit Monitoring")
     print("=" * 25)
     
-    print("The improved rate limiter provides several monitoring features:")
-    print()
-    print("1. Real-time Rate Limit Status:")
-    print("   🚨 Critical (≤3 remaining): Long delays, urgent warnings")
-    print("   🐌 Very Low (≤10 remaining): Significant delays")
-    print("   ⏳ Low (≤25 remaining): Moderate delays")
-    print("   ⚠️  Moderate (≤50 remaining): Small delays")
-    print("   ✅ Good (>50 remaining): Minimal delays")
-    print()
-    print("2. Adaptive Learning:")
-    print("   - Tracks consecutive low-limit periods")
-    print("   - Adjusts delays based on patterns")
-    print("   - Gradually recovers when limits improve")
-    print()
-    print("3. Logging Levels:")
-    print("   - ERROR: Rate limit exceeded")
-    print("   - WARNING: Critical rate limit status")
-    print("   - INFO: Very low rate limits")
-    print("   - DEBUG: Low/moderate rate limits")
+    sys.stdout.write(MONITORING_OVERVIEW)
 
 
 def main():
     """Main demonstration function."""
-    print("🛡️  GitHub IOC Scanner - Rate Limit Optimization")
-    print("=" * 55)
-    print("This example demonstrates improved rate limiting features")
-    print("and optimization strategies for large-scale scanning.")
-    print()
+    print(MAIN_BANNER)
     
     try:
         demonstrate_rate_limit_monitoring()
@@ -242,23 +288,7 @@ def main():
         demonstrate_cli_optimizations()
         demonstrate_monitoring_and_alerts()
         
-        print("\n" + "=" * 55)
-        print("✅ Rate Limit Optimization Demonstration Complete!")
-        print()
-        print("Key Improvements:")
-        print("  • Proactive rate limiting prevents API exhaustion")
-        print("  • Adaptive delays learn from usage patterns")
-        print("  • Conservative batch configurations for large orgs")
-        print("  • Enhanced monitoring and logging")
-        print("  • Separate handling for Code Search API limits")
-        
-        print("\nRecommended Settings for Your Scan:")
-        print("  # For large organizations (like yours with 6000+ repos)")
-        print("  github-ioc-scan --org your-org \\")
-        print("    --batch-strategy conservative \\")
-        print("    --max-concurrent 2 \\")
-        print("    --batch-size 5 \\")
-        print("    --enable-cross-repo-batching")
+        print(COMPLETION_SUMMARY)
         
     except Exception as e:
         logger.error(f"Demonstration failed: {e}")
@@ -10,10 +10,22 @@ import asyncio
 import json
 import os
 import sys
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
 
-# Add the src directory to the path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Use the installed package; only fall back to the source tree when running
+# from a checkout without `pip install -e .`
+try:
+    import github_ioc_scanner  # noqa: F401
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
 from github_ioc_scanner.scanner import GitHubIOCScanner
 from github_ioc_scanner.models import ScanConfig, Repository
@@ -21,15 +33,28 @@ from github_ioc_scanner.cache import CacheManager
 from github_ioc_scanner.github_client import GitHubClient
 from github_ioc_scanner.ioc_loader import IOCLoader
 from github_ioc_scanner.logging_config import setup_logging, get_logger
+from github_ioc_scanner.parsers.sbom import SBOM_FILE_PATTERN, get_sbom_parser
+from github_ioc_scanner.batch_models import BatchConfig
 
 # Setup logging
 setup_logging()
 logger = get_logger(__name__)
 
 
+def _dumps_indented(data) -> str:
+    """Serialize sample data as indented JSON, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
 def create_sample_sbom_files():
     """Create sample SBOM files for demonstration."""
     
+    # One UTC timestamp shared by both documents
+    now = datetime.now(timezone.utc)
+    created_at = now.isoformat(timespec='seconds').replace('+00:00', 'Z')
+    
     # Sample SPDX JSON SBOM
     spdx_sbom = {
         "spdxVersion": "SPDX-2.3",
@@ -38,7 +63,7 @@ def create_sample_sbom_files():
         "name": "MyProject-SBOM",
         "documentNamespace": "https://example.com/sbom/myproject",
         "creationInfo": {
-            "created": datetime.now().isoformat() + "Z",
+            "created": created_at,
             "creators": ["Tool: github-ioc-scanner-example"]
         },
         "packages": [
@@ -73,10 +98,10 @@ def create_sample_sbom_files():
     cyclonedx_sbom = {
         "bomFormat": "CycloneDX",
         "specVersion": "1.4",
-        "serialNumber": f"urn:uuid:example-{datetime.now().strftime('%Y%m%d-%H%M%S')}",
+        "serialNumber": f"urn:uuid:example-{now.strftime('%Y%m%d-%H%M%S')}",
         "version": 1,
         "metadata": {
-            "timestamp": datetime.now().isoformat() + "Z",
+            "timestamp": created_at,
             "tools": [
                 {
                     "vendor": "GitHub IOC Scanner",
@@ -130,53 +155,51 @@ def create_sample_sbom_files():
     }
     
     return {
-        "spdx_sbom.json": json.dumps(spdx_sbom, indent=2),
-        "cyclonedx_bom.json": json.dumps(cyclonedx_sbom, indent=2)
+        "spdx_sbom.json": _dumps_indented(spdx_sbom),
+        "cyclonedx_bom.json": _dumps_indented(cyclonedx_sbom)
     }
 
 
 def demonstrate_sbom_scanning_modes():
     """Demonstrate different SBOM scanning modes."""
     
-    print("🔍 SBOM Scanning Modes Demonstration")
-    print("=" * 50)
+    # Each demo collects its output and writes it once at the end
+    lines = ["🔍 SBOM Scanning Modes Demonstration", "=" * 50]
     
     # Mode 1: Default (lockfiles + SBOM)
-    print("\n1. Default Mode: Scan both lockfiles and SBOM files")
+    lines.append("\n1. Default Mode: Scan both lockfiles and SBOM files")
     config_default = ScanConfig(
         org="example-org",
         repo="example-repo",
         enable_sbom=True  # This is the default
     )
-    print(f"   Config: enable_sbom={config_default.enable_sbom}")
+    lines.append(f"   Config: enable_sbom={config_default.enable_sbom}")
     
     # Mode 2: SBOM only
-    print("\n2. SBOM-Only Mode: Scan only SBOM files")
+    lines.append("\n2. SBOM-Only Mode: Scan only SBOM files")
     config_sbom_only = ScanConfig(
         org="example-org", 
         repo="example-repo",
         sbom_only=True
     )
-    print(f"   Config: sbom_only={config_sbom_only.sbom_only}")
+    lines.append(f"   Config: sbom_only={config_sbom_only.sbom_only}")
     
     # Mode 3: Disable SBOM
-    print("\n3. Lockfiles-Only Mode: Disable SBOM scanning")
+    lines.append("\n3. Lockfiles-Only Mode: Disable SBOM scanning")
     config_no_sbom = ScanConfig(
         org="example-org",
         repo="example-repo", 
         disable_sbom=True
     )
-    print(f"   Config: disable_sbom={config_no_sbom.disable_sbom}")
+    lines.append(f"   Config: disable_sbom={config_no_sbom.disable_sbom}")
+    
+    print("\n".join(lines))
 
 
 def demonstrate_sbom_file_patterns():
     """Demonstrate SBOM file pattern recognition."""
     
-    print("\n🎯 SBOM File Pattern Recognition")
-    print("=" * 40)
-    
-    from github_ioc_scanner.parsers.sbom import SBOMParser
-    parser = SBOMParser()
+    lines = ["\n🎯 SBOM File Pattern Recognition", "=" * 40]
     
     test_files = [
         "sbom.json",
@@ -192,46 +215,51 @@ def demonstrate_sbom_file_patterns():
         "random-file.txt"  # Should not match
     ]
     
-    print("File Pattern Matching Results:")
+    # Classify every file with the parser's precompiled pattern up front
+    sbom_files = set(filter(SBOM_FILE_PATTERN.search, test_files))
+    
+    lines.append("File Pattern Matching Results:")
     for file_path in test_files:
-        is_sbom = parser.can_parse(file_path)
+        is_sbom = file_path in sbom_files
         status = "✅ SBOM" if is_sbom else "❌ Not SBOM"
-        print(f"  {file_path:<35} {status}")
+        lines.append(f"  {file_path:<35} {status}")
+    
+    print("\n".join(lines))
 
 
 def demonstrate_sbom_parsing():
     """Demonstrate SBOM parsing capabilities."""
     
-    print("\n📋 SBOM Parsing Demonstration")
-    print("=" * 35)
+    lines = ["\n📋 SBOM Parsing Demonstration", "=" * 35]
     
-    from github_ioc_scanner.parsers.sbom import SBOMParser
-    parser = SBOMParser()
+    parser = get_sbom_parser()
     
     sample_files = create_sample_sbom_files()
     
-    for filename, content in sample_files.items():
-        print(f"\nParsing {filename}:")
-        print("-" * (len(filename) + 9))
-        
-        packages = parser.parse(content, filename)
+    # The shared parser keeps no per-parse state, so it can serve every
+    # worker; map() hands results back in sample order for printing
+    with ThreadPoolExecutor(max_workers=min(len(sample_files), os.cpu_count() or 1)) as executor:
+        parsed = executor.map(parser.parse, sample_files.values(), sample_files.keys())
         
-        print(f"Found {len(packages)} packages:")
-        for pkg in packages:
-            print(f"  • {pkg.name} v{pkg.version} ({pkg.dependency_type})")
+        for filename, packages in zip(sample_files, parsed):
+            lines.append(f"\nParsing {filename}:")
+            lines.append("-" * (len(filename) + 9))
+            
+            lines.append(f"Found {len(packages)} packages:")
+            for pkg in packages:
+                lines.append(f"  • {pkg.name} v{pkg.version} ({pkg.dependency_type})")
+    
+    print("\n".join(lines))
 
 
 async def demonstrate_batch_sbom_scanning():
     """Demonstrate batch SBOM scanning with async processing."""
     
-    print("\n⚡ Batch SBOM Scanning Demonstration")
-    print("=" * 40)
+    lines = ["\n⚡ Batch SBOM Scanning Demonstration", "=" * 40]
     
     # This would require actual GitHub credentials and repositories
     # For demonstration, we'll show the configuration
     
-    from github_ioc_scanner.batch_models import BatchConfig
-    
     batch_config = BatchConfig(
         default_batch_size=10,
         max_concurrent_requests=5,
@@ -245,63 +273,74 @@ async def demonstrate_batch_sbom_scanning():
         max_concurrent=batch_config.max_concurrent_requests
     )
     
-    print("Batch Configuration for SBOM Scanning:")
-    print(f"  • Batch Size: {batch_config.default_batch_size}")
-    print(f"  • Max Concurrent: {batch_config.max_concurrent_requests}")
-    print(f"  • Cross-Repo Batching: {batch_config.enable_cross_repo_batching}")
-    print(f"  • SBOM Enabled: {config.enable_sbom}")
+    lines.append("Batch Configuration for SBOM Scanning:")
+    lines.append(f"  • Batch Size: {batch_config.default_batch_size}")
+    lines.append(f"  • Max Concurrent: {batch_config.max_concurrent_requests}")
+    lines.append(f"  • Cross-Repo Batching: {batch_config.enable_cross_repo_batching}")
+    lines.append(f"  • SBOM Enabled: {config.enable_sbom}")
     
-    print("\nNote: This would scan multiple repositories concurrently,")
-    print("      processing both traditional lockfiles and SBOM files")
-    print("      with intelligent caching and rate limiting.")
+    lines.append("\nNote: This would scan multiple repositories concurrently,")
+    lines.append("      processing both traditional lockfiles and SBOM files")
+    lines.append("      with intelligent caching and rate limiting.")
+    
+    print("\n".join(lines))
 
 
 def demonstrate_sbom_caching():
     """Demonstrate SBOM caching strategies."""
     
-    print("\n💾 SBOM Caching Demonstration")
-    print("=" * 30)
-    
-    print("SBOM Caching Strategy:")
-    print("  1. File Content Caching:")
-    print("     • Cache key: file:<org>/<repo>/<path>")
-    print("     • Uses ETag for conditional requests")
-    print("     • Avoids re-downloading unchanged SBOM files")
-    
-    print("\n  2. Parsed Package Caching:")
-    print("     • Cache key: sbom_packages:<org>/<repo>:<path>")
-    print("     • Caches parsed package lists by file SHA")
-    print("     • Avoids re-parsing unchanged SBOM content")
-    
-    print("\n  3. Scan Results Caching:")
-    print("     • Cache key: sbom:<org>/<repo>:<path>")
-    print("     • Caches IOC match results by file SHA + IOC hash")
-    print("     • Avoids re-scanning with same IOC definitions")
-    
-    print("\n  4. Cross-Repository Optimization:")
-    print("     • Shared package metadata across repositories")
-    print("     • Intelligent cache warming for common packages")
-    print("     • Batch cache operations for performance")
+    lines = ["\n💾 SBOM Caching Demonstration", "=" * 30]
+    
+    lines.append("SBOM Caching Strategy:")
+    lines.append("  1. File Content Caching:")
+    lines.append("     • Cache key: file:<org>/<repo>/<path>")
+    lines.append("     • Uses ETag for conditional requests")
+    lines.append("     • Avoids re-downloading unchanged SBOM files")
+    
+    lines.append("\n  2. Parsed Package Caching:")
+    lines.append("     • Cache key: sbom_packages:<org>/<repo>:<path>")
+    lines.append("     • Caches parsed package lists by file SHA")
+    lines.append("     • Avoids re-parsing unchanged SBOM content")
+    
+    lines.append("\n  3. Scan Results Caching:")
+    lines.append("     • Cache key: sbom:<org>/<repo>:<path>")
+    lines.append("     • Caches IOC match results by file SHA + IOC hash")
+    lines.append("     • Avoids re-scanning with same IOC definitions")
+    
+    lines.append("\n  4. Cross-Repository Optimization:")
+    lines.append("     • Shared package metadata across repositories")
+    lines.append("     • Intelligent cache warming for common packages")
+    lines.append("     • Batch cache operations for performance")
+    
+    print("\n".join(lines))
+
+
+# Sample IOC definitions (these would come from the issues directory)
+SAMPLE_IOCS = {
+    "malicious-packages": {
+        "express": ["4.17.0", "4.17.1"],  # Vulnerable versions
+        "lodash": ["4.17.20"],  # Vulnerable version
+        "requests": ["2.25.0", "2.25.1"]  # Vulnerable versions
+    },
+    "suspicious-patterns": {
+        "crypto-mining": ["*"],  # Any version suspicious
+        "data-exfiltration": ["*"]
+    }
+}
+
+# Flattened lookup tables so each package needs a single membership test
+BAD_EXACT = frozenset(
+    (name, version)
+    for name, versions in SAMPLE_IOCS["malicious-packages"].items()
+    for version in versions
+)
+BAD_WILDCARD = frozenset(SAMPLE_IOCS["suspicious-patterns"])
 
 
 def demonstrate_sbom_ioc_matching():
     """Demonstrate IOC matching with SBOM packages."""
     
-    print("\n🚨 SBOM IOC Matching Demonstration")
-    print("=" * 35)
-    
-    # Sample IOC definitions (these would come from the issues directory)
-    sample_iocs = {
-        "malicious-packages": {
-            "express": ["4.17.0", "4.17.1"],  # Vulnerable versions
-            "lodash": ["4.17.20"],  # Vulnerable version
-            "requests": ["2.25.0", "2.25.1"]  # Vulnerable versions
-        },
-        "suspicious-patterns": {
-            "crypto-mining": ["*"],  # Any version suspicious
-            "data-exfiltration": ["*"]
-        }
-    }
+    lines = ["\n🚨 SBOM IOC Matching Demonstration", "=" * 35]
     
     # Sample SBOM packages
     sbom_packages = [
@@ -311,9 +350,9 @@ def demonstrate_sbom_ioc_matching():
         {"name": "react", "version": "18.2.0", "type": "npm"}
     ]
     
-    print("IOC Matching Results:")
-    print("Package Name        Version    Status")
-    print("-" * 45)
+    lines.append("IOC Matching Results:")
+    lines.append("Package Name        Version    Status")
+    lines.append("-" * 45)
     
     for pkg in sbom_packages:
         name = pkg["name"]
@@ -321,19 +360,19 @@ def demonstrate_sbom_ioc_matching():
         
         # Check for exact version matches
         threat_found = False
-        if name in sample_iocs["malicious-packages"]:
-            vulnerable_versions = sample_iocs["malicious-packages"][name]
-            if version in vulnerable_versions:
-                print(f"{name:<18} {version:<10} 🚨 THREAT DETECTED")
-                threat_found = True
+        if (name, version) in BAD_EXACT:
+            lines.append(f"{name:<18} {version:<10} 🚨 THREAT DETECTED")
+            threat_found = True
         
         # Check for pattern matches
-        if name in sample_iocs["suspicious-patterns"]:
-            print(f"{name:<18} {version:<10} ⚠️  SUSPICIOUS")
+        if name in BAD_WILDCARD:
+            lines.append(f"{name:<18} {version:<10} ⚠️  SUSPICIOUS")
             threat_found = True
         
         if not threat_found:
-            print(f"{name:<18} {version:<10} ✅ Clean")
+            lines.append(f"{name:<18} {version:<10} ✅ Clean")
+    
+    print("\n".join(lines))
 
 
 def main():
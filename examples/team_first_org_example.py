@@ -16,18 +16,37 @@ This provides better organization and visibility into which teams
 have security issues that need attention.
 """
 
+import json
 import os
 import sys
 import tempfile
+from collections import defaultdict
 from pathlib import Path
 
-# Add the src directory to the Python path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Use the installed package; only fall back to the source tree when running
+# from a checkout without `pip install -e .`
+try:
+    import github_ioc_scanner  # noqa: F401
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
 from github_ioc_scanner.scanner import GitHubIOCScanner
 from github_ioc_scanner.models import ScanConfig
 
 
+def _dumps_indented(data) -> bytes:
+    """Serialize data as indented JSON bytes, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
 def main():
     """Run team-first organization scanning example."""
     
@@ -63,10 +82,9 @@ def main():
     }
     
     # Write IOCs to temporary file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        import json
-        json.dump(sample_iocs, f, indent=2)
-        ioc_file = f.name
+    fd, ioc_file = tempfile.mkstemp(suffix='.json')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(_dumps_indented(sample_iocs))
     
     try:
         # Configure scanner for team-first organization scan
@@ -102,11 +120,9 @@ def main():
             print("=" * 60)
             
             # Group matches by repository for better display
-            repo_matches = {}
+            repo_matches = defaultdict(list)
             for match in results.matches:
-                if match.repository not in repo_matches:
-                    repo_matches[match.repository] = []
-                repo_matches[match.repository].append(match)
+                repo_matches[match.repo].append(match)
             
             for repo_name, matches in repo_matches.items():
                 print(f"📦 {repo_name}")
@@ -10,10 +10,14 @@ Usage:
 """
 
 import csv
+import io
 import sys
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from urllib.request import urlopen
+from typing import Optional, Tuple
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
 
 # URL to Wiz Research IOC CSV
 WIZ_IOC_URL = "https://raw.githubusercontent.com/wiz-sec-public/wiz-research-iocs/main/reports/shai-hulud-2-packages.csv"
@@ -21,114 +25,155 @@ WIZ_IOC_URL = "https://raw.githubusercontent.com/wiz-sec-public/wiz-research-ioc
 # Path to IOC file
 IOC_FILE = Path(__file__).parent.parent / "src" / "github_ioc_scanner" / "issues" / "shai_hulud_2.py"
 
+# ETag of the CSV the IOC file was last generated from (delete to force a full download)
+ETAG_FILE = Path(__file__).parent / ".wiz_ioc.etag"
 
-def download_csv(url: str) -> list:
-    """Download and parse CSV from URL.
+# Generated IOC file preamble; {timestamp} is filled in at generation time
+IOC_FILE_HEADER = '''"""
+Shai-Hulud 2.0 Supply Chain Attack IOC Definitions
+
+This file contains Indicators of Compromise (IOCs) for the Shai-Hulud 2.0
+supply chain attack targeting npm packages.
+
+Source: Wiz Research
+URL: https://github.com/wiz-sec-public/wiz-research-iocs
+Last Updated: {timestamp}
+
+References:
+- https://www.wiz.io/blog/shai-hulud-2-0-ongoing-supply-chain-attack
+- https://securitylabs.datadoghq.com/articles/shai-hulud-2.0-npm-worm/
+- https://xygeni.io/de/blog/shai-hulud-the-npm-packages-worm-explained/
+"""
+
+# Compromised npm packages from Shai-Hulud 2.0 attack
+IOC_PACKAGES = {{
+'''
+
+
+def _column_index(header: list, name: str):
+    """Find a column by name, accepting capitalized or lowercase headers.
     
     Args:
-        url: URL to CSV file
+        header: CSV header row
+        name: Capitalized column name (e.g. "Package")
         
     Returns:
-        List of dictionaries with package data
+        Column index, or None if the column is missing
     """
-    print(f"Downloading IOC data from {url}...")
-    
-    try:
-        with urlopen(url) as response:
-            content = response.read().decode('utf-8')
-            
-        # Parse CSV
-        reader = csv.DictReader(content.splitlines())
-        packages = list(reader)
-        
-        print(f"✓ Downloaded {len(packages)} packages")
-        return packages
-        
-    except Exception as e:
-        print(f"✗ Failed to download CSV: {e}", file=sys.stderr)
-        sys.exit(1)
+    for candidate in (name, name.lower()):
+        if candidate in header:
+            return header.index(candidate)
+    return None
+
 
+def read_etag() -> Optional[str]:
+    """Return the stored ETag, if the IOC file it belongs to still exists."""
+    if not IOC_FILE.exists() or not ETAG_FILE.exists():
+        return None
+    return ETAG_FILE.read_text().strip() or None
 
-def parse_packages(csv_data: list) -> dict:
-    """Parse CSV data into IOC format.
+
+def download_and_parse(url: str, etag: Optional[str] = None) -> Optional[Tuple[dict, Optional[str]]]:
+    """Download the IOC CSV and parse it into IOC format in a single pass.
+    
+    Rows are read straight from the HTTP response, so the payload is never
+    held in memory as a whole. When ``etag`` is given the request is
+    conditional, and an unchanged upstream file is not transferred at all.
     
     Args:
-        csv_data: List of dictionaries from CSV
+        url: URL to CSV file
+        etag: ETag of the previously downloaded CSV
         
     Returns:
-        Dictionary mapping package names to versions
+        Tuple of (package names mapped to sorted version lists, new ETag),
+        or None if upstream has not changed since ``etag``
     """
-    ioc_packages = {}
+    print(f"Downloading IOC data from {url}...")
     
-    for row in csv_data:
-        # Try both lowercase and capitalized column names
-        package_name = (row.get('Package') or row.get('package', '')).strip()
-        version = (row.get('Version') or row.get('version', '')).strip()
-        
-        # Remove version prefix (e.g., "= 0.0.7" -> "0.0.7")
-        if version.startswith('= '):
-            version = version[2:].strip()
-        
-        if not package_name:
-            continue
+    request = Request(url)
+    if etag:
+        request.add_header('If-None-Match', etag)
+    
+    ioc_packages = defaultdict(set)
+    row_count = 0
+    
+    try:
+        with urlopen(request) as response:
+            new_etag = response.headers.get('ETag')
+            reader = csv.reader(io.TextIOWrapper(response, encoding='utf-8', newline=''))
+            header = [column.strip() for column in next(reader, [])]
+            package_index = _column_index(header, 'Package')
+            version_index = _column_index(header, 'Version')
+            
+            if package_index is None:
+                raise ValueError(f"CSV has no package column: {header}")
             
-        # Add to IOC list
-        if package_name not in ioc_packages:
-            ioc_packages[package_name] = []
+            for row in reader:
+                row_count += 1
+                if package_index >= len(row):
+                    continue
+                
+                package_name = row[package_index].strip()
+                if not package_name:
+                    continue
+                
+                version = ''
+                if version_index is not None and version_index < len(row):
+                    version = row[version_index].strip()
+                
+                # Remove version prefix (e.g., "= 0.0.7" -> "0.0.7")
+                if version.startswith('= '):
+                    version = version[2:].strip()
+                
+                # Add to IOC list; touching the key records "all versions"
+                versions = ioc_packages[package_name]
+                if version:
+                    versions.add(version)
         
-        if version and version not in ioc_packages[package_name]:
-            ioc_packages[package_name].append(version)
+    except HTTPError as e:
+        if e.code == 304:
+            print("✓ IOC data unchanged since last update")
+            return None
+        print(f"✗ Failed to download CSV: {e}", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"✗ Failed to download CSV: {e}", file=sys.stderr)
+        sys.exit(1)
     
+    print(f"✓ Downloaded {row_count} packages")
     print(f"✓ Parsed {len(ioc_packages)} unique packages")
-    return ioc_packages
+    return {name: sorted(versions) for name, versions in ioc_packages.items()}, new_etag
+
+
+def _format_package_entry(package_name: str, versions: list) -> str:
+    """Format one IOC_PACKAGES entry, including its trailing newline."""
+    if versions:
+        # Specific versions
+        # Tuples of literals compile to a single constant, unlike lists
+        versions_str = '", "'.join(versions)
+        return f'    "{package_name}": ("{versions_str}",),\n'
+    # All versions compromised
+    return f'    "{package_name}": None,  # All versions\n'
 
 
 def generate_ioc_file(packages: dict) -> str:
     """Generate Python IOC file content.
     
     Args:
-        packages: Dictionary of package names to versions
+        packages: Dictionary of package names to sorted version lists
         
     Returns:
         Python file content as string
     """
-    lines = [
-        '"""',
-        'Shai-Hulud 2.0 Supply Chain Attack IOC Definitions',
-        '',
-        'This file contains Indicators of Compromise (IOCs) for the Shai-Hulud 2.0',
-        'supply chain attack targeting npm packages.',
-        '',
-        'Source: Wiz Research',
-        'URL: https://github.com/wiz-sec-public/wiz-research-iocs',
-        f'Last Updated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}',
-        '',
-        'References:',
-        '- https://www.wiz.io/blog/shai-hulud-2-0-ongoing-supply-chain-attack',
-        '- https://securitylabs.datadoghq.com/articles/shai-hulud-2.0-npm-worm/',
-        '- https://xygeni.io/de/blog/shai-hulud-the-npm-packages-worm-explained/',
-        '"""',
-        '',
-        '# Compromised npm packages from Shai-Hulud 2.0 attack',
-        'IOC_PACKAGES = {',
-    ]
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
     # Sort packages alphabetically
-    for package_name in sorted(packages.keys()):
-        versions = packages[package_name]
-        
-        if versions:
-            # Specific versions
-            versions_str = ', '.join(f'"{v}"' for v in sorted(versions))
-            lines.append(f'    "{package_name}": [{versions_str}],')
-        else:
-            # All versions compromised
-            lines.append(f'    "{package_name}": None,  # All versions')
-    
-    lines.append('}')
-    lines.append('')
+    body = ''.join(
+        _format_package_entry(package_name, versions)
+        for package_name, versions in sorted(packages.items())
+    )
     
-    return '\n'.join(lines)
+    return IOC_FILE_HEADER.format(timestamp=timestamp) + body + '}\n'
 
 
 def update_ioc_file(content: str) -> None:
@@ -156,11 +201,12 @@ def main():
     print("=" * 60)
     print()
     
-    # Download CSV
-    csv_data = download_csv(WIZ_IOC_URL)
-    
-    # Parse packages
-    packages = parse_packages(csv_data)
+    # Download and parse CSV, skipping everything if upstream is unchanged
+    result = download_and_parse(WIZ_IOC_URL, read_etag())
+    if result is None:
+        print(f"Nothing to do, {IOC_FILE} is up to date.")
+        return
+    packages, etag = result
     
     # Generate IOC file
     content = generate_ioc_file(packages)
@@ -168,6 +214,12 @@ def main():
     # Update file
     update_ioc_file(content)
     
+    # Only remember the ETag once the IOC file has actually been written
+    if etag:
+        ETAG_FILE.write_text(etag)
+    else:
+        ETAG_FILE.unlink(missing_ok=True)
+    
     print()
     print("=" * 60)
     print("✓ Update complete!")
@@ -12,6 +12,12 @@ from urllib.parse import quote
 
 import httpx
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .exceptions import (
     AuthenticationError,
     NetworkError,
@@ -25,7 +31,7 @@ from .exceptions import (
 )
 from .logging_config import (
     get_logger, log_exception, log_rate_limit, log_user_message, 
-    log_rate_limit_debug, log_exception_with_user_message
+    log_rate_limit_debug, log_exception_with_user_message, format_reset_timestamp
 )
 from .models import APIResponse, FileContent, FileInfo, Repository
 from .batch_models import (
@@ -33,6 +39,7 @@ from .batch_models import (
     BatchConfig, NetworkConditions
 )
 from .rate_limit_manager import RateLimitManager
+from .improved_rate_limiting import TokenBucket
 from .error_message_formatter import ErrorMessageFormatter
 from .event_loop_context import EventLoopContext
 from .intelligent_rate_limiter import IntelligentRateLimiter, RateLimitStrategy
@@ -40,10 +47,22 @@ from .intelligent_rate_limiter import IntelligentRateLimiter, RateLimitStrategy
 logger = get_logger(__name__)
 
 
+def _decode_json(content: bytes) -> Any:
+    """Decode a JSON response body, using orjson when it is installed.
+    
+    Raises:
+        json.JSONDecodeError: If the content is not valid JSON (orjson's
+            decode error subclasses it)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
 def _format_reset_time(reset_time: int) -> str:
     """Format rate limit reset time safely, handling invalid timestamps."""
     if reset_time and reset_time > 0:
-        return f"Resets at {datetime.fromtimestamp(reset_time)}"
+        return f"Resets at {format_reset_timestamp(reset_time)}"
     return "reset time unknown"
 
 
@@ -77,6 +96,17 @@ class AsyncGitHubClient:
                 logger.warning(f"Invalid rate limit strategy '{strategy_name}', using 'normal'")
         
         self.intelligent_limiter = IntelligentRateLimiter(strategy)
+        
+        # Shared by every in-flight request: the semaphore caps concurrency and the
+        # event holds all requests back while the rate limit budget is nearly spent
+        self._request_slots = asyncio.Semaphore(self.config.max_concurrent_requests)
+        self._rate_limit_open = asyncio.Event()
+        self._rate_limit_open.set()
+        self._rate_limit_resume: Optional[asyncio.TimerHandle] = None
+        
+        # Token bucket pacing requests to GitHub's hourly core budget (this
+        # client never calls the separately limited search API)
+        self._rate_bucket = TokenBucket(capacity=5000, window_seconds=3600)
     
     async def aclose(self) -> None:
         """Close the async HTTP client session."""
@@ -89,14 +119,6 @@ class AsyncGitHubClient:
                 finally:
                     self.client = None
     
-    async def __aenter__(self):
-        """Async context manager entry."""
-        return self
-    
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        await self.aclose()
-        
     def _discover_token(self) -> str:
         """Discover GitHub token from environment or gh CLI."""
         # Try GITHUB_TOKEN environment variable first
@@ -201,7 +223,10 @@ class AsyncGitHubClient:
         for attempt in range(max_retries + 1):
             try:
                 session = await self._get_session()
-                response = await session.request(method, url, headers=headers, params=params, **kwargs)
+                await self._rate_bucket.acquire()
+                await self._rate_limit_open.wait()
+                async with self._request_slots:
+                    response = await session.request(method, url, headers=headers, params=params, **kwargs)
                 
                 # Extract rate limit information
                 remaining = int(response.headers.get("X-RateLimit-Remaining", 0))
@@ -220,10 +245,16 @@ class AsyncGitHubClient:
                         
                         # Update rate limit manager
                         self.rate_limit_manager.handle_rate_limit(reset_datetime, is_secondary)
+                        self._rate_bucket.penalize()
                         
-                        # Handle gracefully with exponential backoff for secondary limits
+                        # Handle gracefully with backoff for secondary limits, honouring Retry-After
                         if is_secondary and attempt < max_retries:
-                            backoff_time = min(2 ** attempt, 300)  # Max 5 minutes
+                            retry_after = response.headers.get("Retry-After")
+                            if retry_after and retry_after.isdigit():
+                                backoff_time = min(int(retry_after), 300)
+                            else:
+                                backoff_time = min(2 ** attempt, 300)  # Max 5 minutes
+                            self._pause_requests(backoff_time)
                             if self.rate_limit_manager.should_show_message():
                                 message = f"Secondary rate limit hit. Backing off for {backoff_time} seconds..."
                                 log_user_message(logger, message)
@@ -233,6 +264,7 @@ class AsyncGitHubClient:
                             continue
                         
                         # For primary rate limits or final attempt, wait until reset
+                        self._pause_requests(reset_timestamp - time.time())
                         await self._handle_rate_limit_gracefully(reset_datetime)
                         continue
                         
@@ -252,6 +284,10 @@ class AsyncGitHubClient:
                         reset_time=reset_time,
                         repo_name=repo_name
                     )
+                    if "X-RateLimit-Remaining" in response.headers:
+                        self._rate_bucket.sync(remaining, total)
+                        self._rate_bucket.reward()
+                        self._throttle_if_budget_low(remaining, reset_time)
                 
                 # Handle 304 Not Modified
                 if response.status_code == 304:
@@ -269,7 +305,7 @@ class AsyncGitHubClient:
                 
                 # Parse response data
                 try:
-                    data = response.json() if response.content else None
+                    data = _decode_json(response.content) if response.content else None
                 except json.JSONDecodeError as e:
                     logger.warning(f"Failed to parse JSON response from {url}: {e}")
                     data = None
@@ -336,6 +372,31 @@ class AsyncGitHubClient:
         # This should never be reached, but just in case
         raise APIError(f"Max retries exceeded for request to {url}")
     
+    def _throttle_if_budget_low(self, remaining: int, reset_time: int) -> None:
+        """Pause all requests until reset once the budget can't cover a full wave of concurrent requests."""
+        threshold = self.config.max_concurrent_requests * self.config.rate_limit_buffer
+        if remaining < threshold and reset_time > 0:
+            log_rate_limit_debug(logger, f"Only {remaining} requests left, pausing requests until reset")
+            self._pause_requests(reset_time - time.time())
+    
+    def _pause_requests(self, delay: float) -> None:
+        """Hold back every request for ``delay`` seconds, extending any pause already in place."""
+        if delay <= 0:
+            return
+        loop = asyncio.get_running_loop()
+        resume_at = loop.time() + delay
+        if self._rate_limit_resume is not None:
+            if self._rate_limit_resume.when() >= resume_at:
+                return
+            self._rate_limit_resume.cancel()
+        self._rate_limit_open.clear()
+        self._rate_limit_resume = loop.call_at(resume_at, self._resume_requests)
+    
+    def _resume_requests(self) -> None:
+        """Let paused requests through again."""
+        self._rate_limit_resume = None
+        self._rate_limit_open.set()
+    
     async def _handle_rate_limit_gracefully(self, reset_time: datetime) -> None:
         """Handle rate limit gracefully by waiting until reset time."""
         now = datetime.now()
@@ -1020,7 +1081,7 @@ class AsyncGitHubClient:
                 
                 # Parse the complete JSON response
                 try:
-                    blob_data = json.loads(content_buffer.decode('utf-8'))
+                    blob_data = _decode_json(content_buffer)
                 except json.JSONDecodeError as e:
                     logger.error(f"Failed to parse blob JSON for SHA {sha}: {e}")
                     return
@@ -1549,7 +1610,12 @@ class AsyncGitHubClient:
             await self.client.aclose()
     
     async def __aenter__(self) -> "AsyncGitHubClient":
-        """Async context manager entry."""
+        """Async context manager entry.
+        
+        Opens the pooled HTTP session up front so every request made inside the
+        context reuses the same keep-alive connections and TLS sessions.
+        """
+        await self._get_session()
         return self
     
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
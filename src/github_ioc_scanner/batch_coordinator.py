@@ -1,9 +1,10 @@
 """Central batch coordinator for orchestrating all batch operations."""
 
 import asyncio
+import functools
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
 
 from .async_github_client import AsyncGitHubClient
 from .batch_cache_coordinator import BatchCacheCoordinator
@@ -16,13 +17,16 @@ from .batch_progress_monitor import BatchProgressMonitor
 from .cache_manager import CacheManager
 from .exceptions import BatchProcessingError, ConfigurationError, RateLimitError
 from .logging_config import get_logger, log_user_message, log_exception_with_user_message
-from .models import Repository, IOCMatch
+from .models import FileContent, Repository, IOCMatch
 from .parallel_batch_processor import ParallelBatchProcessor
 from .rate_limit_manager import RateLimitManager as BatchRateLimitManager
 from .error_message_formatter import ErrorMessageFormatter
 
 logger = get_logger(__name__)
 
+# Assumed size of a file response when the request carries no size estimate
+DEFAULT_RESPONSE_SIZE_ESTIMATE = 64 * 1024
+
 
 class BatchCoordinator:
     """Central coordinator for all batch operations with unified interface."""
@@ -79,6 +83,11 @@ class BatchCoordinator:
         self.current_strategy = self.config.default_strategy
         self.strategy_adaptation_enabled = True
         
+        # Back-pressure: bytes of fetched responses not yet consumed by the caller
+        self._response_memory_budget = self.config.max_memory_usage_mb * 1024 * 1024
+        self._response_memory_in_use = 0
+        self._response_memory_condition = asyncio.Condition()
+        
     async def start(self) -> None:
         """Start the batch coordinator and all sub-components."""
         try:
@@ -106,6 +115,19 @@ class BatchCoordinator:
             logger.error(f"Error stopping batch coordinator: {e}")
             raise BatchProcessingError(f"Coordinator shutdown failed: {e}") from e
     
+    async def cleanup(self) -> None:
+        """Release per-run state without closing the shared GitHub client.
+        
+        Use this instead of stop() when the GitHub client is shared with other
+        coordinators that are still running.
+        """
+        if self.active_operations:
+            await self._wait_for_active_operations()
+        
+        await self.cache_coordinator.stop()
+        self.operation_history.clear()
+        logger.debug("Batch coordinator cleaned up")
+    
     async def process_repositories_batch(
         self,
         repositories: List[Repository],
@@ -268,8 +290,6 @@ class BatchCoordinator:
         try:
             # Since we don't have async repository discovery yet, we need to use
             # the synchronous method but run it in a thread pool to avoid blocking
-            import asyncio
-            import functools
             
             # Get the synchronous GitHub client from the scanner
             if hasattr(self, 'scanner') and self.scanner:
@@ -358,6 +378,74 @@ class BatchCoordinator:
             logger.error(f"File batch processing failed: {e}")
             raise BatchProcessingError(f"File batch processing failed: {e}") from e
     
+    async def iter_files_batch(
+        self,
+        repo: Repository,
+        file_paths: List[str],
+        priority_files: Optional[List[str]] = None
+    ) -> AsyncIterator[Tuple[str, FileContent]]:
+        """Stream file contents as each batch completes.
+        
+        Unlike process_files_batch, results are not collected into a single
+        dictionary, so callers can scan a file and drop its content before the
+        next batch is fetched. Failed files are logged and skipped.
+        
+        Args:
+            repo: Repository containing the files
+            file_paths: List of file paths to process
+            priority_files: Optional list of high-priority files
+            
+        Yields:
+            Tuples of (file_path, file_content) for successfully fetched files
+        """
+        if not file_paths:
+            return
+        
+        operation_id = await self._create_operation("files_batch_stream", {
+            'repository': repo.full_name,
+            'file_count': len(file_paths),
+            'priority_files': priority_files or []
+        })
+        error: Optional[str] = None
+        
+        try:
+            logger.info(f"Streaming batch of {len(file_paths)} files from {repo.full_name}")
+            
+            batch_requests = await self._create_prioritized_batch_requests(
+                repo, file_paths, priority_files
+            )
+            cached_results, uncached_requests = await self.cache_coordinator.coordinate_batch_operation(
+                batch_requests, operation_id
+            )
+            await self.cache_coordinator.finalize_batch_operation(operation_id, cached_results)
+            
+            for result in cached_results:
+                if result.success:
+                    yield result.request.file_path, result.content
+            del cached_results
+            
+            # Finalize each API batch on its own so no batch outlives its consumer
+            async for batch_results in self._iter_uncached_batches(uncached_requests):
+                await self.cache_coordinator.finalize_batch_operation(operation_id, batch_results)
+                for result in batch_results:
+                    if result.success:
+                        yield result.request.file_path, result.content
+                    elif result.error:
+                        logger.debug(f"Skipping {result.request.file_path}: {result.error}")
+            
+        except Exception as e:
+            error = str(e)
+            logger.error(f"File batch streaming failed: {e}")
+            raise BatchProcessingError(f"File batch streaming failed: {e}") from e
+        
+        finally:
+            # Also runs when the consumer stops early (break or aclose), which
+            # is not a failure, so the operation never lingers as active
+            if error is None:
+                await self._complete_operation(operation_id, success=True)
+            else:
+                await self._complete_operation(operation_id, success=False, error=error)
+    
     async def get_batch_metrics(self) -> BatchMetrics:
         """Get comprehensive batch processing metrics.
         
@@ -753,9 +841,14 @@ class BatchCoordinator:
                     'package.json', 'requirements.txt', 'go.mod', 'Cargo.toml'
                 ]
             
-            opportunities = self.strategy_manager.identify_cross_repo_opportunities(
-                repositories, repo_files
+            # The pairwise file-set analysis is CPU-bound, keep it off the event loop
+            analyze = functools.partial(
+                self.strategy_manager.identify_cross_repo_opportunities,
+                repositories,
+                repo_files
             )
+            loop = asyncio.get_running_loop()
+            opportunities = await loop.run_in_executor(None, analyze)
             
             logger.debug(f"Identified {len(opportunities)} cross-repo batching opportunities")
             return opportunities
@@ -1649,11 +1742,11 @@ class BatchCoordinator:
                     for package in packages:
                         package_name = package.name
                         version = package.version
-                        logger.debug(f"Checking package {package_name}@{version}")
+                        logger.debug("Checking package %s@%s", package_name, version)
                         for ioc_file, ioc_definition in ioc_definitions.items():
                             if package_name in ioc_definition.packages:
                                 ioc_versions = ioc_definition.packages[package_name]
-                                logger.debug(f"Found IOC package {package_name}, checking version {version} against {ioc_versions}")
+                                logger.debug("Found IOC package %s, checking version %s against %s", package_name, version, ioc_versions)
                                 
                                 # Check if this version matches IOC criteria
                                 if ioc_versions is None or version in ioc_versions:
@@ -1725,8 +1818,25 @@ class BatchCoordinator:
         Returns:
             List of batch results from API processing
         """
+        results = []
+        async for batch_results in self._iter_uncached_batches(requests):
+            results.extend(batch_results)
+        
+        return results
+    
+    async def _iter_uncached_batches(
+        self, requests: List[BatchRequest]
+    ) -> AsyncIterator[List[BatchResult]]:
+        """Process uncached requests in optimal-sized batches, yielding each batch.
+        
+        Args:
+            requests: List of uncached batch requests
+            
+        Yields:
+            Batch results for each processed batch
+        """
         if not requests:
-            return []
+            return
         
         # Determine optimal batch size
         file_sizes = {req.file_path: req.estimated_size for req in requests}
@@ -1739,14 +1849,44 @@ class BatchCoordinator:
             file_paths, file_sizes, rate_limit_remaining
         )
         
-        # Process in optimal-sized batches
-        results = []
+        # Process in optimal-sized batches, holding each batch's memory reservation
+        # until the caller asks for the next one
         for i in range(0, len(requests), optimal_batch_size):
             batch = requests[i:i + optimal_batch_size]
-            batch_results = await self.parallel_processor.process_batch_parallel(batch)
-            results.extend(batch_results)
+            reserved = await self._reserve_response_memory(
+                sum(req.estimated_size or DEFAULT_RESPONSE_SIZE_ESTIMATE for req in batch)
+            )
+            try:
+                yield await self.parallel_processor.process_batch_parallel(batch)
+            finally:
+                await self._release_response_memory(reserved)
+    
+    async def _reserve_response_memory(self, size: int) -> int:
+        """Wait until a response batch fits in the memory budget and reserve it.
         
-        return results
+        Args:
+            size: Estimated size of the batch responses in bytes
+            
+        Returns:
+            Number of bytes actually reserved (capped at the whole budget)
+        """
+        size = min(size, self._response_memory_budget)
+        async with self._response_memory_condition:
+            await self._response_memory_condition.wait_for(
+                lambda: self._response_memory_in_use + size <= self._response_memory_budget
+            )
+            self._response_memory_in_use += size
+        return size
+    
+    async def _release_response_memory(self, size: int) -> None:
+        """Release a reservation made by _reserve_response_memory.
+        
+        Args:
+            size: Number of bytes returned by the matching reservation
+        """
+        async with self._response_memory_condition:
+            self._response_memory_in_use -= size
+            self._response_memory_condition.notify_all()
     
     async def _format_file_batch_results(self, results: List[BatchResult]) -> Dict[str, Any]:
         """Format batch results for return to caller.
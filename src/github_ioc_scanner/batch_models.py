@@ -1,13 +1,17 @@
 """Core data models for batch processing operations."""
 
 import asyncio
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional, Set
 
 from .models import Repository, FileContent, IOCMatch
 
+# dataclass(slots=True) needs Python 3.10; older interpreters get regular instances
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class BatchStrategy(Enum):
     """Different batching strategies."""
@@ -18,9 +22,12 @@ class BatchStrategy(Enum):
     CONSERVATIVE = "conservative"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class BatchRequest:
-    """Represents a single request in a batch."""
+    """Represents a single request in a batch.
+    
+    Slotted where supported, since large scans create one per file.
+    """
     repo: Repository
     file_path: str
     priority: int = 0
@@ -239,6 +246,10 @@ class BatchConfig:
             errors.append("retry_attempts must be non-negative")
         
         return errors
+    
+    def replace(self, **overrides: Any) -> "BatchConfig":
+        """Return a copy of this configuration with the given fields overridden."""
+        return replace(self, **overrides)
 
 
 @dataclass
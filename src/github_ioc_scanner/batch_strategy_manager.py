@@ -1,7 +1,8 @@
 """Batch strategy manager for intelligent batching decisions."""
 
 import math
-from typing import Dict, List, Optional, Tuple
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
 
 from .batch_models import (
     BatchConfig,
@@ -153,7 +154,8 @@ class BatchStrategyManager:
                 continue
             
             # Get repository objects
-            batch_repos = [r for r in repositories if r.full_name in repo_names]
+            repo_name_set = set(repo_names)
+            batch_repos = [r for r in repositories if r.full_name in repo_name_set]
             
             if len(batch_repos) < 2:
                 continue
@@ -729,6 +731,14 @@ class BatchStrategyManager:
         # Find all possible combinations of common files
         common_file_groups = {}
         repo_names = list(repo_important_files.keys())
+        repo_order = {name: index for index, name in enumerate(repo_names)}
+        
+        # Index repositories by file so the repos sharing a file set come from
+        # set intersections instead of a subset check against every repository
+        repos_by_file: Dict[str, Set[str]] = defaultdict(set)
+        for repo_name, files in repo_important_files.items():
+            for filename in files:
+                repos_by_file[filename].add(repo_name)
         
         # For each pair of repositories, find common files
         for i in range(len(repo_names)):
@@ -738,11 +748,10 @@ class BatchStrategyManager:
                 
                 if common_files:
                     # Check if other repos also have these files
+                    others = set.intersection(*(repos_by_file[f] for f in common_files))
+                    others.difference_update((repo1, repo2))
                     repos_with_files = [repo1, repo2]
-                    for k, other_repo in enumerate(repo_names):
-                        if k != i and k != j:
-                            if common_files.issubset(repo_important_files[other_repo]):
-                                repos_with_files.append(other_repo)
+                    repos_with_files.extend(sorted(others, key=repo_order.__getitem__))
                     
                     if len(repos_with_files) >= 2:
                         file_tuple = tuple(sorted(common_files))
@@ -750,15 +759,8 @@ class BatchStrategyManager:
                             common_file_groups[file_tuple] = repos_with_files
         
         # Also find individual file commonalities
-        all_files = set()
-        for files in repo_important_files.values():
-            all_files.update(files)
-        
-        for file in all_files:
-            repos_with_file = [
-                repo for repo, files in repo_important_files.items()
-                if file in files
-            ]
+        for file, repos in repos_by_file.items():
+            repos_with_file = sorted(repos, key=repo_order.__getitem__)
             
             if len(repos_with_file) >= 2:
                 file_tuple = (file,)
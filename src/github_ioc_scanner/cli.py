@@ -1435,7 +1435,7 @@ def main() -> None:
                     versions = ioc_packages[package_name]
                     if versions:
                         versions_str = ', '.join(f'"{v}"' for v in sorted(versions))
-                        lines.append(f'    "{package_name}": [{versions_str}],')
+                        lines.append(f'    "{package_name}": ({versions_str},),')
                     else:
                         lines.append(f'    "{package_name}": None,')
                 
@@ -12,6 +12,12 @@ from urllib.parse import quote
 
 import httpx
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .exceptions import (
     AuthenticationError,
     NetworkError,
@@ -23,7 +29,7 @@ from .exceptions import (
     wrap_exception,
     get_error_context
 )
-from .logging_config import get_logger, log_exception, log_rate_limit
+from .logging_config import get_logger, log_exception, log_rate_limit, format_reset_timestamp
 from .smart_rate_limiter import handle_smart_rate_limiting, handle_rate_limit_exceeded
 from .models import APIResponse, FileContent, FileInfo, Repository
 from .batch_models import BatchRequest, BatchResult, BatchConfig
@@ -32,10 +38,22 @@ from .github_app_auth import create_github_app_auth, GitHubAppAuth
 logger = get_logger(__name__)
 
 
+def _decode_json(content: bytes) -> Any:
+    """Decode a JSON response body, using orjson when it is installed.
+    
+    Raises:
+        json.JSONDecodeError: If the content is not valid JSON (orjson's
+            decode error subclasses it)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
 def _format_reset_time(reset_time: int) -> str:
     """Format rate limit reset time safely, handling invalid timestamps."""
     if reset_time and reset_time > 0:
-        return f"Resets at {datetime.fromtimestamp(reset_time)}"
+        return f"Resets at {format_reset_timestamp(reset_time)}"
     return "reset time unknown"
 
 
@@ -101,6 +119,9 @@ class GitHubClient:
         self._code_search_rate_limited = False
         self._code_search_reset_time = 0
         
+        # Latest rate limit headers seen per resource ("core", "search", ...)
+        self._rate_limit_cache: Dict[str, Dict[str, Any]] = {}
+        
     def _discover_token(self) -> str:
         """Discover GitHub token from environment or gh CLI."""
         # Try GITHUB_TOKEN environment variable first
@@ -224,7 +245,7 @@ class GitHubClient:
                 response.raise_for_status()
                 
                 try:
-                    data = response.json() if response.content else None
+                    data = _decode_json(response.content) if response.content else None
                 except json.JSONDecodeError as e:
                     logger.warning(f"Failed to parse JSON response from {url}: {e}")
                     data = None
@@ -274,6 +295,7 @@ class GitHubClient:
             # Extract rate limit information
             remaining = int(response.headers.get("X-RateLimit-Remaining", 0))
             reset_time = int(response.headers.get("X-RateLimit-Reset", 0))
+            self._record_rate_limit(response.headers)
             
             # Handle rate limiting (403 with rate limit message)
             if response.status_code == 403:
@@ -312,7 +334,7 @@ class GitHubClient:
             
             # Parse response data
             try:
-                data = response.json() if response.content else None
+                data = _decode_json(response.content) if response.content else None
             except json.JSONDecodeError as e:
                 logger.warning(f"Failed to parse JSON response from {url}: {e}")
                 data = None
@@ -356,7 +378,7 @@ class GitHubClient:
                             retry_response.raise_for_status()
                             
                             try:
-                                retry_data = retry_response.json() if retry_response.content else None
+                                retry_data = _decode_json(retry_response.content) if retry_response.content else None
                             except json.JSONDecodeError as e:
                                 logger.warning(f"Failed to parse JSON response from {url}: {e}")
                                 retry_data = None
@@ -415,6 +437,37 @@ class GitHubClient:
     def _handle_rate_limit(self, reset_time: int) -> None:
         """Handle rate limiting with exponential backoff."""
         handle_rate_limit_exceeded(reset_time)
+    
+    def _record_rate_limit(self, headers: httpx.Headers) -> None:
+        """Remember the rate limit budget reported in a response's headers."""
+        if "X-RateLimit-Remaining" not in headers:
+            return
+        resource = headers.get("X-RateLimit-Resource", "core")
+        self._rate_limit_cache[resource] = {
+            "limit": int(headers.get("X-RateLimit-Limit", 0)),
+            "remaining": int(headers["X-RateLimit-Remaining"]),
+            "reset": int(headers.get("X-RateLimit-Reset", 0)),
+            "observed_at": time.monotonic(),
+        }
+    
+    def get_cached_rate_limit(self, resource: str = "core", max_age: float = 60.0) -> Optional[Dict[str, Any]]:
+        """Get the rate limit budget last reported by GitHub for a resource.
+        
+        Every API response carries X-RateLimit-* headers, so this avoids a
+        separate /rate_limit call while the budget is fresh.
+        
+        Args:
+            resource: Rate limit resource name ("core", "search", "graphql", ...)
+            max_age: Maximum age in seconds of the cached headers
+            
+        Returns:
+            Dictionary with limit, remaining and reset, or None if no fresh
+            headers have been seen for the resource
+        """
+        cached = self._rate_limit_cache.get(resource)
+        if cached is None or time.monotonic() - cached["observed_at"] > max_age:
+            return None
+        return cached
 
     def get_organization_repos(
         self, org: str, include_archived: bool = False, etag: Optional[str] = None
@@ -1514,6 +1567,7 @@ class GitHubClient:
             # Log rate limit information
             remaining = int(response.headers.get("X-RateLimit-Remaining", 0))
             reset_time = int(response.headers.get("X-RateLimit-Reset", 0))
+            self._record_rate_limit(response.headers)
             log_rate_limit(logger, remaining, reset_time)
             
             # Proactive rate limit handling - slow down when approaching limits
@@ -1548,7 +1602,7 @@ class GitHubClient:
             
             # Parse response data
             try:
-                data = response.json() if response.content else None
+                data = _decode_json(response.content) if response.content else None
             except json.JSONDecodeError as e:
                 logger.warning(f"Failed to parse JSON response from {url}: {e}")
                 data = None
@@ -1,5 +1,6 @@
 """Improved rate limiting for GitHub API requests."""
 
+import asyncio
 import time
 from datetime import datetime
 from typing import Optional
@@ -110,6 +111,62 @@ class ImprovedRateLimiter:
             return 0.1
 
 
+class TokenBucket:
+    """Async token bucket that spaces requests out to a refill rate.
+    
+    The bucket is kept in line with GitHub's rate limit headers via sync(), and
+    its refill rate adapts AIMD-style: penalize() halves it after a rate limit
+    response and reward() grows it by 10% per success, up to the base rate.
+    """
+    
+    def __init__(self, capacity: int, window_seconds: float):
+        """Initialize a full bucket.
+        
+        Args:
+            capacity: Requests allowed per window (GitHub's X-RateLimit-Limit)
+            window_seconds: Length of the rate limit window in seconds
+        """
+        self.window_seconds = window_seconds
+        self.capacity = float(capacity)
+        self.base_rate = capacity / window_seconds
+        self.rate = self.base_rate
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+    
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Take tokens from the bucket, waiting for the refill if there are too few."""
+        async with self._lock:
+            self._refill()
+            if self.tokens < tokens:
+                await asyncio.sleep((tokens - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= tokens
+    
+    def sync(self, remaining: int, limit: Optional[int] = None) -> None:
+        """Align the bucket with the rate limit headers of a response."""
+        if limit and limit != self.capacity:
+            self.capacity = float(limit)
+            self.base_rate = limit / self.window_seconds
+            self.rate = min(self.rate, self.base_rate)
+        self._refill()
+        self.tokens = float(min(remaining, self.capacity))
+    
+    def penalize(self) -> None:
+        """Halve the refill rate after hitting a rate limit."""
+        self.rate = max(self.rate / 2, self.base_rate / 64)
+    
+    def reward(self) -> None:
+        """Grow the refill rate back towards the base rate after a success."""
+        self.rate = min(self.rate * 1.1, self.base_rate)
+
+
 # Global rate limiter instance
 _rate_limiter = ImprovedRateLimiter()
 
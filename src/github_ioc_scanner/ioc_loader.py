@@ -40,6 +40,8 @@ class IOCLoader:
         
         self._ioc_definitions: Dict[str, IOCDefinition] = {}
         self._ioc_hash: Optional[str] = None
+        # Merged name -> versions lookups, keyed by package type ("npm"/"maven")
+        self._merged_packages: Dict[str, Dict[str, Optional[Set[str]]]] = {}
     
     def load_iocs(self) -> Dict[str, IOCDefinition]:
         """Load all IOC definitions from Python files in the issues directory.
@@ -102,8 +104,9 @@ class IOCLoader:
                     f"Errors encountered:\n{error_details}"
                 )
             
-            # Invalidate cached hash since definitions changed
+            # Invalidate cached hash and lookups since definitions changed
             self._ioc_hash = None
+            self._merged_packages.clear()
             
             if errors:
                 logger.warning(f"Successfully loaded IOC definitions from {loaded_count} files, "
@@ -275,7 +278,8 @@ class IOCLoader:
                         raise IOCFileError(
                             f"Empty version found for package '{package_name}' in {source_file}"
                         )
-                    version_set.add(version)
+                    # Share storage for versions that recur across packages
+                    version_set.add(sys.intern(version))
                 
                 if not version_set:
                     raise IOCFileError(
@@ -361,26 +365,7 @@ class IOCLoader:
         Raises:
             IOCLoaderError: If no IOC definitions are loaded
         """
-        if not self._ioc_definitions:
-            raise IOCLoaderError("No IOC definitions loaded. Call load_iocs() first.")
-        
-        merged_packages: Dict[str, Optional[Set[str]]] = {}
-        
-        for ioc_def in self._ioc_definitions.values():
-            for package_name, versions in ioc_def.packages.items():
-                if package_name in merged_packages:
-                    existing_versions = merged_packages[package_name]
-                    
-                    # If either definition says "any version", use None
-                    if existing_versions is None or versions is None:
-                        merged_packages[package_name] = None
-                    else:
-                        # Merge version sets
-                        merged_packages[package_name] = existing_versions.union(versions)
-                else:
-                    merged_packages[package_name] = versions
-        
-        return merged_packages
+        return dict(self._get_merged_packages("npm"))
     
     def get_all_maven_packages(self) -> Dict[str, Optional[Set[str]]]:
         """Get all Maven IOC packages merged from all loaded definitions.
@@ -388,19 +373,38 @@ class IOCLoader:
         Returns:
             Dictionary mapping "groupId:artifactId" to version sets (or None for any version)
             
+        Raises:
+            IOCLoaderError: If no IOC definitions are loaded
+        """
+        return dict(self._get_merged_packages("maven"))
+    
+    def _get_merged_packages(self, package_type: str) -> Dict[str, Optional[Set[str]]]:
+        """Get the merged package lookup for a package type, building it once per load.
+        
+        Args:
+            package_type: Type of package - "npm" or "maven"
+            
+        Returns:
+            Shared merged lookup; callers must not mutate it
+            
         Raises:
             IOCLoaderError: If no IOC definitions are loaded
         """
         if not self._ioc_definitions:
             raise IOCLoaderError("No IOC definitions loaded. Call load_iocs() first.")
         
-        merged_packages: Dict[str, Optional[Set[str]]] = {}
+        merged_packages = self._merged_packages.get(package_type)
+        if merged_packages is not None:
+            return merged_packages
+        
+        merged_packages = {}
         
         for ioc_def in self._ioc_definitions.values():
-            if not ioc_def.maven_packages:
+            packages = ioc_def.maven_packages if package_type == "maven" else ioc_def.packages
+            if not packages:
                 continue
                 
-            for package_name, versions in ioc_def.maven_packages.items():
+            for package_name, versions in packages.items():
                 if package_name in merged_packages:
                     existing_versions = merged_packages[package_name]
                     
@@ -413,6 +417,7 @@ class IOCLoader:
                 else:
                     merged_packages[package_name] = versions
         
+        self._merged_packages[package_type] = merged_packages
         return merged_packages
     
     def get_ioc_statistics(self) -> Dict[str, int]:
@@ -427,8 +432,8 @@ class IOCLoader:
         if not self._ioc_definitions:
             raise IOCLoaderError("No IOC definitions loaded. Call load_iocs() first.")
         
-        npm_packages = self.get_all_packages()
-        maven_packages = self.get_all_maven_packages()
+        npm_packages = self._get_merged_packages("npm")
+        maven_packages = self._get_merged_packages("maven")
         
         return {
             "npm_packages": len(npm_packages),
@@ -451,10 +456,7 @@ class IOCLoader:
         Raises:
             IOCLoaderError: If no IOC definitions are loaded
         """
-        if package_type.lower() == "maven":
-            all_packages = self.get_all_maven_packages()
-        else:
-            all_packages = self.get_all_packages()
+        all_packages = self._get_merged_packages("maven" if package_type.lower() == "maven" else "npm")
         
         if package_name not in all_packages:
             return False
@@ -1,7 +1,12 @@
 """Logging configuration for the GitHub IOC Scanner."""
 
+import atexit
 import logging
+import queue
 import sys
+from datetime import datetime
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional, Dict, Any
 import os
 
@@ -82,6 +87,32 @@ class ErrorSuppressionFilter(logging.Filter):
         return ErrorMessageFormatter.should_suppress_error(exception)
 
 
+class _RecordQueueHandler(QueueHandler):
+    """QueueHandler that enqueues records unformatted.
+    
+    The stock prepare() renders the message and drops exc_info, which would
+    bypass the formatters and ErrorSuppressionFilter of the real handlers.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+# Listener draining the log queue when setup_logging(non_blocking=True) is used
+_queue_listener: Optional[QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush queued log records and stop the listener thread, if running."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
 def setup_logging(
     level: str = "INFO",
     format_string: Optional[str] = None,
@@ -89,7 +120,8 @@ def setup_logging(
     log_file: Optional[str] = None,
     debug_rate_limits: bool = False,
     suppress_stack_traces: bool = True,
-    separate_user_messages: bool = True
+    separate_user_messages: bool = True,
+    non_blocking: bool = False
 ) -> None:
     """
     Configure logging for the GitHub IOC Scanner with enhanced user message separation.
@@ -102,7 +134,11 @@ def setup_logging(
         debug_rate_limits: Enable detailed rate limit debugging
         suppress_stack_traces: Suppress stack traces for known error types
         separate_user_messages: Separate user messages from technical logs
+        non_blocking: Hand records to a background thread through a queue so
+            logging calls never wait on console or file writes
     """
+    global _queue_listener
+    
     # Convert string level to logging constant
     numeric_level = getattr(logging, level.upper(), logging.INFO)
     
@@ -111,6 +147,7 @@ def setup_logging(
     suppress_stack_traces = suppress_stack_traces and os.getenv('GITHUB_IOC_SCANNER_SUPPRESS_STACK_TRACES', 'true').lower() != 'false'
     
     # Clear any existing handlers
+    _stop_queue_listener()
     root_logger = logging.getLogger()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
@@ -173,6 +210,16 @@ def setup_logging(
         except (OSError, PermissionError) as e:
             logging.warning(f"Could not create log file {log_file}: {e}")
     
+    if non_blocking:
+        # The real handlers move behind a queue drained on a listener thread
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        handlers = root_logger.handlers[:]
+        for handler in handlers:
+            root_logger.removeHandler(handler)
+        _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _queue_listener.start()
+        root_logger.addHandler(_RecordQueueHandler(log_queue))
+    
     # Set specific logger levels for external libraries to reduce noise
     logging.getLogger("httpx").setLevel(logging.WARNING)
     logging.getLogger("urllib3").setLevel(logging.WARNING)
@@ -305,6 +352,16 @@ def log_performance(logger: logging.Logger, operation: str, duration: float, **k
     logger.info(f"Performance: {operation} completed in {duration:.3f}s {context}".strip())
 
 
+@lru_cache(maxsize=16)
+def format_reset_timestamp(reset_time: float) -> str:
+    """Format a rate limit reset epoch as local time.
+    
+    Every response in a rate limit window carries the same reset epoch, so the
+    formatted string is cached instead of building a datetime per request.
+    """
+    return str(datetime.fromtimestamp(reset_time))
+
+
 def log_rate_limit(logger: logging.Logger, remaining: int, reset_time: int) -> None:
     """
     Log GitHub API rate limit information only when relevant (low or exhausted).
@@ -314,8 +371,6 @@ def log_rate_limit(logger: logging.Logger, remaining: int, reset_time: int) -> N
         remaining: Number of requests remaining
         reset_time: Unix timestamp when rate limit resets
     """
-    from datetime import datetime
-    
     # Only log rate limit info when it's getting low or critical
     # Skip logging if reset_time is invalid (0 or None - happens with GraphQL)
     if reset_time is None or reset_time <= 0:
@@ -325,16 +380,16 @@ def log_rate_limit(logger: logging.Logger, remaining: int, reset_time: int) -> N
     
     if remaining <= 0:
         # Rate limit exhausted - critical warning
-        reset_datetime = datetime.fromtimestamp(reset_time)
-        logger.warning(f"⚠️  Rate limit exhausted! Resets at {reset_datetime}")
+        logger.warning("⚠️  Rate limit exhausted! Resets at %s", format_reset_timestamp(reset_time))
     elif remaining <= 100:
         # Rate limit getting low - warning
-        reset_datetime = datetime.fromtimestamp(reset_time)
-        logger.warning(f"⚠️  Rate limit low: {remaining} requests remaining, resets at {reset_datetime}")
+        logger.warning("⚠️  Rate limit low: %d requests remaining, resets at %s",
+                       remaining, format_reset_timestamp(reset_time))
     elif remaining <= 500:
         # Rate limit moderately low - info only in verbose mode
-        reset_datetime = datetime.fromtimestamp(reset_time)
-        logger.info(f"Rate limit: {remaining} requests remaining, resets at {reset_datetime}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Rate limit: %d requests remaining, resets at %s",
+                        remaining, format_reset_timestamp(reset_time))
     # For remaining > 500, don't log anything (normal operation)
 
 
@@ -2,13 +2,54 @@
 
 import gc
 import logging
+import mmap
+import os
+import time
 import psutil
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, NamedTuple
 from threading import Lock
 
 logger = logging.getLogger(__name__)
 
+_STATM_PATH = "/proc/self/statm"
+
+
+class _ProcessMemory(NamedTuple):
+    """Subset of psutil's memory_info() result used by the monitor."""
+    rss: int
+
+
+class _StatmProcess:
+    """Reads the process RSS from /proc/self/statm through a cached descriptor.
+    
+    Stands in for psutil.Process on Linux: one pread() per call instead of
+    opening and parsing the proc file each time.
+    """
+    
+    _fd: Optional[int] = None
+    
+    def __init__(self) -> None:
+        self._fd = os.open(_STATM_PATH, os.O_RDONLY)
+    
+    def memory_info(self) -> _ProcessMemory:
+        """Return the resident set size in bytes."""
+        rss_pages = int(os.pread(self._fd, 128, 0).split()[1])
+        return _ProcessMemory(rss=rss_pages * mmap.PAGESIZE)
+    
+    def __del__(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+
+
+def _open_process_memory_source() -> Any:
+    """Return the cheapest available reader for this process's memory usage."""
+    try:
+        return _StatmProcess()
+    except (OSError, AttributeError):
+        # No procfs (macOS/Windows) or no os.pread
+        return psutil.Process()
+
 
 @dataclass
 class MemoryStats:
@@ -24,6 +65,9 @@ class MemoryStats:
 class MemoryMonitor:
     """Monitors memory usage and provides batch size adjustment recommendations."""
     
+    # Seconds a system memory snapshot is reused before /proc/meminfo is re-read
+    SYSTEM_MEMORY_TTL = 0.5
+    
     def __init__(
         self,
         max_memory_threshold: float = 0.8,  # 80% of available memory
@@ -48,16 +92,22 @@ class MemoryMonitor:
         self._lock = Lock()
         self._baseline_memory: Optional[float] = None
         self._peak_memory: float = 0.0
+        self._system_memory: Any = None
+        self._system_memory_read_at = 0.0
         
     def get_memory_stats(self) -> MemoryStats:
         """Get current memory statistics."""
         try:
-            # System memory
-            system_memory = psutil.virtual_memory()
+            # System memory, refreshed at most every SYSTEM_MEMORY_TTL seconds
+            now = time.monotonic()
+            if self._system_memory is None or now - self._system_memory_read_at >= self.SYSTEM_MEMORY_TTL:
+                self._system_memory = psutil.virtual_memory()
+                self._system_memory_read_at = now
+            system_memory = self._system_memory
             
             # Process memory - initialize process if not already done
             if self._process is None:
-                self._process = psutil.Process()
+                self._process = _open_process_memory_source()
             
             process_memory = self._process.memory_info()
             process_mb = process_memory.rss / 1024 / 1024
@@ -163,8 +213,8 @@ class MemoryMonitor:
         
         if adjusted_size != current_batch_size:
             logger.debug(
-                f"Adjusted batch size from {current_batch_size} to {adjusted_size} "
-                f"due to memory pressure ({memory_pressure_factor:.1%})"
+                "Adjusted batch size from %d to %d due to memory pressure (%.1f%%)",
+                current_batch_size, adjusted_size, memory_pressure_factor * 100
             )
         
         return adjusted_size
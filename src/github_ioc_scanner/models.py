@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 
 @dataclass
@@ -62,14 +62,29 @@ class ScanConfig:
     enable_maven: bool = True  # Enable Maven (pom.xml) scanning for Java dependencies
 
 
-@dataclass
+@dataclass(frozen=True)
 class Repository:
-    """Represents a GitHub repository."""
+    """Represents a GitHub repository.
+    
+    Immutable and slotted: organization scans hold thousands of these, and
+    freezing them also makes them usable as dict keys.
+    """
+    __slots__ = ("name", "full_name", "archived", "default_branch", "updated_at")
+    
     name: str
     full_name: str
     archived: bool
     default_branch: str
     updated_at: datetime
+    
+    # Frozen dataclasses reject setattr, so pickle and copy need explicit
+    # slot state handling (what dataclass(slots=True) generates on 3.10+)
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
 
 
 @dataclass
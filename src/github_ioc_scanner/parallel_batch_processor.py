@@ -459,6 +459,14 @@ class ParallelBatchProcessor:
         
         logger.info("Parallel batch processor shutdown complete")
     
+    async def __aenter__(self) -> "ParallelBatchProcessor":
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit."""
+        await self.shutdown_processor()
+    
     async def create_recovery_plan(
         self,
         failed_requests: List[BatchRequest],
@@ -1,15 +1,47 @@
 """SBOM (Software Bill of Materials) parser for various formats."""
 
 import json
+import re
 import xml.etree.ElementTree as ET
 from typing import Dict, List, Optional, Set, Any
 from dataclasses import dataclass
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from ..logging_config import get_logger
 from ..models import PackageDependency
 
 logger = get_logger(__name__)
 
+# Matches SBOM file paths: a basename containing an SBOM keyword ("bom" also
+# covers "sbom") with a .json/.xml extension, software-bill-of-materials.json/.xml,
+# or a bare .sbom/.spdx file.
+# Exported so callers can reuse the compiled pattern instead of rebuilding it.
+SBOM_FILE_PATTERN = re.compile(
+    r'(?:^|/)(?:[^/]*(?:bom|spdx|cyclonedx)[^/]*\.(?:json|xml)'
+    r'|software-bill-of-materials\.(?:json|xml)|\.sbom|\.spdx)\Z',
+    re.IGNORECASE,
+)
+
+# Every name SBOM_FILE_PATTERN accepts ends with one of these (lowercase)
+_SBOM_EXTENSIONS = ('.json', '.xml', '.sbom', '.spdx')
+
+
+def _loads(content: str) -> Any:
+    """Decode JSON SBOM content, using orjson when it is installed.
+    
+    Raises:
+        json.JSONDecodeError: If the content is not valid JSON (orjson's
+            decode error subclasses it)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
 
 @dataclass
 class SBOMComponent:
@@ -52,20 +84,11 @@ class SBOMParser:
     
     def can_parse(self, file_path: str) -> bool:
         """Check if this parser can handle the given file."""
-        file_path_lower = file_path.lower()
-        
-        # Check exact matches
-        filename = file_path_lower.split('/')[-1]
-        if filename in [p.lower() for p in self.SBOM_PATTERNS]:
-            return True
-            
-        # Check if filename contains sbom/bom keywords
-        sbom_keywords = ['sbom', 'bom', 'spdx', 'cyclonedx']
-        for keyword in sbom_keywords:
-            if keyword in filename and (filename.endswith('.json') or filename.endswith('.xml')):
-                return True
-                
-        return False
+        # Only the basename matters; a suffix check rejects most paths before
+        # the regex runs, and searching the short basename avoids rescanning
+        # every directory component
+        filename = file_path.rpartition('/')[2].lower()
+        return filename.endswith(_SBOM_EXTENSIONS) and SBOM_FILE_PATTERN.search(filename) is not None
     
     def parse(self, content: str, file_path: str) -> List[PackageDependency]:
         """Parse SBOM content and extract packages."""
@@ -83,7 +106,7 @@ class SBOMParser:
     def _parse_json_sbom(self, content: str, file_path: str) -> List[PackageDependency]:
         """Parse JSON-based SBOM formats (SPDX JSON, CycloneDX JSON)."""
         try:
-            data = json.loads(content)
+            data = _loads(content)
             
             # Handle GitHub API SBOM format (nested under 'sbom' key)
             if 'sbom' in data and isinstance(data['sbom'], dict):
@@ -402,4 +425,21 @@ class SBOMParser:
 
 
 # Note: SBOM parser is used directly in the scanner rather than through the factory
-# since it has different patterns and use cases than traditional lockfile parsers
\ No newline at end of file
+# since it has different patterns and use cases than traditional lockfile parsers
+
+
+# Global parser instance; SBOMParser keeps no per-parse state
+_parser_instance: Optional[SBOMParser] = None
+
+
+def get_sbom_parser() -> SBOMParser:
+    """
+    Get the shared SBOM parser instance.
+    
+    Returns:
+        Singleton SBOMParser instance
+    """
+    global _parser_instance
+    if _parser_instance is None:
+        _parser_instance = SBOMParser()
+    return _parser_instance
@@ -35,6 +35,7 @@ class ResourceConfig:
     memory_cleanup_threshold: float = 0.8  # Trigger cleanup at 80% memory usage
     max_resource_age_seconds: float = 300.0  # 5 minutes
     force_gc_on_cleanup: bool = True
+    gc_memory_threshold: float = 0.95  # Only force GC at 95% memory usage or above
     track_resource_usage: bool = True
 
 
@@ -247,12 +248,10 @@ class ResourceManager:
         Returns:
             Number of resources cleaned up
         """
-        cleanup_count = 0
+        # Resources are independent, so their cleanups run concurrently
         resource_ids = list(self._active_resources.keys())
-        
-        for resource_id in resource_ids:
-            if await self.cleanup_resource(resource_id):
-                cleanup_count += 1
+        cleaned = await asyncio.gather(*(self.cleanup_resource(resource_id) for resource_id in resource_ids))
+        cleanup_count = sum(cleaned)
         
         logger.info(f"Cleaned up all {cleanup_count} resources")
         return cleanup_count
@@ -273,9 +272,12 @@ class ResourceManager:
         # Clean up old resources first
         old_resources_cleaned = await self.cleanup_old_resources()
         
-        # Force garbage collection if configured
+        # Force garbage collection if configured; a full collection stalls the
+        # event loop, so it is reserved for critical memory pressure
         gc_stats = {}
-        if self.config.force_gc_on_cleanup:
+        if self.config.force_gc_on_cleanup and (
+            memory_before is None or memory_before.percent_used >= self.config.gc_memory_threshold
+        ):
             if self.memory_monitor:
                 gc_stats = self.memory_monitor.force_garbage_collection()
             else:
@@ -395,6 +397,37 @@ class ResourceManager:
             await resource.cleanup()
             self.unregister_resource(resource_id)
     
+    @asynccontextmanager
+    async def managed_resources(
+        self,
+        resource_ids: List[str],
+        resource_type: type = ManagedResource,
+        **kwargs
+    ) -> AsyncIterator[List[ManagedResource]]:
+        """Context manager for a group of resources that are cleaned up together.
+        
+        Unlike nesting managed_resource() calls, which tears resources down one
+        after another, the group's cleanups run concurrently on exit.
+        
+        Args:
+            resource_ids: Unique identifiers for the resources
+            resource_type: Type of resource to create
+            **kwargs: Additional arguments for resource creation
+            
+        Yields:
+            Managed resource instances, in the order of resource_ids
+        """
+        resources = [resource_type(resource_id, **kwargs) for resource_id in resource_ids]
+        for resource in resources:
+            self.register_resource(resource)
+        
+        try:
+            yield resources
+        finally:
+            await asyncio.gather(*(resource.cleanup() for resource in resources))
+            for resource in resources:
+                self.unregister_resource(resource.resource_id)
+    
     @asynccontextmanager
     async def managed_batch_resource(
         self,
@@ -439,6 +472,7 @@ class ResourceManager:
                 'memory_cleanup_threshold': self.config.memory_cleanup_threshold,
                 'max_resource_age_seconds': self.config.max_resource_age_seconds,
                 'force_gc_on_cleanup': self.config.force_gc_on_cleanup,
+                'gc_memory_threshold': self.config.gc_memory_threshold,
                 'track_resource_usage': self.config.track_resource_usage
             },
             'memory_stats': memory_stats
@@ -455,14 +489,22 @@ class ResourceManager:
         await self.cleanup_all_resources()
         
         # Wait for cleanup task to finish
+        # (asyncio.wait rather than wait_for, as the task was just cancelled)
         if self._cleanup_task and not self._cleanup_task.done():
-            try:
-                await asyncio.wait_for(self._cleanup_task, timeout=5.0)
-            except asyncio.TimeoutError:
+            _, pending = await asyncio.wait({self._cleanup_task}, timeout=5.0)
+            if pending:
                 logger.warning("Cleanup task did not finish within timeout")
                 self._cleanup_task.cancel()
         
         logger.info("Resource manager shutdown complete")
+    
+    async def __aenter__(self) -> "ResourceManager":
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit."""
+        await self.shutdown()
 
 
 # Global resource manager instance
@@ -1708,9 +1708,6 @@ class GitHubIOCScanner:
         matches = []
         
         try:
-            # Get all IOC packages
-            all_ioc_packages = self.ioc_loader.get_all_packages()
-            
             for package in packages:
                 if self.ioc_loader.is_package_compromised(package.name, package.version):
                     # Find which IOC definition matched
@@ -1729,7 +1726,7 @@ class GitHubIOCScanner:
                     )
                     matches.append(match)
                     
-                    logger.debug(f"IOC match: {package.name}@{package.version} in {repo.full_name}/{file_path}")
+                    logger.debug("IOC match: %s@%s in %s/%s", package.name, package.version, repo.full_name, file_path)
             
         except Exception as e:
             logger.warning(f"Error matching packages against IOCs for {repo.full_name}/{file_path}: {e}")
@@ -2415,8 +2412,8 @@ class GitHubIOCScanner:
                 return cached_packages
             
             # Parse SBOM file using SBOM parser
-            from .parsers.sbom import SBOMParser
-            parser = SBOMParser()
+            from .parsers.sbom import get_sbom_parser
+            parser = get_sbom_parser()
             
             if not parser.can_parse(file_path):
                 logger.debug(f"File {file_path} is not recognized as an SBOM file")
@@ -2,7 +2,10 @@
 
 import asyncio
 import logging
-from typing import AsyncIterator, List, Optional, Dict, Any
+from operator import attrgetter
+from typing import (
+    AsyncIterable, AsyncIterator, Iterable, Iterator, List, Optional, Dict, Any, Sequence, Set, Union, overload
+)
 from dataclasses import dataclass
 
 from .async_github_client import AsyncGitHubClient
@@ -12,6 +15,57 @@ from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+_estimated_size = attrgetter('estimated_size')
+
+
+async def _iterate_async(
+    items: Union[Iterable[BatchRequest], AsyncIterable[BatchRequest]]
+) -> AsyncIterator[BatchRequest]:
+    """Iterate a sync or async iterable with async for."""
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+class RequestChunk(Sequence[BatchRequest]):
+    """Read-only window onto a run of requests in a larger list.
+    
+    Chunks reference the caller's request list instead of copying it, so
+    splitting thousands of requests allocates one small object per chunk.
+    The underlying list must not be mutated while chunks are in use.
+    """
+    
+    __slots__ = ('_requests', '_start', '_stop')
+    
+    def __init__(self, requests: Sequence[BatchRequest], start: int, stop: int):
+        self._requests = requests
+        self._start = start
+        self._stop = min(stop, len(requests))
+    
+    def __len__(self) -> int:
+        return max(0, self._stop - self._start)
+    
+    @overload
+    def __getitem__(self, index: int) -> BatchRequest: ...
+    
+    @overload
+    def __getitem__(self, index: slice) -> List[BatchRequest]: ...
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[BatchRequest, List[BatchRequest]]:
+        if isinstance(index, slice):
+            return [self._requests[i] for i in range(self._start, self._stop)[index]]
+        return self._requests[range(self._start, self._stop)[index]]
+    
+    def __iter__(self) -> Iterator[BatchRequest]:
+        # Index directly; islice would walk the list from 0 up to _start
+        return map(self._requests.__getitem__, range(self._start, self._stop))
+    
+    def __repr__(self) -> str:
+        return f"RequestChunk([{self._start}:{self._stop}], {len(self)} requests)"
+
 
 @dataclass
 class StreamingConfig:
@@ -57,7 +111,7 @@ class StreamingBatchProcessor:
         # Semaphore for controlling concurrent chunks
         self.chunk_semaphore = asyncio.Semaphore(self.config.max_concurrent_chunks)
     
-    async def should_use_streaming(self, requests: List[BatchRequest]) -> bool:
+    def should_use_streaming(self, requests: List[BatchRequest]) -> bool:
         """Determine if streaming should be used for the given batch.
         
         Args:
@@ -76,9 +130,7 @@ class StreamingBatchProcessor:
             return True
         
         # Estimate memory usage based on request sizes
-        estimated_memory_mb = sum(
-            getattr(req, 'estimated_size', 1024) for req in requests
-        ) / (1024 * 1024)
+        estimated_memory_mb = sum(map(_estimated_size, requests)) / (1024 * 1024)
         
         if estimated_memory_mb > self.config.max_memory_per_chunk_mb * 2:
             logger.debug(f"Using streaming due to estimated memory usage: {estimated_memory_mb:.1f} MB")
@@ -86,7 +138,7 @@ class StreamingBatchProcessor:
         
         return False
     
-    def create_chunks(self, requests: List[BatchRequest]) -> List[List[BatchRequest]]:
+    def create_chunks(self, requests: List[BatchRequest]) -> List[RequestChunk]:
         """Split requests into chunks for processing.
         
         Args:
@@ -95,6 +147,37 @@ class StreamingBatchProcessor:
         Returns:
             List of request chunks
         """
+        chunk_size = self._current_chunk_size()
+        
+        # Create chunks as views onto the request list
+        chunks = [
+            RequestChunk(requests, i, i + chunk_size)
+            for i in range(0, len(requests), chunk_size)
+        ]
+        
+        logger.info(f"Created {len(chunks)} chunks with average size {len(requests) / len(chunks):.1f}")
+        return chunks
+    
+    async def iter_chunks(self, requests: List[BatchRequest]) -> AsyncIterator[RequestChunk]:
+        """Yield request chunks one at a time instead of building the full list.
+        
+        The chunk size is re-checked against memory pressure before each chunk,
+        so a long stream shrinks its chunks as soon as pressure rises.
+        
+        Args:
+            requests: List of batch requests
+            
+        Yields:
+            Request chunks in order
+        """
+        start = 0
+        while start < len(requests):
+            chunk_size = self._current_chunk_size()
+            yield RequestChunk(requests, start, start + chunk_size)
+            start += chunk_size
+    
+    def _current_chunk_size(self) -> int:
+        """Return the configured chunk size, reduced under memory pressure."""
         chunk_size = self.config.chunk_size
         
         # Adjust chunk size based on memory pressure
@@ -102,18 +185,11 @@ class StreamingBatchProcessor:
             chunk_size = self.memory_monitor.calculate_adjusted_batch_size(chunk_size)
             logger.debug(f"Adjusted chunk size to {chunk_size} due to memory pressure")
         
-        # Create chunks
-        chunks = []
-        for i in range(0, len(requests), chunk_size):
-            chunk = requests[i:i + chunk_size]
-            chunks.append(chunk)
-        
-        logger.info(f"Created {len(chunks)} chunks with average size {len(requests) / len(chunks):.1f}")
-        return chunks
+        return max(1, chunk_size)
     
     async def process_chunk_streaming(
         self,
-        chunk: List[BatchRequest],
+        chunk: Sequence[BatchRequest],
         chunk_index: int
     ) -> AsyncIterator[BatchResult]:
         """Process a single chunk and yield results as they complete.
@@ -135,29 +211,37 @@ class StreamingBatchProcessor:
             # Process requests in the chunk concurrently
             tasks = []
             for request in chunk:
-                task = self._process_single_request_streaming(request)
+                task = asyncio.ensure_future(self._process_single_request_streaming(request))
                 tasks.append(task)
             
             # Yield results as they complete
-            for completed_task in asyncio.as_completed(tasks):
-                try:
-                    result = await completed_task
-                    yield result
-                    
-                    # Check memory pressure after each result
-                    if self.memory_monitor and self.memory_monitor.is_critical_memory_pressure():
-                        logger.warning("Critical memory pressure detected, forcing garbage collection")
-                        self.memory_monitor.force_garbage_collection()
+            try:
+                for completed_task in asyncio.as_completed(tasks):
+                    try:
+                        result = await completed_task
+                        yield result
                         
-                except Exception as e:
-                    logger.error(f"Error processing request in chunk {chunk_index}: {e}")
-                    # Create error result
-                    error_result = BatchResult(
-                        request=chunk[0] if chunk else BatchRequest(None, "unknown"),  # Best effort
-                        error=e,
-                        processing_time=0.0
-                    )
-                    yield error_result
+                        # Check memory pressure after each result
+                        if self.memory_monitor and self.memory_monitor.is_critical_memory_pressure():
+                            logger.warning("Critical memory pressure detected, forcing garbage collection")
+                            self.memory_monitor.force_garbage_collection()
+                            
+                    except Exception as e:
+                        logger.error(f"Error processing request in chunk {chunk_index}: {e}")
+                        # Create error result
+                        error_result = BatchResult(
+                            request=chunk[0] if chunk else BatchRequest(None, "unknown"),  # Best effort
+                            error=e,
+                            processing_time=0.0
+                        )
+                        yield error_result
+            finally:
+                # Don't leave requests running if the chunk is cancelled or closed early
+                unfinished = [task for task in tasks if not task.done()]
+                for task in unfinished:
+                    task.cancel()
+                if unfinished:
+                    await asyncio.gather(*unfinished, return_exceptions=True)
             
             logger.debug(f"Completed chunk {chunk_index}")
     
@@ -219,32 +303,141 @@ class StreamingBatchProcessor:
         logger.info(f"Starting streaming processing of {len(requests)} requests")
         
         # Check if streaming should be used
-        use_streaming = await self.should_use_streaming(requests)
+        use_streaming = self.should_use_streaming(requests)
         if not use_streaming:
             logger.info("Streaming not needed, using regular processing")
             # Fall back to regular processing (could delegate to ParallelBatchProcessor)
             # For now, we'll still use chunked processing but with larger chunks
-            chunks = [requests]  # Single chunk
+            chunks = self._single_chunk(requests)
         else:
-            # Create chunks for streaming
-            chunks = self.create_chunks(requests)
+            # Create chunks lazily for streaming
+            chunks = self.iter_chunks(requests)
         
-        # Process chunks and yield results
-        chunk_tasks = []
-        for i, chunk in enumerate(chunks):
-            chunk_task = self.process_chunk_streaming(chunk, i)
-            chunk_tasks.append(chunk_task)
+        drained = self._drain_chunks(chunks)
+        try:
+            async for result in drained:
+                yield result
+        finally:
+            # Closing this generator early must also cancel in-flight chunks
+            await drained.aclose()
         
-        # Yield results from all chunks as they complete
-        async def process_all_chunks():
-            for chunk_task in chunk_tasks:
-                async for result in chunk_task:
-                    yield result
+        logger.info(f"Completed streaming processing of {len(requests)} requests")
+    
+    async def chunk_request_stream(
+        self,
+        requests: Union[Iterable[BatchRequest], AsyncIterable[BatchRequest]]
+    ) -> AsyncIterator[List[BatchRequest]]:
+        """Group a stream of requests into chunks as the requests arrive.
         
-        async for result in process_all_chunks():
-            yield result
+        Only the chunk being filled is held in memory. A chunk is emitted once
+        it reaches the current chunk size or its estimated file sizes reach
+        max_memory_per_chunk_mb.
         
-        logger.info(f"Completed streaming processing of {len(requests)} requests")
+        Args:
+            requests: Iterable or async iterable of batch requests
+            
+        Yields:
+            Request chunks in order
+        """
+        max_chunk_bytes = self.config.max_memory_per_chunk_mb * 1024 * 1024
+        chunk: List[BatchRequest] = []
+        chunk_bytes = 0
+        chunk_size = self._current_chunk_size()
+        
+        async for request in _iterate_async(requests):
+            chunk.append(request)
+            chunk_bytes += request.estimated_size
+            if len(chunk) >= chunk_size or chunk_bytes >= max_chunk_bytes:
+                yield chunk
+                chunk = []
+                chunk_bytes = 0
+                chunk_size = self._current_chunk_size()
+        
+        if chunk:
+            yield chunk
+    
+    async def process_request_stream(
+        self,
+        requests: Union[Iterable[BatchRequest], AsyncIterable[BatchRequest]]
+    ) -> AsyncIterator[BatchResult]:
+        """Process a stream of requests without materializing it as a list.
+        
+        Args:
+            requests: Iterable or async iterable of batch requests
+            
+        Yields:
+            BatchResult objects as they complete
+        """
+        drained = self._drain_chunks(self.chunk_request_stream(requests))
+        try:
+            async for result in drained:
+                yield result
+        finally:
+            # Closing this generator early must also cancel in-flight chunks
+            await drained.aclose()
+    
+    async def _drain_chunks(
+        self,
+        chunks: AsyncIterator[Sequence[BatchRequest]]
+    ) -> AsyncIterator[BatchResult]:
+        """Process chunks from an iterator with bounded look-ahead.
+        
+        Memory is bounded by capping in-flight chunks at
+        ``max_concurrent_chunks * 2`` rather than by a ``maxsize`` on the
+        result queue: chunk tasks enqueue their own completion marker from a
+        done callback, which cannot block on a full queue.
+        
+        Args:
+            chunks: Async iterator of request chunks
+            
+        Yields:
+            BatchResult objects as they complete
+        """
+        # At most this many chunks are pulled from the iterator and in flight at
+        # once; the rest are only sliced off once earlier chunks have drained
+        max_pending_chunks = self.config.max_concurrent_chunks * 2
+        results: asyncio.Queue = asyncio.Queue()
+        pending: Set[asyncio.Task] = set()
+        chunks_exhausted = False
+        chunk_index = 0
+        
+        async def drain_chunk(chunk: Sequence[BatchRequest], index: int) -> None:
+            async for result in self.process_chunk_streaming(chunk, index):
+                await results.put(result)
+        
+        try:
+            while True:
+                while not chunks_exhausted and len(pending) < max_pending_chunks:
+                    try:
+                        chunk = await chunks.__anext__()
+                    except StopAsyncIteration:
+                        chunks_exhausted = True
+                        break
+                    task = asyncio.ensure_future(drain_chunk(chunk, chunk_index))
+                    # The finished task itself is queued as the end-of-chunk marker
+                    task.add_done_callback(results.put_nowait)
+                    pending.add(task)
+                    chunk_index += 1
+                
+                if not pending:
+                    break
+                
+                item = await results.get()
+                if isinstance(item, asyncio.Task):
+                    pending.discard(item)
+                    item.result()  # Surface unexpected chunk failures
+                    continue
+                yield item
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+    
+    @staticmethod
+    async def _single_chunk(requests: List[BatchRequest]) -> AsyncIterator[List[BatchRequest]]:
+        """Yield all requests as one chunk."""
+        yield requests
     
     async def process_batch_streaming_collect(
         self,
@@ -286,7 +479,7 @@ class StreamingBatchProcessor:
             return self.memory_monitor.force_garbage_collection()
         return None
     
-    async def estimate_memory_usage(self, requests: List[BatchRequest]) -> float:
+    def estimate_memory_usage(self, requests: List[BatchRequest]) -> float:
         """Estimate memory usage for processing the given requests.
         
         Args:
@@ -298,10 +491,8 @@ class StreamingBatchProcessor:
         # Base memory per request (rough estimate)
         base_memory_per_request = 0.1  # 100KB base
         
-        # Add estimated file sizes
-        total_estimated_size = sum(
-            getattr(req, 'estimated_size', 1024) for req in requests
-        )
+        # Add estimated file sizes (map/attrgetter keeps the loop in C)
+        total_estimated_size = sum(map(_estimated_size, requests))
         
         # Convert to MB and add overhead
         estimated_mb = (total_estimated_size / (1024 * 1024)) + (len(requests) * base_memory_per_request)
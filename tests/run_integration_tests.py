@@ -6,47 +6,102 @@ This script runs all integration tests and provides a summary of results.
 It can be used to verify that all integration test scenarios are working correctly.
 """
 
-import subprocess
+import multiprocessing
+import os
 import sys
+import tempfile
 import time
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 
+import pytest
 
-def run_test_suite(test_file: str, description: str) -> tuple[bool, float, str]:
-    """Run a test suite and return results."""
+SUITE_TIMEOUT = 300  # 5 minute timeout
+OUTPUT_TAIL_BYTES = 8192  # Log tail shown for failed suites
+
+# Forked workers inherit this already-warm interpreter (pytest and the package
+# imports) instead of paying a fresh `python -m pytest` startup per suite
+_MP_CONTEXT = multiprocessing.get_context(
+    "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+def _run_pytest(test_file: str, log_path: Path, conn) -> None:
+    """Run pytest in a worker process, streaming its output to a log file."""
+    start_time = time.time()
+    
+    # Line buffered so the log can be followed while the suite runs
+    with open(log_path, "w", encoding="utf-8", errors="replace", buffering=1) as log:
+        try:
+            with redirect_stdout(log), redirect_stderr(log):
+                exit_code = int(pytest.main([test_file, "-v", "--tb=short", "-p", "no:cacheprovider"]))
+        except BaseException as e:
+            exit_code = -1
+            log.write(f"{e}\n")
+    
+    conn.send((exit_code, time.time() - start_time))
+    conn.close()
+
+
+def _read_log_tail(log_path: Path) -> str:
+    """Read the last OUTPUT_TAIL_BYTES of a suite log."""
+    try:
+        with open(log_path, "rb") as log:
+            log.seek(0, os.SEEK_END)
+            log.seek(max(0, log.tell() - OUTPUT_TAIL_BYTES))
+            return log.read().decode("utf-8", errors="replace")
+    except OSError as e:
+        return f"Could not read {log_path}: {e}"
+
+
+def start_test_suite(test_file: str, description: str, log_dir: Path):
+    """Start a test suite in its own worker process."""
+    log_path = log_dir / f"{Path(test_file).stem}.log"
+    
     print(f"\n{'='*60}")
     print(f"Running {description}")
+    print(f"Log: {log_path}")
     print(f"{'='*60}")
     
-    start_time = time.time()
+    receiver, sender = _MP_CONTEXT.Pipe(duplex=False)
+    process = _MP_CONTEXT.Process(target=_run_pytest, args=(test_file, log_path, sender), daemon=True)
+    process.start()
+    sender.close()
+    
+    return process, receiver, time.time(), log_path
+
+
+def wait_for_test_suite(running, description: str) -> tuple[bool, float, str]:
+    """Wait for a started test suite and return results."""
+    process, receiver, start_time, log_path = running
     
     try:
-        result = subprocess.run(
-            [sys.executable, "-m", "pytest", test_file, "-v"],
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
+        remaining = max(0.0, start_time + SUITE_TIMEOUT - time.time())
+        if not receiver.poll(remaining):
+            process.terminate()
+            duration = time.time() - start_time
+            print(f"⏰ {description} - TIMEOUT ({duration:.2f}s)")
+            return False, duration, "Test suite timed out"
         
-        duration = time.time() - start_time
+        exit_code, duration = receiver.recv()
         
-        if result.returncode == 0:
+        if exit_code == 0:
             print(f"✅ {description} - PASSED ({duration:.2f}s)")
-            return True, duration, result.stdout
+            return True, duration, str(log_path)
         else:
+            output = _read_log_tail(log_path)
             print(f"❌ {description} - FAILED ({duration:.2f}s)")
-            print("STDOUT:", result.stdout)
-            print("STDERR:", result.stderr)
-            return False, duration, result.stderr
+            print(f"OUTPUT (last {OUTPUT_TAIL_BYTES // 1024} KB, full log: {log_path}):")
+            print(output)
+            return False, duration, output
             
-    except subprocess.TimeoutExpired:
-        duration = time.time() - start_time
-        print(f"⏰ {description} - TIMEOUT ({duration:.2f}s)")
-        return False, duration, "Test suite timed out"
     except Exception as e:
         duration = time.time() - start_time
         print(f"💥 {description} - ERROR ({duration:.2f}s): {e}")
         return False, duration, str(e)
+    finally:
+        receiver.close()
+        process.join()
 
 
 def main():
@@ -62,19 +117,26 @@ def main():
         ("tests/test_performance.py", "Performance Tests"),
     ]
     
-    # Track results
-    results = []
+    # Track results, keeping the summary in suite order
+    results = [None] * len(test_suites)
+    log_dir = Path(tempfile.mkdtemp(prefix="ioc-scanner-integration-"))
     total_start_time = time.time()
     
-    # Run each test suite
-    for test_file, description in test_suites:
+    # Start every suite before waiting so they run concurrently; each worker
+    # is started from the main thread, which keeps forking safe
+    running = {}
+    for index, (test_file, description) in enumerate(test_suites):
         if not Path(test_file).exists():
             print(f"⚠️  Skipping {description} - file not found: {test_file}")
-            results.append((description, False, 0, "File not found"))
+            results[index] = (description, False, 0, "File not found")
             continue
-            
-        success, duration, output = run_test_suite(test_file, description)
-        results.append((description, success, duration, output))
+        
+        running[index] = start_test_suite(test_file, description, log_dir)
+    
+    for index, suite in running.items():
+        description = test_suites[index][1]
+        success, duration, output = wait_for_test_suite(suite, description)
+        results[index] = (description, success, duration, output)
     
     total_duration = time.time() - total_start_time
     
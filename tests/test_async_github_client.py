@@ -718,4 +718,45 @@ class TestAsyncGitHubClient:
             result = await client.get_file_content_chunked(mock_repo, "huge.json")
             
             # Should return None for files that are too large
-            assert result is None
\ No newline at end of file
+            assert result is None
+    
+    @pytest.mark.asyncio
+    async def test_low_rate_limit_budget_pauses_requests(self, client):
+        """Test that a nearly spent budget holds back requests until the reset."""
+        response = Mock()
+        response.status_code = 200
+        response.content = b'{"ok": true}'
+        response.headers = {
+            'X-RateLimit-Remaining': '3',
+            'X-RateLimit-Limit': '5000',
+            'X-RateLimit-Reset': str(int(datetime.now().timestamp()) + 60)
+        }
+        response.raise_for_status = Mock()
+        
+        mock_session = AsyncMock()
+        mock_session.request.return_value = response
+        
+        with patch.object(client, '_get_session', return_value=mock_session):
+            result = await client._make_request("GET", "/repos/owner/repo")
+        
+        assert result.data == {"ok": True}
+        assert not client._rate_limit_open.is_set()
+        
+        client._resume_requests()
+        assert client._rate_limit_open.is_set()
+    
+    @pytest.mark.asyncio
+    async def test_pause_requests_only_extends(self, client):
+        """Test that a shorter pause never cuts an existing one short."""
+        client._pause_requests(30)
+        resume_at = client._rate_limit_resume.when()
+        
+        client._pause_requests(1)
+        assert client._rate_limit_resume.when() == resume_at
+        
+        client._pause_requests(0.01)
+        client._pause_requests(-5)
+        assert not client._rate_limit_open.is_set()
+        
+        client._rate_limit_resume.cancel()
+        client._resume_requests()
@@ -197,6 +197,17 @@ class TestBatchCoordinatorLifecycle:
         
         batch_coordinator._wait_for_active_operations.assert_called_once()
         batch_coordinator.cache_coordinator.stop.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_cleanup_keeps_github_client_open(self, batch_coordinator, mock_github_client):
+        """Test cleanup releases coordinator state but leaves the shared client open."""
+        batch_coordinator.operation_history.append({'type': 'test', 'status': 'completed'})
+        
+        await batch_coordinator.cleanup()
+        
+        assert batch_coordinator.operation_history == []
+        batch_coordinator.cache_coordinator.stop.assert_called_once()
+        mock_github_client.aclose.assert_not_called()
 
 
 class TestRepositoryBatchProcessing:
@@ -535,6 +546,107 @@ class TestFileBatchProcessing:
             "test_op_1", success=False, error="Request creation failed"
         )
 
+    
+    @pytest.mark.asyncio
+    async def test_iter_files_batch_streams_results(self, batch_coordinator, sample_repositories, sample_file_paths):
+        """Test streaming file batch results one batch at a time."""
+        repo = sample_repositories[0]
+        batch_requests = [
+            BatchRequest(repo=repo, file_path=path, priority=5, estimated_size=1000)
+            for path in sample_file_paths
+        ]
+        cached_results = [
+            BatchResult(
+                request=batch_requests[0],
+                content=FileContent(content="cached content", sha="abc123", size=100),
+                from_cache=True
+            )
+        ]
+        batch_coordinator._create_prioritized_batch_requests = AsyncMock(return_value=batch_requests)
+        batch_coordinator.cache_coordinator.coordinate_batch_operation.return_value = (
+            cached_results, batch_requests[1:]
+        )
+        batch_coordinator.strategy_manager.calculate_optimal_batch_size.return_value = 2
+        
+        async def process_batch(batch):
+            return [
+                BatchResult(
+                    request=req,
+                    content=FileContent(content="api content", sha="def456", size=200),
+                    error=None if req.file_path != "README.md" else Exception("not found")
+                )
+                for req in batch
+            ]
+        batch_coordinator.parallel_processor.process_batch_parallel = AsyncMock(side_effect=process_batch)
+        batch_coordinator._create_operation = AsyncMock(return_value="test_op_1")
+        batch_coordinator._complete_operation = AsyncMock()
+        
+        streamed = [
+            (path, content.content)
+            async for path, content in batch_coordinator.iter_files_batch(repo, sample_file_paths)
+        ]
+        
+        assert streamed[0] == ("package.json", "cached content")
+        assert [path for path, _ in streamed] == [p for p in sample_file_paths if p != "README.md"]
+        # One finalize for the cached results plus one per API batch
+        assert batch_coordinator.parallel_processor.process_batch_parallel.call_count == 2
+        assert batch_coordinator.cache_coordinator.finalize_batch_operation.call_count == 3
+        batch_coordinator._complete_operation.assert_called_once_with("test_op_1", success=True)
+    
+    @pytest.mark.asyncio
+    async def test_iter_files_batch_early_stop_completes_operation(self, batch_coordinator, sample_repositories, sample_file_paths):
+        """Test that stopping a file stream early still completes its operation."""
+        repo = sample_repositories[0]
+        batch_requests = [
+            BatchRequest(repo=repo, file_path=path, priority=5, estimated_size=1000)
+            for path in sample_file_paths
+        ]
+        cached_results = [
+            BatchResult(
+                request=req,
+                content=FileContent(content="cached content", sha="abc123", size=100),
+                from_cache=True
+            )
+            for req in batch_requests
+        ]
+        batch_coordinator._create_prioritized_batch_requests = AsyncMock(return_value=batch_requests)
+        batch_coordinator.cache_coordinator.coordinate_batch_operation.return_value = (cached_results, [])
+        
+        stream = batch_coordinator.iter_files_batch(repo, sample_file_paths)
+        async for path, _ in stream:
+            assert path == sample_file_paths[0]
+            break
+        await stream.aclose()
+        
+        assert batch_coordinator.active_operations == {}
+        assert batch_coordinator.operation_history[-1]['status'] == 'completed'
+    
+    @pytest.mark.asyncio
+    async def test_iter_files_batch_empty(self, batch_coordinator, sample_repositories):
+        """Test streaming an empty file list yields nothing."""
+        streamed = [item async for item in batch_coordinator.iter_files_batch(sample_repositories[0], [])]
+        
+        assert streamed == []
+
+    
+    @pytest.mark.asyncio
+    async def test_response_memory_budget_applies_backpressure(self, batch_coordinator):
+        """Test that reservations beyond the memory budget wait for a release."""
+        batch_coordinator._response_memory_budget = 100
+        
+        first = await batch_coordinator._reserve_response_memory(80)
+        second = asyncio.create_task(batch_coordinator._reserve_response_memory(50))
+        await asyncio.sleep(0)
+        assert not second.done()
+        
+        await batch_coordinator._release_response_memory(first)
+        assert await asyncio.wait_for(second, timeout=1) == 50
+        assert batch_coordinator._response_memory_in_use == 50
+        
+        # Oversized batches are capped at the budget instead of blocking forever
+        await batch_coordinator._release_response_memory(50)
+        assert await batch_coordinator._reserve_response_memory(500) == 100
+
 
 class TestBatchMetrics:
     """Test batch metrics functionality."""
@@ -987,6 +1099,18 @@ class TestInternalMethods:
         
         assert opportunities == []
     
+    @pytest.mark.asyncio
+    async def test_analyze_cross_repo_opportunities_shared_files(self, batch_coordinator, sample_repositories):
+        """Test cross-repo analysis finds opportunities for repos sharing files."""
+        batch_coordinator.strategy_manager = BatchStrategyManager(batch_coordinator.config)
+        
+        opportunities = await batch_coordinator._analyze_cross_repo_opportunities(sample_repositories)
+        
+        assert opportunities
+        assert {repo.full_name for repo in opportunities[0].repositories} == {
+            repo.full_name for repo in sample_repositories
+        }
+    
     @pytest.mark.asyncio
     async def test_format_file_batch_results(self, batch_coordinator, sample_repositories):
         """Test formatting of file batch results."""
@@ -1,6 +1,7 @@
 """Tests for batch processing models."""
 
 import asyncio
+import sys
 from datetime import datetime
 from unittest.mock import Mock
 
@@ -46,6 +47,23 @@ class TestBatchRequest:
         assert request.estimated_size == 1024
         assert request.cache_key == "owner/test-repo:package.json"
     
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10")
+    def test_batch_request_is_slotted(self):
+        """Test that batch requests carry no per-instance __dict__."""
+        repo = Repository(
+            name="test-repo",
+            full_name="owner/test-repo",
+            archived=False,
+            default_branch="main",
+            updated_at=datetime.now()
+        )
+        
+        request = BatchRequest(repo=repo, file_path="package.json")
+        
+        assert not hasattr(request, "__dict__")
+        request.priority = 5
+        assert request.priority == 5
+    
     def test_batch_request_custom_cache_key(self):
         """Test batch request with custom cache key."""
         repo = Repository(
@@ -231,6 +249,18 @@ class TestBatchConfig:
         assert any("max_batch_size" in error for error in errors)
         assert any("rate_limit_buffer" in error for error in errors)
         assert any("retry_attempts" in error for error in errors)
+    
+    def test_batch_config_replace(self):
+        """Test deriving a configuration with overrides."""
+        base = BatchConfig(default_batch_size=12, retry_attempts=4)
+        derived = base.replace(max_memory_usage_mb=250, retry_attempts=6)
+        
+        assert derived is not base
+        assert derived.max_memory_usage_mb == 250
+        assert derived.retry_attempts == 6
+        assert derived.default_batch_size == 12
+        assert base.retry_attempts == 4
+        assert base.max_memory_usage_mb == 500
 
 
 class TestNetworkConditions:
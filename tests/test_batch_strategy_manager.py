@@ -1053,6 +1053,24 @@ class TestCrossRepositoryBatchingAnalysis:
         ]
         assert len(dockerfile_groups) > 0
     
+    def test_find_common_files_groups_every_sharing_repo(self):
+        """Test that each group lists all repos sharing the files, in input order."""
+        repo_files = {
+            "org/repo1": ["package.json", "dockerfile"],
+            "org/repo2": ["requirements.txt"],
+            "org/repo3": ["package.json", "dockerfile", "yarn.lock"],
+            "org/repo4": ["requirements.txt", "package.json", "dockerfile"]
+        }
+        
+        common_files_map = self.manager._find_common_files(repo_files)
+        
+        assert common_files_map[("dockerfile", "package.json")] == [
+            "org/repo1", "org/repo3", "org/repo4"
+        ]
+        assert common_files_map[("package.json",)] == ["org/repo1", "org/repo3", "org/repo4"]
+        assert common_files_map[("requirements.txt",)] == ["org/repo2", "org/repo4"]
+        assert ("yarn.lock",) not in common_files_map
+    
     def test_important_file_identification(self):
         """Test identification of important files for cross-repo batching."""
         # Important files should be identified correctly
@@ -49,9 +49,11 @@ class TestCacheManager:
         Path(cache_path).unlink(missing_ok=True)
     
     @patch('platform.system')
-    def test_default_cache_path_windows(self, mock_system):
+    def test_default_cache_path_windows(self, mock_system, tmp_path, monkeypatch):
         """Test default cache path resolution on Windows."""
         mock_system.return_value = 'Windows'
+        # 'C:/...' is a relative path off Windows, so keep the database out of the repo
+        monkeypatch.chdir(tmp_path)
         
         with patch('pathlib.Path.home') as mock_home:
             mock_home.return_value = Path('C:/Users/testuser')
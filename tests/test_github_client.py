@@ -87,6 +87,23 @@ class TestGitHubClientRequests:
         assert not response.not_modified
         assert response.rate_limit_remaining == 4999
 
+    def test_make_request_caches_rate_limit_headers(self, client, mock_response):
+        """Test that rate limit headers are cached per resource."""
+        mock_response.headers["X-RateLimit-Limit"] = "30"
+        mock_response.headers["X-RateLimit-Resource"] = "search"
+        
+        assert client.get_cached_rate_limit("search") is None
+        
+        with patch.object(client.client, "request", return_value=mock_response):
+            client._make_request("GET", "/search/code")
+        
+        cached = client.get_cached_rate_limit("search")
+        assert cached["limit"] == 30
+        assert cached["remaining"] == 4999
+        assert cached["reset"] == int(mock_response.headers["X-RateLimit-Reset"])
+        assert client.get_cached_rate_limit("core") is None
+        assert client.get_cached_rate_limit("search", max_age=-1) is None
+
     def test_make_request_with_etag(self, client, mock_response):
         """Test request with ETag header."""
         with patch.object(client.client, "request", return_value=mock_response) as mock_request:
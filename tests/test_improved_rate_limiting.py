@@ -0,0 +1,60 @@
+"""
+Tests for the token bucket in improved_rate_limiting.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.github_ioc_scanner.improved_rate_limiting import TokenBucket
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket."""
+    
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_refill_when_empty(self):
+        """Test that acquire sleeps for the missing tokens at the refill rate."""
+        bucket = TokenBucket(capacity=10, window_seconds=10)
+        bucket.sync(remaining=0)
+        
+        with patch("src.github_ioc_scanner.improved_rate_limiting.asyncio.sleep") as mock_sleep:
+            mock_sleep.return_value = None
+            await bucket.acquire()
+        
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args[0][0] == pytest.approx(1.0, abs=0.01)
+    
+    @pytest.mark.asyncio
+    async def test_acquire_does_not_wait_with_tokens(self):
+        """Test that acquire returns immediately while tokens remain."""
+        bucket = TokenBucket(capacity=5, window_seconds=60)
+        
+        await asyncio.wait_for(bucket.acquire(3), timeout=0.1)
+        
+        assert bucket.tokens == pytest.approx(2, abs=0.01)
+    
+    def test_sync_adopts_header_limit(self):
+        """Test that sync tracks remaining and limit from response headers."""
+        bucket = TokenBucket(capacity=5000, window_seconds=3600)
+        
+        bucket.sync(remaining=100, limit=15000)
+        
+        assert bucket.tokens == pytest.approx(100, abs=0.1)
+        assert bucket.capacity == 15000
+        assert bucket.base_rate == pytest.approx(15000 / 3600)
+    
+    def test_penalize_and_reward_adjust_rate(self):
+        """Test multiplicative decrease and bounded increase of the refill rate."""
+        bucket = TokenBucket(capacity=3600, window_seconds=3600)
+        
+        bucket.penalize()
+        assert bucket.rate == pytest.approx(0.5)
+        
+        bucket.reward()
+        assert bucket.rate == pytest.approx(0.55)
+        
+        for _ in range(20):
+            bucket.reward()
+        assert bucket.rate == pytest.approx(1.0)
@@ -322,6 +322,31 @@ IOC_PACKAGES = {
         # Test non-existent package
         self.assertFalse(loader.is_package_compromised("non-existent", "1.0.0"))
     
+    def test_merged_packages_rebuilt_after_reload(self):
+        """Test that the cached merged lookup is refreshed when IOCs are reloaded."""
+        self.create_ioc_file("test.py", '''
+IOC_PACKAGES = {
+    "pkg1": ["1.0.0"],
+}
+''')
+        
+        loader = IOCLoader(str(self.issues_dir))
+        loader.load_iocs()
+        self.assertFalse(loader.is_package_compromised("pkg1", "1.0.1"))
+        
+        # Returned dictionaries are copies and do not affect the lookup
+        loader.get_all_packages()["pkg1"] = None
+        self.assertFalse(loader.is_package_compromised("pkg1", "1.0.1"))
+        
+        self.create_ioc_file("test.py", '''
+IOC_PACKAGES = {
+    "pkg1": ["1.0.0", "1.0.1"],
+}
+''')
+        loader.load_iocs()
+        
+        self.assertTrue(loader.is_package_compromised("pkg1", "1.0.1"))
+    
     def test_is_package_compromised_no_definitions(self):
         """Test error when checking compromise without loading definitions."""
         loader = IOCLoader(str(self.issues_dir))
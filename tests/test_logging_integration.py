@@ -8,7 +8,9 @@ from unittest.mock import patch, MagicMock
 
 import pytest
 
-from src.github_ioc_scanner.logging_config import setup_logging, log_user_message, log_rate_limit_debug
+from src.github_ioc_scanner.logging_config import (
+    setup_logging, log_user_message, log_rate_limit_debug, log_rate_limit, format_reset_timestamp
+)
 from src.github_ioc_scanner.error_message_formatter import ErrorMessageFormatter
 from src.github_ioc_scanner.models import ScanConfig
 
@@ -191,7 +193,60 @@ class TestLoggingIntegration:
             finally:
                 if os.path.exists(log_file_path):
                     os.unlink(log_file_path)
+    
+    def test_log_rate_limit_formats_reset_time_once_per_window(self, caplog):
+        """Test that the reset time is formatted once and reused for each log line."""
+        from datetime import datetime
+        
+        logger = logging.getLogger("test_rate_limit_window")
+        reset_time = 1893456000  # 2030-01-01 UTC
+        format_reset_timestamp.cache_clear()
+        
+        with caplog.at_level(logging.INFO, logger="test_rate_limit_window"):
+            log_rate_limit(logger, 50, reset_time)
+            log_rate_limit(logger, 49, reset_time)
+        
+        expected = str(datetime.fromtimestamp(reset_time))
+        assert [record.getMessage() for record in caplog.records] == [
+            f"⚠️  Rate limit low: 50 requests remaining, resets at {expected}",
+            f"⚠️  Rate limit low: 49 requests remaining, resets at {expected}",
+        ]
+        assert format_reset_timestamp.cache_info().misses == 1
+    
+    def test_setup_logging_non_blocking_routes_through_queue(self):
+        """Test that non-blocking logging delivers records, with tracebacks, via the listener."""
+        from logging.handlers import QueueHandler
+        from src.github_ioc_scanner import logging_config
+        
+        with tempfile.NamedTemporaryFile(mode='w', delete=False) as log_file:
+            log_file_path = log_file.name
+        
+        try:
+            setup_logging(level="INFO", log_file=log_file_path, non_blocking=True)
+            root_handlers = logging.getLogger().handlers
+            assert len(root_handlers) == 1
+            assert isinstance(root_handlers[0], QueueHandler)
+            
+            logger = logging.getLogger("test_non_blocking")
+            logger.info("Queued message")
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                logger.error("Queued failure", exc_info=True)
+            
+            # Stopping the listener flushes the queue
+            logging_config._stop_queue_listener()
+            with open(log_file_path, 'r') as f:
+                log_content = f.read()
+            assert "Queued message" in log_content
+            assert "Traceback" in log_content and "ValueError: boom" in log_content
+        finally:
+            logging_config._stop_queue_listener()
+            for handler in logging.getLogger().handlers[:]:
+                logging.getLogger().removeHandler(handler)
+                handler.close()
+            os.unlink(log_file_path)
 
 
 if __name__ == "__main__":
-    pytest.main([__file__])
\ No newline at end of file
+    pytest.main([__file__])
@@ -23,6 +23,12 @@ class MockVirtualMemory:
     percent: float
 
 
+@pytest.fixture(autouse=True)
+def psutil_process_source(monkeypatch):
+    """Route process memory reads through psutil so the psutil mocks apply."""
+    monkeypatch.setattr('src.github_ioc_scanner.memory_monitor._STATM_PATH', '/nonexistent/statm')
+
+
 class TestMemoryMonitor:
     """Test memory monitoring functionality."""
     
@@ -371,6 +377,38 @@ class TestMemoryMonitor:
         assert monitor.max_batch_size == 30
         assert monitor._baseline_memory is None
         assert monitor._peak_memory == 0.0
+    
+    def test_statm_process_matches_psutil_rss(self, monkeypatch):
+        """Test that the /proc/self/statm reader reports the same RSS as psutil."""
+        import os
+        import psutil
+        from src.github_ioc_scanner import memory_monitor
+        
+        monkeypatch.undo()
+        if not os.path.exists(memory_monitor._STATM_PATH) or not hasattr(os, 'pread'):
+            pytest.skip("procfs not available")
+        
+        source = memory_monitor._open_process_memory_source()
+        
+        assert isinstance(source, memory_monitor._StatmProcess)
+        # Allow for allocations between the two reads
+        assert abs(source.memory_info().rss - psutil.Process().memory_info().rss) < 16 * 1024 * 1024
+    
+    def test_system_memory_snapshot_is_reused_within_ttl(self):
+        """Test that /proc/meminfo is not re-read on every call."""
+        monitor = MemoryMonitor()
+        
+        with patch('src.github_ioc_scanner.memory_monitor.psutil.virtual_memory') as mock_virtual_memory:
+            mock_virtual_memory.return_value = MockVirtualMemory(
+                total=8 * 1024 * 1024 * 1024,
+                available=4 * 1024 * 1024 * 1024,
+                used=4 * 1024 * 1024 * 1024,
+                percent=50.0
+            )
+            monitor.get_memory_stats()
+            monitor.get_memory_stats()
+        
+        assert mock_virtual_memory.call_count == 1
 
 
 class TestMemoryStats:
@@ -396,4 +434,4 @@ class TestMemoryStats:
 
 
 if __name__ == '__main__':
-    pytest.main([__file__])
\ No newline at end of file
+    pytest.main([__file__])
@@ -1,5 +1,8 @@
 """Tests for core data models."""
 
+import copy
+import pickle
+
 import pytest
 from datetime import datetime
 
@@ -61,6 +64,37 @@ def test_repository():
     assert repo.default_branch == "main"
 
 
+def test_repository_is_immutable_and_hashable():
+    """Test Repository is frozen, slotted and usable as a dict key."""
+    repo = Repository(
+        name="test-repo",
+        full_name="org/test-repo",
+        archived=False,
+        default_branch="main",
+        updated_at=datetime(2023, 1, 1),
+    )
+    with pytest.raises(AttributeError):
+        repo.name = "other"
+    assert not hasattr(repo, "__dict__")
+    assert {repo: 1}[repo] == 1
+
+
+def test_repository_pickle_and_copy_round_trip():
+    """Test Repository survives pickle, copy and deepcopy despite being frozen."""
+    repo = Repository(
+        name="test-repo",
+        full_name="org/test-repo",
+        archived=True,
+        default_branch="main",
+        updated_at=datetime(2023, 1, 1),
+    )
+    
+    for clone in (pickle.loads(pickle.dumps(repo)), copy.copy(repo), copy.deepcopy(repo)):
+        assert clone == repo
+        assert clone is not repo
+        assert hash(clone) == hash(repo)
+
+
 def test_package_dependency():
     """Test PackageDependency data class."""
     dep = PackageDependency(
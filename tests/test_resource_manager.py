@@ -315,6 +315,7 @@ class TestResourceManager:
             # Mock memory stats
             mock_memory_stats = MagicMock()
             mock_memory_stats.process_mb = 100.0
+            mock_memory_stats.percent_used = 0.5
             mock_stats.side_effect = [
                 mock_memory_stats,  # Before cleanup
                 MagicMock(process_mb=90.0)  # After cleanup
@@ -324,6 +325,8 @@ class TestResourceManager:
             
             cleanup_stats = await self.manager.perform_memory_cleanup()
             
+            # No forced collection below the GC threshold
+            mock_gc.assert_not_called()
             assert 'old_resources_cleaned' in cleanup_stats
             assert cleanup_stats['old_resources_cleaned'] == 1
             assert cleanup_stats['memory_freed_mb'] == 10.0
@@ -335,6 +338,20 @@ class TestResourceManager:
             assert self.manager.stats.total_memory_freed_mb == 10.0
             assert self.manager.stats.last_cleanup_time is not None
     
+    @pytest.mark.asyncio
+    async def test_perform_memory_cleanup_forces_gc_under_critical_pressure(self):
+        """Test that garbage collection is forced only at the GC memory threshold."""
+        with patch.object(self.manager.memory_monitor, 'get_memory_stats') as mock_stats, \
+             patch.object(self.manager.memory_monitor, 'force_garbage_collection') as mock_gc:
+            
+            mock_stats.return_value = MagicMock(process_mb=100.0, percent_used=0.97)
+            mock_gc.return_value = {'objects_collected': 42}
+            
+            cleanup_stats = await self.manager.perform_memory_cleanup()
+            
+            mock_gc.assert_called_once()
+            assert cleanup_stats['gc_stats'] == {'objects_collected': 42}
+    
     def test_should_perform_cleanup_with_memory_monitoring(self):
         """Test cleanup decision with memory monitoring."""
         with patch.object(self.manager.memory_monitor, 'get_memory_stats') as mock_stats:
@@ -376,6 +393,28 @@ class TestResourceManager:
         assert resource.is_cleaned_up
         assert "context-resource" not in self.manager._active_resources
     
+    @pytest.mark.asyncio
+    async def test_managed_resources_clean_up_concurrently(self):
+        """Test that a resource group is cleaned up concurrently on exit."""
+        in_flight = 0
+        max_in_flight = 0
+        
+        async def slow_close():
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+        
+        resource_ids = [f"group-resource-{i}" for i in range(3)]
+        async with self.manager.managed_resources(resource_ids, cleanup_callback=slow_close) as resources:
+            assert [resource.resource_id for resource in resources] == resource_ids
+            assert all(rid in self.manager._active_resources for rid in resource_ids)
+        
+        assert all(resource.is_cleaned_up for resource in resources)
+        assert not self.manager._active_resources
+        assert max_in_flight == 3
+    
     @pytest.mark.asyncio
     async def test_managed_batch_resource_context_manager(self):
         """Test managed batch resource context manager."""
@@ -450,6 +489,20 @@ class TestResourceManager:
         # All resources should be cleaned up
         assert all(resource.is_cleaned_up for resource in resources)
         assert len(self.manager._active_resources) == 0
+    
+    @pytest.mark.asyncio
+    async def test_context_manager_shuts_down_running_cleanup(self):
+        """Test that leaving the context stops auto cleanup and cleans up resources."""
+        config = ResourceConfig(auto_cleanup_enabled=True, cleanup_interval_seconds=0.1)
+        
+        async with ResourceManager(config) as manager:
+            resource = ManagedResource("resource-ctx")
+            manager.register_resource(resource)
+            cleanup_task = manager._cleanup_task
+            assert not cleanup_task.done()
+        
+        assert cleanup_task.done()
+        assert resource.is_cleaned_up
 
 
 class TestGlobalResourceManager:
@@ -492,6 +545,7 @@ class TestResourceConfig:
         assert config.memory_cleanup_threshold == 0.8
         assert config.max_resource_age_seconds == 300.0
         assert config.force_gc_on_cleanup is True
+        assert config.gc_memory_threshold == 0.95
         assert config.track_resource_usage is True
     
     def test_custom_config(self):
@@ -4,7 +4,7 @@ import json
 import pytest
 from unittest.mock import Mock, patch
 
-from src.github_ioc_scanner.parsers.sbom import SBOMParser
+from src.github_ioc_scanner.parsers.sbom import SBOMParser, SBOM_FILE_PATTERN, get_sbom_parser
 from src.github_ioc_scanner.models import PackageDependency
 
 
@@ -39,6 +39,23 @@ class TestSBOMParser:
         assert not self.parser.can_parse("requirements.txt")
         assert not self.parser.can_parse("random.txt")
 
+    def test_can_parse_matches_basename_only(self):
+        """Test that SBOM detection only looks at the file's own name."""
+        assert self.parser.can_parse("reports/.sbom")
+        assert self.parser.can_parse("reports/.SPDX")
+        assert self.parser.can_parse("docs/software-bill-of-materials.xml")
+        assert not self.parser.can_parse("sbom.json/notes.txt")
+        assert not self.parser.can_parse("sbom-reports/package.json")
+        assert not self.parser.can_parse("bom.json.bak")
+        assert SBOM_FILE_PATTERN.search("deep/path/Project-BOM.XML")
+
+    def test_get_sbom_parser_returns_shared_instance(self):
+        """Test that the shared SBOM parser is created once and reused."""
+        parser = get_sbom_parser()
+        
+        assert isinstance(parser, SBOMParser)
+        assert get_sbom_parser() is parser
+
     def test_parse_spdx_json(self):
         """Test parsing SPDX JSON format."""
         spdx_content = {
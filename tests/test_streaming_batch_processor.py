@@ -6,7 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
 
 from src.github_ioc_scanner.streaming_batch_processor import (
-    StreamingBatchProcessor, StreamingConfig
+    RequestChunk, StreamingBatchProcessor, StreamingConfig
 )
 from src.github_ioc_scanner.async_github_client import AsyncGitHubClient
 from src.github_ioc_scanner.batch_models import BatchRequest, BatchConfig
@@ -91,27 +91,24 @@ class TestStreamingBatchProcessor:
         
         assert processor.memory_monitor is None
     
-    @pytest.mark.asyncio
-    async def test_should_use_streaming_large_batch(self, mock_github_client, streaming_config, sample_requests):
+    def test_should_use_streaming_large_batch(self, mock_github_client, streaming_config, sample_requests):
         """Test streaming decision for large batches."""
         processor = StreamingBatchProcessor(mock_github_client, streaming_config)
         
         # Large batch (15 requests > 10 threshold)
-        should_stream = await processor.should_use_streaming(sample_requests)
+        should_stream = processor.should_use_streaming(sample_requests)
         assert should_stream is True
     
-    @pytest.mark.asyncio
-    async def test_should_use_streaming_small_batch(self, mock_github_client, streaming_config, sample_requests):
+    def test_should_use_streaming_small_batch(self, mock_github_client, streaming_config, sample_requests):
         """Test streaming decision for small batches."""
         processor = StreamingBatchProcessor(mock_github_client, streaming_config)
         
         # Small batch (5 requests < 10 threshold)
         small_batch = sample_requests[:5]
-        should_stream = await processor.should_use_streaming(small_batch)
+        should_stream = processor.should_use_streaming(small_batch)
         assert should_stream is False
     
-    @pytest.mark.asyncio
-    async def test_should_use_streaming_memory_pressure(self, mock_github_client, streaming_config, sample_requests):
+    def test_should_use_streaming_memory_pressure(self, mock_github_client, streaming_config, sample_requests):
         """Test streaming decision due to memory pressure."""
         processor = StreamingBatchProcessor(mock_github_client, streaming_config)
         
@@ -120,11 +117,10 @@ class TestStreamingBatchProcessor:
             
             # Small batch but with memory pressure
             small_batch = sample_requests[:5]
-            should_stream = await processor.should_use_streaming(small_batch)
+            should_stream = processor.should_use_streaming(small_batch)
             assert should_stream is True
     
-    @pytest.mark.asyncio
-    async def test_should_use_streaming_high_memory_estimate(self, mock_github_client, streaming_config):
+    def test_should_use_streaming_high_memory_estimate(self, mock_github_client, streaming_config):
         """Test streaming decision due to high estimated memory usage."""
         processor = StreamingBatchProcessor(mock_github_client, streaming_config)
         
@@ -138,7 +134,7 @@ class TestStreamingBatchProcessor:
             for i in range(3)  # 3 requests = ~150MB total
         ]
         
-        should_stream = await processor.should_use_streaming(large_requests)
+        should_stream = processor.should_use_streaming(large_requests)
         assert should_stream is True
     
     def test_create_chunks_normal(self, mock_github_client, streaming_config, sample_requests):
@@ -152,6 +148,39 @@ class TestStreamingBatchProcessor:
         assert len(chunks[1]) == 5
         assert len(chunks[2]) == 5
     
+    def test_create_chunks_are_views(self, mock_github_client, streaming_config, sample_requests):
+        """Test that chunks reference the request list instead of copying it."""
+        processor = StreamingBatchProcessor(mock_github_client, streaming_config)
+        
+        chunks = processor.create_chunks(sample_requests[:12])  # chunk_size=5 -> 5, 5, 2
+        
+        assert all(isinstance(chunk, RequestChunk) for chunk in chunks)
+        assert [len(chunk) for chunk in chunks] == [5, 5, 2]
+        assert list(chunks[1]) == sample_requests[5:10]
+        assert chunks[1][0] is sample_requests[5]
+        assert chunks[2][-1] is sample_requests[11]
+        assert chunks[0][1:3] == sample_requests[1:3]
+        with pytest.raises(IndexError):
+            chunks[2][2]
+    
+    def test_request_chunk_iteration_starts_at_chunk(self):
+        """Test that iterating a chunk only touches its own slice of a large list."""
+        accessed = []
+        
+        class RecordingList(list):
+            def __getitem__(self, index):
+                accessed.append(index)
+                return super().__getitem__(index)
+            
+            def __iter__(self):
+                raise AssertionError("chunk iteration must not walk the whole list")
+        
+        requests = RecordingList(range(100_000))
+        chunk = RequestChunk(requests, 99_990, 100_000)
+        
+        assert list(chunk) == list(range(99_990, 100_000))
+        assert accessed == list(range(99_990, 100_000))
+    
     def test_create_chunks_memory_pressure(self, mock_github_client, streaming_config, sample_requests):
         """Test chunk creation with memory pressure."""
         processor = StreamingBatchProcessor(mock_github_client, streaming_config)
@@ -293,6 +322,123 @@ class TestStreamingBatchProcessor:
         assert len(results) == 15
         assert all(result.error is None for result in results)
     
+    @pytest.mark.asyncio
+    async def test_iter_chunks_yields_lazily(self, mock_github_client, streaming_config, sample_requests):
+        """Test that chunks are sliced on demand and re-check memory pressure."""
+        processor = StreamingBatchProcessor(mock_github_client, streaming_config)
+        
+        with patch.object(processor.memory_monitor, 'should_reduce_batch_size', return_value=False):
+            chunks = [chunk async for chunk in processor.iter_chunks(sample_requests)]
+        
+        assert [len(chunk) for chunk in chunks] == [5, 5, 5]
+        assert [req for chunk in chunks for req in chunk] == sample_requests
+        
+        with patch.object(processor.memory_monitor, 'should_reduce_batch_size', side_effect=[False, True, True, True, True]), \
+             patch.object(processor.memory_monitor, 'calculate_adjusted_batch_size', return_value=3):
+            chunks = [chunk async for chunk in processor.iter_chunks(sample_requests)]
+        
+        assert [len(chunk) for chunk in chunks] == [5, 3, 3, 3, 1]
+    
+    @pytest.mark.asyncio
+    async def test_process_batch_streaming_bounds_pending_chunks(self, mock_github_client, streaming_config, sample_requests):
+        """Test that only a bounded number of chunks are pulled ahead of processing."""
+        processor = StreamingBatchProcessor(mock_github_client, streaming_config)
+        mock_github_client.get_file_content_async.return_value = APIResponse(
+            data=FileContent(content="test content", sha="abc123", size=12)
+        )
+        
+        requests = sample_requests * 4  # 60 requests -> 12 chunks of 5
+        pulled = 0
+        original_iter_chunks = processor.iter_chunks
+        
+        async def counting_iter_chunks(reqs):
+            nonlocal pulled
+            async for chunk in original_iter_chunks(reqs):
+                pulled += 1
+                yield chunk
+        
+        with patch.object(processor.memory_monitor, 'should_reduce_batch_size', return_value=False), \
+             patch.object(processor, 'iter_chunks', side_effect=counting_iter_chunks):
+            stream = processor.process_batch_streaming(requests)
+            first = await stream.__anext__()
+            assert first.error is None
+            assert pulled <= streaming_config.max_concurrent_chunks * 2
+            
+            results = [first] + [result async for result in stream]
+        
+        assert len(results) == 60
+        assert pulled == 12
+    
+    @pytest.mark.asyncio
+    async def test_chunk_request_stream_groups_by_count_and_size(self, mock_github_client, streaming_config, sample_repository):
+        """Test that a request generator is chunked by count or estimated bytes."""
+        processor = StreamingBatchProcessor(mock_github_client, streaming_config)
+        generated = 0
+        
+        def request_stream():
+            nonlocal generated
+            for i in range(7):
+                generated += 1
+                # The third request alone fills the 50MB chunk budget
+                size = 50 * 1024 * 1024 if i == 2 else 1024
+                yield BatchRequest(sample_repository, f"file_{i}.txt", 1, size)
+        
+        with patch.object(processor.memory_monitor, 'should_reduce_batch_size', return_value=False):
+            stream = processor.chunk_request_stream(request_stream())
+            first = await stream.__anext__()
+            assert generated == 3  # Nothing beyond the first chunk was generated
+            chunks = [first] + [chunk async for chunk in stream]
+        
+        assert [len(chunk) for chunk in chunks] == [3, 4]
+        assert [req.file_path for req in chunks[1]] == ["file_3.txt", "file_4.txt", "file_5.txt", "file_6.txt"]
+    
+    @pytest.mark.asyncio
+    async def test_process_request_stream_accepts_async_iterables(self, mock_github_client, streaming_config, sample_requests):
+        """Test processing requests from an async generator."""
+        processor = StreamingBatchProcessor(mock_github_client, streaming_config)
+        mock_github_client.get_file_content_async.return_value = APIResponse(
+            data=FileContent(content="test content", sha="abc123", size=12)
+        )
+        
+        async def request_stream():
+            for request in sample_requests:
+                yield request
+        
+        results = [result async for result in processor.process_request_stream(request_stream())]
+        
+        assert len(results) == 15
+        assert all(result.error is None for result in results)
+    
+    @pytest.mark.asyncio
+    async def test_process_request_stream_early_exit_awaits_cancelled_chunks(self, mock_github_client, streaming_config, sample_requests):
+        """Test that closing the stream early waits for in-flight chunks to cancel."""
+        processor = StreamingBatchProcessor(mock_github_client, streaming_config)
+        started = 0
+        cancelled = 0
+        never_set = asyncio.Event()
+        
+        async def fetch(repo, path):
+            nonlocal started, cancelled
+            started += 1
+            if path != "file_1.txt":
+                try:
+                    await never_set.wait()
+                except asyncio.CancelledError:
+                    cancelled += 1
+                    raise
+            return APIResponse(data=FileContent(content="test content", sha="abc123", size=12))
+        
+        mock_github_client.get_file_content_async.side_effect = fetch
+        
+        stream = processor.process_request_stream(iter(sample_requests))
+        async for result in stream:
+            assert result.request.file_path == "file_1.txt"
+            break
+        await stream.aclose()
+        
+        assert started > 1
+        assert cancelled == started - 1
+    
     @pytest.mark.asyncio
     async def test_process_batch_streaming_collect(self, mock_github_client, streaming_config, sample_requests):
         """Test streaming processing with result collection."""
@@ -310,12 +456,11 @@ class TestStreamingBatchProcessor:
         assert all(result.error is None for result in results)
         assert all(result.content is not None for result in results)
     
-    @pytest.mark.asyncio
-    async def test_estimate_memory_usage(self, mock_github_client, streaming_config, sample_requests):
+    def test_estimate_memory_usage(self, mock_github_client, streaming_config, sample_requests):
         """Test memory usage estimation."""
         processor = StreamingBatchProcessor(mock_github_client, streaming_config)
         
-        estimated_mb = await processor.estimate_memory_usage(sample_requests[:5])
+        estimated_mb = processor.estimate_memory_usage(sample_requests[:5])
         
         # Should be > 0 and reasonable
         assert estimated_mb > 0